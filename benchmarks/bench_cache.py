@@ -0,0 +1,85 @@
+"""
+Microbenchmark for AsyncCache hit throughput.
+
+Compares the lock-free read path with the previous behaviour, where every
+read took the cache-wide asyncio.Lock, under concurrent readers and a
+background writer on one event loop.
+
+Usage:
+    python -m benchmarks.bench_cache [--readers 200] [--reads 2000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.utils.cache import AsyncCache
+
+
+class LockedReadCache(AsyncCache):
+    """AsyncCache variant reproducing the previous locked read path."""
+
+    async def get(self, key):
+        async with self._lock:
+            return await super().get(key)
+
+
+async def _run(cache: AsyncCache, readers: int, reads: int, keys: int) -> float:
+    """
+    Measure hits per second with concurrent readers and one writer.
+
+    Args:
+        cache: Cache under test
+        readers: Number of concurrent reader tasks
+        reads: Number of reads per reader
+        keys: Number of distinct keys
+
+    Returns:
+        Cache hits per second
+    """
+    for i in range(keys):
+        await cache.set(f"key{i}", i)
+
+    stop = asyncio.Event()
+
+    async def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            await cache.set(f"key{i % keys}", i)
+            i += 1
+            await asyncio.sleep(0)
+
+    async def reader(offset: int) -> None:
+        for i in range(reads):
+            await cache.get(f"key{(offset + i) % keys}")
+            if i % 64 == 0:
+                # Yield regularly so readers and the writer interleave
+                await asyncio.sleep(0)
+
+    writer_task = asyncio.create_task(writer())
+    start = time.perf_counter()
+    await asyncio.gather(*(reader(r) for r in range(readers)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await writer_task
+    return readers * reads / elapsed
+
+
+async def main() -> None:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, default=200)
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--keys", type=int, default=100)
+    args = parser.parse_args()
+
+    locked = await _run(LockedReadCache(ttl_seconds=600), args.readers, args.reads, args.keys)
+    lock_free = await _run(AsyncCache(ttl_seconds=600), args.readers, args.reads, args.keys)
+
+    print(f"locked reads:    {locked:>12,.0f} hits/s")
+    print(f"lock-free reads: {lock_free:>12,.0f} hits/s")
+    print(f"speedup:         {lock_free / locked:>12.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
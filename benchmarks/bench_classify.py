@@ -0,0 +1,65 @@
+"""
+Throughput benchmark for batch news classification (tags + relevance).
+
+Compares calling extract_tags and is_relevant_news per item with
+classify_news_batch, serially and spread over a process pool, and checks
+that every path returns identical results.
+
+Usage:
+    python -m benchmarks.bench_classify [--size 50000] [--workers 4]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.bench_tagging import synthetic_corpus
+from src.utils.filtering import NewsClassification, classify_news_batch, is_relevant_news
+from src.utils.tagging import extract_tags
+
+
+def per_item(corpus: list[tuple[str, str]]) -> list[NewsClassification]:
+    """Classify with the separate per-item functions."""
+    results = []
+    for title, url in corpus:
+        tags = extract_tags(title, url)
+        results.append(NewsClassification(tags, is_relevant_news(title, url, tags)))
+    return results
+
+
+def _report(name: str, seconds: float, size: int) -> None:
+    """Print throughput of one run."""
+    print(f"{name:<24} {seconds:>7.3f} s  {size / seconds:>10,.0f} items/s")
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.size)
+
+    start = time.perf_counter()
+    expected = per_item(corpus)
+    _report("per-item", time.perf_counter() - start, len(corpus))
+
+    start = time.perf_counter()
+    serial = classify_news_batch(corpus)
+    _report("batch", time.perf_counter() - start, len(corpus))
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        # Warm the pool so process start-up is not measured
+        classify_news_batch(corpus[: args.workers], executor=executor, chunk_size=1)
+        start = time.perf_counter()
+        parallel = classify_news_batch(corpus, executor=executor, chunk_size=args.chunk_size)
+        _report(f"batch, {args.workers} processes", time.perf_counter() - start, len(corpus))
+
+    print(f"identical results: {serial == expected and parallel == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark for cross-source deduplication.
+
+Builds Hacker News items from the synthetic tagging corpus and adds an RSS
+copy of every fifth one, under a URL with tracking parameters and a
+``www.`` host, and every tenth one also under a slightly reworded title
+and another URL. Times deduplication at increasing sizes, so its growth can
+be compared with the number of items, and checks how many planted copies
+were merged ("extra" counts other items merged because the synthetic
+titles, drawn from a few dozen words, happened to be near-duplicates).
+The first run of each size is cold; the following ones see the same items
+again, as a refresh does, and hit the URL and title caches.
+
+Usage:
+    python -m benchmarks.bench_dedup [--sizes 500,5000,50000] [--repeat 5]
+"""
+
+import argparse
+import time
+from urllib.parse import urlsplit
+
+from benchmarks.bench_search import synthetic_items
+from src.modules.news.dedup import Deduplicator, _title_bands, canonical_url
+from src.modules.news.models import NewsItem
+
+
+def with_copies(items: list[NewsItem]) -> tuple[list[NewsItem], int]:
+    """
+    Add RSS copies of some items, as other feeds would publish them.
+
+    Args:
+        items: Hacker News items
+
+    Returns:
+        Tuple of (items and copies, newest first, number of copies)
+    """
+    copies = []
+    for i, item in enumerate(items):
+        if i % 5:
+            continue
+        url = urlsplit(str(item.url))
+        if i % 10:
+            copy_url = f"https://www.{url.hostname}{url.path}?utm_source=rss&utm_medium=feed"
+            title = item.title
+        else:
+            copy_url = f"https://feeds.example.net/story/{i}"
+            title = f"{item.title} (updated)"
+        copies.append(
+            item.model_copy(
+                update={"id": f"rss_{i}", "source": "rss", "url": copy_url, "title": title}
+            )
+        )
+    # Newest first, the order of the pool and of the store
+    merged = sorted(items + copies, key=lambda item: item.published_at, reverse=True)
+    return merged, len(copies)
+
+
+def main() -> None:
+    """Run the benchmark and print the deduplication time per size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="500,5000,50000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'items':>8} {'cold ms':>9} {'us/item':>8} {'warm ms':>9} {'us/item':>8}"
+        f" {'copies':>7} {'merged':>7} {'extra':>6}"
+    )
+    for size in map(int, args.sizes.split(",")):
+        items, copies = with_copies(synthetic_items(size))
+        # Cold: every URL and title is new; warm: the same items come back
+        canonical_url.cache_clear()
+        _title_bands.cache_clear()
+        start = time.perf_counter()
+        result = Deduplicator().deduplicate(items)
+        cold = time.perf_counter() - start
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            Deduplicator().deduplicate(items)
+            timings.append(time.perf_counter() - start)
+        warm = min(timings)
+        planted = sum(item_id.startswith("rss_") for item_id in result.dropped)
+        print(
+            f"{len(items):>8} {cold * 1000:>9.1f} {cold / len(items) * 1e6:>8.1f}"
+            f" {warm * 1000:>9.1f} {warm / len(items) * 1e6:>8.1f}"
+            f" {copies:>7} {planted:>7} {len(result.dropped) - planted:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
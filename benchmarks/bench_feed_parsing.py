@@ -0,0 +1,109 @@
+"""
+Event loop lag while parsing a large RSS feed.
+
+Parses a synthetic feed on the event loop (the previous behaviour), in a
+thread pool and in a process pool, while a LoopLagMonitor measures how
+long the loop is blocked. Lag is what every concurrent request (e.g.
+/health or a cached /news) waits on top of its own latency.
+
+Usage:
+    python -m benchmarks.bench_feed_parsing [--entries 3000] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import Executor
+
+from src.integrations.rss import _parse_feed, create_feed_parser_pool
+from src.utils.loop_monitor import LoopLagMonitor
+
+
+def synthetic_feed(entries: int) -> bytes:
+    """
+    Build an RSS document with the given number of entries.
+
+    Args:
+        entries: Number of <item> elements
+
+    Returns:
+        Encoded RSS document
+    """
+    items = "".join(
+        f"<item><title>Story {i} about machine learning &amp; GPUs</title>"
+        f"<link>https://example.com/{i}</link>"
+        f"<description>{'Lorem ipsum dolor sit amet. ' * 20}</description>"
+        f"<pubDate>Mon, 01 Jan 2024 12:{i % 60:02d}:00 GMT</pubDate></item>"
+        for i in range(entries)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Benchmark</title>{items}</channel></rss>"
+    ).encode()
+
+
+async def _measure(content: bytes, rounds: int, executor: Executor | None, inline: bool) -> dict:
+    """
+    Parse the feed several times while measuring loop lag.
+
+    Args:
+        content: Feed bytes
+        rounds: Number of parses
+        executor: Pool to parse in (ignored when inline)
+        inline: Parse directly on the event loop
+
+    Returns:
+        Lag statistics and total wall time
+    """
+    monitor = LoopLagMonitor(interval_seconds=0.005, window=100_000)
+    monitor.start()
+    await asyncio.sleep(0.05)
+
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if inline:
+            _parse_feed(content, 50)
+        else:
+            await loop.run_in_executor(executor, _parse_feed, content, 50)
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+    return {**monitor.stats(), "seconds": elapsed}
+
+
+async def _main(entries: int, rounds: int) -> None:
+    """Run every mode and print a comparison."""
+    content = synthetic_feed(entries)
+    print(f"feed: {entries} entries, {len(content) / 1e6:.1f} MB, {rounds} parses")
+
+    results = {"event loop": await _measure(content, rounds, None, inline=True)}
+    for kind in ("thread", "process"):
+        executor = create_feed_parser_pool(kind=kind, max_workers=2)
+        try:
+            # Warm the pool so worker start-up is not measured
+            await asyncio.get_running_loop().run_in_executor(executor, _parse_feed, b"", 1)
+            results[f"{kind} pool"] = await _measure(content, rounds, executor, inline=False)
+        finally:
+            executor.shutdown()
+
+    for name, stats in results.items():
+        print(
+            f"{name:<12} parse {stats['seconds']:>6.2f} s  "
+            f"max lag {stats['max_ms']:>8.1f} ms  mean lag {stats['mean_ms']:>6.1f} ms"
+        )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(_main(args.entries, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Latency benchmark for BM25 search over a large index of news items.
+
+Indexes a synthetic corpus, then times queries made of rare, common and
+mixed terms. The synthetic titles reuse a few dozen filler words, so common
+terms appear in a large share of the items, which is the worst case for an
+inverted index. Each query is also run on an index without a candidate
+budget, and the table shows how many of its top results the budgeted
+search returned. The benchmark fails if a ranking that fits in the budget
+differs from the reference, or if a query returns fewer than
+``--min-recall`` of the reference top results, so a latency gain is never
+reported without the ranking quality it costs.
+
+Usage:
+    python -m benchmarks.bench_search [--size 100000] [--repeat 50] [--max-candidates 1000]
+        [--min-recall 0.5]
+"""
+
+import argparse
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+
+from benchmarks.bench_tagging import synthetic_corpus
+from src.modules.news.models import NewsItem
+from src.modules.news.search import SearchIndex
+from src.utils.tagging import extract_tags
+
+QUERIES = {
+    "rare": "langchain",
+    "phrase": "quantum computer",
+    "common": "open source",
+    "mixed": "rust database security",
+    "long": "how we built a faster startup database in rust",
+}
+
+
+def synthetic_items(size: int) -> list[NewsItem]:
+    """
+    Build news items from the synthetic tagging corpus, one per minute.
+
+    Args:
+        size: Number of items
+
+    Returns:
+        Items published over the last ``size`` minutes, oldest first
+    """
+    start = datetime.now(UTC) - timedelta(minutes=size)
+    return [
+        NewsItem(
+            id=f"hn_{i}",
+            title=title,
+            url=url,
+            source="hackernews",
+            published_at=start + timedelta(minutes=i),
+            tags=extract_tags(title, url),
+        )
+        for i, (title, url) in enumerate(synthetic_corpus(size))
+    ]
+
+
+def _percentile(timings: list[float], fraction: float) -> float:
+    """Percentile of sorted timings."""
+    return timings[min(len(timings) - 1, int(len(timings) * fraction))]
+
+
+def main() -> None:
+    """Run the benchmark and print latency percentiles per query."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--max-candidates", type=int, default=1000)
+    parser.add_argument("--min-recall", type=float, default=0.5)
+    args = parser.parse_args()
+
+    items = synthetic_items(args.size)
+    index = SearchIndex(max_documents=None, max_candidates=args.max_candidates)
+    start = time.perf_counter()
+    index.add(items)
+    elapsed = time.perf_counter() - start
+    print(f"indexed {len(index):,} items in {elapsed:.2f} s ({index.stats()['terms']:,} terms)")
+
+    start = time.perf_counter()
+    index.add(items[-500:])
+    print(f"re-added 500 unchanged items in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    # Same items without a candidate budget, as the reference ranking. They
+    # are added newest first, as restore() reads them from the item store
+    reference = SearchIndex(max_documents=None, max_candidates=None)
+    start = time.perf_counter()
+    reference.add(items[::-1])
+    elapsed = time.perf_counter() - start
+    print(f"indexed {len(reference):,} items newest first in {elapsed:.2f} s")
+
+    # Plus the title of one of the oldest items, as pasted by a reader
+    queries = {**QUERIES, "headline": items[len(items) // 10].title}
+    now = time.time()
+    identical = True
+    min_recall = 1.0
+    print(
+        f"{'query':<8} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'exhaustive':>11} "
+        f"{'same top':>9} {'unbudgeted p50 ms':>18}"
+    )
+    for name, query in queries.items():
+        timings = []
+        reference_timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = index.search(query, args.limit, now=now)
+            timings.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            expected = reference.search(query, args.limit, now=now)
+            reference_timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        reference_timings.sort()
+
+        found = {hit.item.id for hit in results.hits}
+        overlap = sum(hit.item.id in found for hit in expected.hits)
+        if expected.hits:
+            min_recall = min(min_recall, overlap / len(expected.hits))
+        if results.exhaustive:
+            identical &= [hit.item.id for hit in results.hits] == [
+                hit.item.id for hit in expected.hits
+            ]
+        print(
+            f"{name:<8} {_percentile(timings, 0.5):>8.2f} {_percentile(timings, 0.95):>8.2f}"
+            f" {timings[-1]:>8.2f} {str(results.exhaustive):>11}"
+            f" {overlap:>4}/{len(expected.hits):<4} {_percentile(reference_timings, 0.5):>18.2f}"
+        )
+
+    print(f"exhaustive rankings identical to the reference: {identical}")
+    print(f"lowest share of the reference top {args.limit} returned: {min_recall:.2f}")
+    if not identical or min_recall < args.min_recall:
+        sys.exit(f"ranking quality below target (min recall {args.min_recall:.2f})")
+
+
+if __name__ == "__main__":
+    main()
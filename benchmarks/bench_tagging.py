@@ -0,0 +1,155 @@
+"""
+Benchmark for tag extraction over a corpus of news titles.
+
+Compares the single-pass matcher compiled from the topic taxonomy with the
+previous implementation, which ran one regex search per keyword, and
+checks that both return identical tags for every title.
+
+Usage:
+    python -m benchmarks.bench_tagging                    # synthetic corpus
+    python -m benchmarks.bench_tagging --corpus titles.tsv  # "title<TAB>url" per line
+    python -m benchmarks.bench_tagging --fetch            # live HN + RSS titles
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import time
+
+from src.utils.tagging import extract_tags
+from src.utils.taxonomy import get_taxonomy
+
+_FILLER = (
+    "how we built a new open source tool for faster startup teams shipping "
+    "release notes launch review show ask why the state of year in web rust "
+    "go database security privacy chip market report funding raises series"
+).split()
+
+
+def legacy_extract_tags(title: str, url: str) -> list[str]:
+    """Previous implementation: one regex search per tag or synonym."""
+    taxonomy = get_taxonomy()
+    text = f"{title} {url}".lower()
+    found_tags: set[str] = set()
+    for phrase, tag in taxonomy.phrase_tags.items():
+        pattern = r"\b" + re.escape(phrase) + r"\b"
+        if re.search(pattern, text):
+            found_tags.add(tag)
+    return [tag for tag in taxonomy.tags if tag in found_tags]
+
+
+def synthetic_corpus(size: int, seed: int = 42) -> list[tuple[str, str]]:
+    """
+    Generate headline-like titles mixing keywords and filler words.
+
+    Args:
+        size: Number of (title, url) pairs
+        seed: Random seed for reproducibility
+
+    Returns:
+        List of (title, url) pairs
+    """
+    rng = random.Random(seed)
+    phrases = list(get_taxonomy().phrase_tags)
+    corpus = []
+    for i in range(size):
+        words = rng.sample(_FILLER, rng.randint(4, 10))
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(phrases))
+        title = " ".join(words).capitalize()
+        url = f"https://example.com/{i}/{'-'.join(words[:5])}"
+        corpus.append((title, url))
+    return corpus
+
+
+def load_corpus(path: str) -> list[tuple[str, str]]:
+    """
+    Load "title<TAB>url" lines (url optional) from a file.
+
+    Args:
+        path: Corpus file path
+
+    Returns:
+        List of (title, url) pairs
+    """
+    corpus = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            title, _, url = line.rstrip("\n").partition("\t")
+            if title:
+                corpus.append((title, url))
+    return corpus
+
+
+async def fetch_corpus() -> list[tuple[str, str]]:
+    """
+    Fetch current titles from Hacker News and the default RSS feeds.
+
+    Returns:
+        List of (title, url) pairs
+    """
+    from src.integrations.hackernews import fetch_hackernews_news
+    from src.integrations.http import create_http_client
+    from src.integrations.rss import fetch_rss_news
+
+    feeds = [
+        "https://techcrunch.com/feed/",
+        "https://www.theverge.com/rss/index.xml",
+        "https://feeds.feedburner.com/oreilly/radar",
+        "https://www.wired.com/feed/rss",
+        "https://www.technologyreview.com/feed/",
+    ]
+    async with create_http_client() as client:
+        results = await asyncio.gather(
+            fetch_hackernews_news(client, 500),
+            *(fetch_rss_news(client, feed, 100) for feed in feeds),
+        )
+    corpus = [(story.get("title", ""), story.get("url", "")) for story in results[0]]
+    for entries in results[1:]:
+        corpus.extend((entry["title"], entry["url"]) for entry in entries)
+    return corpus
+
+
+def _time(func, corpus: list[tuple[str, str]], repeat: int) -> float:
+    """Best wall time in seconds of tagging the whole corpus."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for title, url in corpus:
+            func(title, url)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", help="file of title<TAB>url lines")
+    parser.add_argument("--fetch", action="store_true", help="fetch live titles")
+    parser.add_argument("--size", type=int, default=5000, help="synthetic corpus size")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = load_corpus(args.corpus)
+    elif args.fetch:
+        corpus = asyncio.run(fetch_corpus())
+    else:
+        corpus = synthetic_corpus(args.size)
+
+    mismatches = sum(
+        legacy_extract_tags(title, url) != extract_tags(title, url) for title, url in corpus
+    )
+
+    legacy = _time(legacy_extract_tags, corpus, args.repeat)
+    compiled = _time(extract_tags, corpus, args.repeat)
+
+    print(f"corpus:      {len(corpus)} titles, {mismatches} mismatches")
+    print(f"per-keyword: {legacy * 1e6 / len(corpus):>8.1f} us/title")
+    print(f"single-pass: {compiled * 1e6 / len(corpus):>8.1f} us/title")
+    print(f"speedup:     {legacy / compiled:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
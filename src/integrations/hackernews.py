@@ -1,9 +1,12 @@
 """Hacker News API integration."""
 
 import asyncio
+import time
 
 import httpx
 
+from src.integrations.latency import HEDGE_EXTENSION
+from src.integrations.scheduler import PRIORITY_EXTENSION
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -11,64 +14,233 @@ logger = get_logger(__name__)
 HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
 
 
-async def fetch_top_story_ids(limit: int = 50) -> list[int]:
+class HackerNewsItemCache:
+    """
+    Story details cached by story ID across refreshes.
+
+    Most of the top list is unchanged from one refresh to the next, so only
+    stories that are new (or whose details are older than ``ttl_seconds``)
+    are fetched in full. Scores and titles of the remaining stories are
+    refreshed at a lower rate: once cached details are older than
+    ``refresh_after_seconds``, at most ``max_refreshes`` of the oldest are
+    re-fetched per refresh. Stories that leave the top list are dropped, so
+    the cache never holds more than one top list worth of stories.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 900.0,
+        refresh_after_seconds: float = 300.0,
+        max_refreshes: int = 10,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Age after which cached details are always re-fetched
+            refresh_after_seconds: Age after which cached details may be
+                re-fetched to update the score
+            max_refreshes: Maximum number of score refreshes per fetch
+        """
+        self._ttl_seconds = ttl_seconds
+        self._refresh_after_seconds = refresh_after_seconds
+        self._max_refreshes = max_refreshes
+        # story ID -> (details, fetched_at)
+        self._items: dict[int, tuple[dict, float]] = {}
+        self._hits = 0
+        self._fetches = 0
+        self._refreshes = 0
+
+    def plan(self, story_ids: list[int], now: float | None = None) -> tuple[list[int], list[int]]:
+        """
+        Split story IDs into those to fetch in full and those to refresh.
+
+        Args:
+            story_ids: Current top story IDs
+            now: Reference timestamp (defaults to the current time)
+
+        Returns:
+            Tuple of (IDs missing or expired, IDs whose score should be refreshed)
+        """
+        current_time = time.time() if now is None else now
+        missing = []
+        refreshable = []
+        for story_id in story_ids:
+            cached = self._items.get(story_id)
+            if cached is None or current_time - cached[1] >= self._ttl_seconds:
+                missing.append(story_id)
+            elif current_time - cached[1] >= self._refresh_after_seconds:
+                refreshable.append(story_id)
+
+        # Oldest details first
+        refreshable.sort(key=lambda story_id: self._items[story_id][1])
+        return missing, refreshable[: self._max_refreshes]
+
+    def get(self, story_id: int) -> dict | None:
+        """
+        Get cached story details regardless of age.
+
+        Args:
+            story_id: Hacker News story ID
+
+        Returns:
+            Story details or None if not cached
+        """
+        cached = self._items.get(story_id)
+        return cached[0] if cached is not None else None
+
+    def store(self, story_id: int, details: dict, refreshed: bool = False) -> None:
+        """
+        Store freshly fetched story details.
+
+        Args:
+            story_id: Hacker News story ID
+            details: Story details
+            refreshed: Whether this was a score refresh of a cached story
+        """
+        self._items[story_id] = (details, time.time())
+        if refreshed:
+            self._refreshes += 1
+        else:
+            self._fetches += 1
+
+    def retain(self, story_ids: list[int]) -> None:
+        """
+        Drop stories that are no longer in the top list.
+
+        Args:
+            story_ids: Current top story IDs
+        """
+        keep = set(story_ids)
+        for story_id in [story_id for story_id in self._items if story_id not in keep]:
+            del self._items[story_id]
+
+    def record_hits(self, count: int) -> None:
+        """
+        Count stories served from the cache without a request.
+
+        Args:
+            count: Number of stories
+        """
+        self._hits += count
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get item cache counters.
+
+        Returns:
+            Dictionary with cached stories, hits, full fetches and score refreshes
+        """
+        return {
+            "items": len(self._items),
+            "hits": self._hits,
+            "fetches": self._fetches,
+            "refreshes": self._refreshes,
+        }
+
+
+async def fetch_top_story_ids(client: httpx.AsyncClient, limit: int = 50) -> list[int]:
     """
     Fetch top story IDs from Hacker News.
 
     Args:
+        client: Shared HTTP client
         limit: Maximum number of story IDs to return
 
     Returns:
         List of story IDs
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"{HN_API_BASE}/topstories.json")
-            response.raise_for_status()
-            all_ids = response.json()
-            return all_ids[:limit]
+        response = await client.get(
+            f"{HN_API_BASE}/topstories.json", extensions={HEDGE_EXTENSION: True}
+        )
+        response.raise_for_status()
+        all_ids = response.json()
+        return all_ids[:limit]
     except Exception as e:
         logger.error(f"Failed to fetch Hacker News top stories: {e}")
         return []
 
 
-async def fetch_story_details(story_id: int) -> dict | None:
+async def fetch_story_details(
+    client: httpx.AsyncClient, story_id: int, priority: int = 0
+) -> dict | None:
     """
     Fetch detailed information for a Hacker News story.
 
     Args:
+        client: Shared HTTP client
         story_id: Hacker News story ID
+        priority: Scheduling priority when the client uses a FetchScheduler
+            (lower runs first)
 
     Returns:
         Story details dictionary or None if fetch fails
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"{HN_API_BASE}/item/{story_id}.json")
-            response.raise_for_status()
-            return response.json()
+        response = await client.get(
+            f"{HN_API_BASE}/item/{story_id}.json",
+            extensions={PRIORITY_EXTENSION: priority, HEDGE_EXTENSION: True},
+        )
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logger.warning(f"Failed to fetch Hacker News story {story_id}: {e}")
         return None
 
 
-async def fetch_hackernews_news(limit: int = 50) -> list[dict]:
+async def fetch_hackernews_news(
+    client: httpx.AsyncClient,
+    limit: int = 50,
+    item_cache: HackerNewsItemCache | None = None,
+) -> list[dict]:
     """
     Fetch latest news from Hacker News.
 
+    With an item cache, only stories that are new to the top list (or
+    whose cached details expired) are fetched in full, plus a bounded
+    number of score refreshes; the rest is served from the cache.
+
     Args:
+        client: Shared HTTP client
         limit: Maximum number of stories to fetch
+        item_cache: Story details cache shared across calls (None fetches
+            every story)
 
     Returns:
         List of story dictionaries
     """
-    story_ids = await fetch_top_story_ids(limit)
+    story_ids = await fetch_top_story_ids(client, limit)
     if not story_ids:
         return []
 
-    # Fetch story details concurrently
-    tasks = [fetch_story_details(story_id) for story_id in story_ids]
-    stories = await asyncio.gather(*tasks)
+    if item_cache is None:
+        to_fetch, to_refresh = story_ids, []
+    else:
+        to_fetch, to_refresh = item_cache.plan(story_ids)
+
+    # Fetch story details concurrently, top-ranked stories first; score
+    # refreshes go after every new story
+    rank = {story_id: index for index, story_id in enumerate(story_ids)}
+    tasks = [
+        fetch_story_details(client, story_id, priority=rank[story_id]) for story_id in to_fetch
+    ] + [
+        fetch_story_details(client, story_id, priority=len(story_ids) + rank[story_id])
+        for story_id in to_refresh
+    ]
+    fetched = dict(zip((*to_fetch, *to_refresh), await asyncio.gather(*tasks), strict=True))
+
+    if item_cache is None:
+        stories = [fetched[story_id] for story_id in story_ids]
+    else:
+        refreshed = set(to_refresh)
+        for story_id, details in fetched.items():
+            if details is not None:
+                item_cache.store(story_id, details, refreshed=story_id in refreshed)
+        item_cache.record_hits(len(story_ids) - len(fetched))
+        # A failed request falls back to the cached details, even if expired
+        stories = [fetched.get(story_id) or item_cache.get(story_id) for story_id in story_ids]
+        item_cache.retain(story_ids)
 
     # Filter out None values and stories without URLs (Ask HN, etc.)
     valid_stories = [
@@ -0,0 +1,56 @@
+"""Shared HTTP client for integrations."""
+
+import httpx
+
+from src.integrations.latency import AdaptiveTimeoutTransport, HostLatencyTracker
+from src.integrations.scheduler import FetchScheduler, ScheduledTransport
+
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+
+def create_http_client(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    http2: bool = True,
+    scheduler: FetchScheduler | None = None,
+    latency_tracker: HostLatencyTracker | None = None,
+) -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client shared by all integrations.
+
+    A single long-lived client keeps connections alive between requests,
+    so repeated calls to the same upstream reuse an existing TCP/TLS
+    connection (or HTTP/2 stream) instead of performing a new handshake.
+
+    Args:
+        max_connections: Maximum number of concurrent connections in the pool
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept before closing
+        timeout: Default request timeout in seconds
+        http2: Whether to negotiate HTTP/2 with upstreams that support it
+        scheduler: Optional scheduler every request waits on for a slot
+            (global and per-host concurrency caps, rate limits, priorities)
+        latency_tracker: Optional per-host latency tracker deriving adaptive
+            timeouts (``timeout`` stays the upper bound) and hedge delays.
+            With a scheduler, each attempt of a hedged request gets its own
+            slot, and queueing time is not counted as upstream latency.
+
+    Returns:
+        Configured httpx.AsyncClient (the caller owns it and must close it)
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+    if latency_tracker is not None:
+        transport = AdaptiveTimeoutTransport(transport, latency_tracker, scheduler)
+    elif scheduler is not None:
+        transport = ScheduledTransport(transport, scheduler)
+    return httpx.AsyncClient(
+        timeout=timeout,
+        transport=transport,
+    )
@@ -0,0 +1,442 @@
+"""Per-host latency tracking, adaptive timeouts and hedged requests."""
+
+import asyncio
+import bisect
+import math
+import time
+
+import httpx
+
+from src.integrations.scheduler import PRIORITY_EXTENSION, FetchScheduler, release_on_close
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Request extension marking a request as idempotent and safe to hedge
+HEDGE_EXTENSION = "hedge"
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with exponential forgetting.
+
+    Bucket bounds grow geometrically, so quantiles have a constant relative
+    error (``growth`` - 1) from one millisecond to minutes. Once
+    ``max_samples`` samples are held, every count is halved so the
+    histogram follows changes in upstream latency.
+    """
+
+    def __init__(
+        self,
+        min_seconds: float = 0.001,
+        max_seconds: float = 120.0,
+        growth: float = 1.2,
+        max_samples: int = 1000,
+    ) -> None:
+        """
+        Initialize an empty histogram.
+
+        Args:
+            min_seconds: Upper bound of the first bucket
+            max_seconds: Upper bound of the last bucket (longer samples land in it)
+            growth: Ratio between two consecutive bucket bounds
+            max_samples: Sample count at which counts are halved
+        """
+        bucket_count = math.ceil(math.log(max_seconds / min_seconds, growth)) + 1
+        self._bounds = [min_seconds * growth**i for i in range(bucket_count)]
+        self._counts = [0.0] * bucket_count
+        self._total = 0.0
+        self._max_samples = max_samples
+
+    @property
+    def count(self) -> float:
+        """Weighted number of samples currently held."""
+        return self._total
+
+    def record(self, seconds: float) -> None:
+        """
+        Add a latency sample.
+
+        Args:
+            seconds: Observed latency
+        """
+        if self._total >= self._max_samples:
+            self._counts = [count / 2 for count in self._counts]
+            self._total /= 2
+        index = min(bisect.bisect_left(self._bounds, seconds), len(self._bounds) - 1)
+        self._counts[index] += 1
+        self._total += 1
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Estimate a latency quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.99)
+
+        Returns:
+            Upper bound of the bucket holding the quantile, or None if empty
+        """
+        if not self._total:
+            return None
+        target = q * self._total
+        cumulative = 0.0
+        for bound, count in zip(self._bounds, self._counts, strict=True):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return self._bounds[-1]
+
+
+class _HostLatency:
+    """Latency histogram and counters of one upstream host."""
+
+    __slots__ = ("histogram", "requests", "errors", "timeouts", "hedged", "hedge_wins")
+
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+
+class HostLatencyTracker:
+    """
+    Tracks upstream latency per host and derives timeouts and hedge delays.
+
+    A host's timeout is its p99 latency times ``timeout_factor``, clamped
+    between ``min_timeout`` and ``max_timeout``; until ``min_samples``
+    requests have completed, ``max_timeout`` is used. Requests that time
+    out are recorded at the timeout, so a host that slows down raises its
+    own timeout instead of failing repeatedly.
+    """
+
+    def __init__(
+        self,
+        timeout_factor: float = 3.0,
+        min_timeout: float = 1.0,
+        max_timeout: float = 10.0,
+        min_samples: int = 20,
+        hedge_quantile: float = 0.95,
+        max_hedge_ratio: float = 0.1,
+    ) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            timeout_factor: Multiplier applied to the p99 latency
+            min_timeout: Lower bound of adaptive timeouts in seconds
+            max_timeout: Upper bound of adaptive timeouts, and timeout of hosts
+                without enough samples
+            min_samples: Samples needed before adapting timeouts and hedging
+            hedge_quantile: Latency quantile after which a hedged request is sent
+            max_hedge_ratio: Maximum share of a host's requests that may be
+                hedged (0 disables hedging)
+        """
+        self._timeout_factor = timeout_factor
+        self._min_timeout = min_timeout
+        self._max_timeout = max_timeout
+        self._min_samples = min_samples
+        self._hedge_quantile = hedge_quantile
+        self._max_hedge_ratio = max_hedge_ratio
+        self._hosts: dict[str, _HostLatency] = {}
+
+    def _host(self, host: str) -> _HostLatency:
+        """Get the state of a host, creating it on first use."""
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostLatency()
+        return state
+
+    def record(self, host: str, seconds: float) -> None:
+        """
+        Record a completed request.
+
+        Args:
+            host: Upstream host name
+            seconds: Time until the response headers were received
+        """
+        state = self._host(host)
+        state.requests += 1
+        state.histogram.record(seconds)
+
+    def record_timeout(self, host: str, seconds: float) -> None:
+        """
+        Record a request that timed out.
+
+        Args:
+            host: Upstream host name
+            seconds: Time waited before giving up
+        """
+        state = self._host(host)
+        state.requests += 1
+        state.timeouts += 1
+        state.histogram.record(seconds)
+
+    def record_error(self, host: str) -> None:
+        """
+        Record a request that failed without timing out.
+
+        Args:
+            host: Upstream host name
+        """
+        state = self._host(host)
+        state.requests += 1
+        state.errors += 1
+
+    def timeout_for(self, host: str) -> float:
+        """
+        Get the adaptive timeout of a host.
+
+        Args:
+            host: Upstream host name
+
+        Returns:
+            Timeout in seconds
+        """
+        state = self._hosts.get(host)
+        if state is None or state.histogram.count < self._min_samples:
+            return self._max_timeout
+        p99 = state.histogram.quantile(0.99)
+        return min(self._max_timeout, max(self._min_timeout, p99 * self._timeout_factor))
+
+    def hedge_delay(self, host: str) -> float | None:
+        """
+        Get how long to wait before hedging a request to a host.
+
+        Args:
+            host: Upstream host name
+
+        Returns:
+            Delay in seconds, or None if hedging is disabled or there are
+            not enough samples yet
+        """
+        if self._max_hedge_ratio <= 0:
+            return None
+        state = self._hosts.get(host)
+        if state is None or state.histogram.count < self._min_samples:
+            return None
+        return state.histogram.quantile(self._hedge_quantile)
+
+    def try_hedge(self, host: str) -> bool:
+        """
+        Reserve a hedged request within the host's hedge budget.
+
+        Args:
+            host: Upstream host name
+
+        Returns:
+            True if the hedged request may be sent
+        """
+        state = self._host(host)
+        if state.hedged + 1 > self._max_hedge_ratio * state.requests:
+            return False
+        state.hedged += 1
+        return True
+
+    def record_hedge_win(self, host: str) -> None:
+        """
+        Count a hedged request that answered before the original one.
+
+        Args:
+            host: Upstream host name
+        """
+        self._host(host).hedge_wins += 1
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Get latency statistics of every host.
+
+        Returns:
+            Mapping of host to request counters, latency quantiles in
+            milliseconds and current timeout in seconds
+        """
+        stats = {}
+        for host, state in sorted(self._hosts.items()):
+            quantiles = {
+                f"p{round(q * 100)}_ms": (
+                    round(value * 1000, 1) if (value := state.histogram.quantile(q)) else None
+                )
+                for q in (0.5, 0.95, 0.99)
+            }
+            stats[host] = {
+                "requests": state.requests,
+                "errors": state.errors,
+                "timeouts": state.timeouts,
+                "hedged": state.hedged,
+                "hedge_wins": state.hedge_wins,
+                **quantiles,
+                "timeout_seconds": round(self.timeout_for(host), 3),
+            }
+        return stats
+
+
+class AdaptiveTimeoutTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper applying per-host adaptive timeouts and hedging.
+
+    The connect and read timeouts of each request are lowered to the host's
+    adaptive timeout (the client's timeout stays the upper bound). Requests
+    carrying the ``hedge`` extension, e.g.
+    ``client.get(url, extensions={"hedge": True})``, get a second identical
+    request once the first has been outstanding for the host's hedge delay;
+    the first response wins and the other request is cancelled. Only mark
+    idempotent requests.
+
+    With a scheduler, every attempt (hedges included) waits for its own
+    slot, so hedges stay within the concurrency caps and rate limits, and
+    latency is measured from the moment the slot is granted. Use it instead
+    of wrapping this transport in a ScheduledTransport.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        tracker: HostLatencyTracker,
+        scheduler: FetchScheduler | None = None,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            transport: Transport performing the requests
+            tracker: Per-host latency tracker
+            scheduler: Optional scheduler granting a slot to each attempt
+        """
+        self._transport = transport
+        self._tracker = tracker
+        self._scheduler = scheduler
+
+    async def _send(self, request: httpx.Request, host: str) -> httpx.Response:
+        """
+        Send one attempt in its own scheduler slot and record its latency.
+
+        Args:
+            request: Outgoing request
+            host: Upstream host name
+
+        Returns:
+            Response from the wrapped transport (releasing the slot when
+            its body is closed)
+        """
+        if self._scheduler is None:
+            return await self._send_in_slot(request, host)
+        await self._scheduler.acquire(host, request.extensions.get(PRIORITY_EXTENSION, 0))
+        try:
+            response = await self._send_in_slot(request, host)
+        except BaseException:
+            self._scheduler.release(host)
+            raise
+        return release_on_close(response, self._scheduler, host)
+
+    async def _send_in_slot(self, request: httpx.Request, host: str) -> httpx.Response:
+        """
+        Send one attempt and record its latency.
+
+        Args:
+            request: Outgoing request
+            host: Upstream host name
+
+        Returns:
+            Response from the wrapped transport
+        """
+        started_at = time.monotonic()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TimeoutException:
+            self._tracker.record_timeout(host, time.monotonic() - started_at)
+            raise
+        except httpx.TransportError:
+            self._tracker.record_error(host)
+            raise
+        self._tracker.record(host, time.monotonic() - started_at)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send the request with the host's adaptive timeout, hedging it if allowed.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            Response of the first attempt to answer
+        """
+        host = request.url.host
+        timeout = self._tracker.timeout_for(host)
+        timeouts = dict(request.extensions.get("timeout", {}))
+        for key in ("connect", "read"):
+            current = timeouts.get(key)
+            timeouts[key] = timeout if current is None else min(current, timeout)
+        request.extensions["timeout"] = timeouts
+
+        hedge_delay = (
+            self._tracker.hedge_delay(host) if request.extensions.get(HEDGE_EXTENSION) else None
+        )
+        if hedge_delay is None:
+            return await self._send(request, host)
+        return await self._send_hedged(request, host, hedge_delay)
+
+    async def _send_hedged(
+        self, request: httpx.Request, host: str, hedge_delay: float
+    ) -> httpx.Response:
+        """
+        Send a request, and a second one if the first is slower than the hedge delay.
+
+        Args:
+            request: Outgoing idempotent request
+            host: Upstream host name
+            hedge_delay: Seconds to wait before hedging
+
+        Returns:
+            Response of the first attempt to succeed
+
+        Raises:
+            httpx.TransportError: If every attempt failed
+        """
+        primary = asyncio.create_task(self._send(request, host))
+        attempts = {primary}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=hedge_delay)
+            if not done:
+                if not self._tracker.try_hedge(host):
+                    response = await primary
+                    attempts.discard(primary)
+                    return response
+                attempts.add(asyncio.create_task(self._send(request, host)))
+
+            pending = set(attempts)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if attempt is not primary:
+                            self._tracker.record_hedge_win(host)
+                        attempts.discard(attempt)
+                        return attempt.result()
+                    if error is None or attempt is primary:
+                        error = attempt.exception()
+            raise error
+        finally:
+            await self._cancel(attempts)
+
+    @staticmethod
+    async def _cancel(attempts: set[asyncio.Task]) -> None:
+        """
+        Cancel losing attempts and close any response they still produced.
+
+        Args:
+            attempts: Attempts whose result is not returned
+        """
+        for attempt in attempts:
+            attempt.cancel()
+        for result in await asyncio.gather(*attempts, return_exceptions=True):
+            if isinstance(result, httpx.Response):
+                await result.aclose()
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
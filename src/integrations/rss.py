@@ -1,56 +1,213 @@
 """RSS feed integration."""
 
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from typing import NamedTuple
 
 import feedparser
+import httpx
 
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-async def fetch_rss_news(feed_url: str, limit: int = 50) -> list[dict]:
+class FeedState(NamedTuple):
+    """Validators and parsed entries of the last full download of a feed."""
+
+    etag: str | None
+    last_modified: str | None
+    entries: list[dict]
+    limit: int
+
+
+class FeedValidatorStore:
+    """
+    Per-feed HTTP validators used for conditional GETs.
+
+    Remembers each feed's ETag and Last-Modified together with the entries
+    parsed from that response, so a 304 Not Modified reuses them without
+    downloading or parsing the feed again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._feeds: dict[str, FeedState] = {}
+        self._not_modified = 0
+        self._downloads = 0
+
+    def get(self, feed_url: str) -> FeedState | None:
+        """
+        Get the stored state of a feed.
+
+        Args:
+            feed_url: URL of the RSS feed
+
+        Returns:
+            Stored state, or None if the feed was never downloaded with validators
+        """
+        return self._feeds.get(feed_url)
+
+    def record_download(self, feed_url: str, state: FeedState) -> None:
+        """
+        Store the result of a full download.
+
+        Responses without any validator are not stored, since they cannot
+        be revalidated.
+
+        Args:
+            feed_url: URL of the RSS feed
+            state: Validators and parsed entries of the response
+        """
+        self._downloads += 1
+        if state.etag is None and state.last_modified is None:
+            self._feeds.pop(feed_url, None)
+        else:
+            self._feeds[feed_url] = state
+
+    def record_not_modified(self) -> None:
+        """Count a feed revalidated with a 304."""
+        self._not_modified += 1
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get conditional GET counters.
+
+        Returns:
+            Dictionary with stored feeds, full downloads and 304 responses
+        """
+        return {
+            "feeds": len(self._feeds),
+            "downloads": self._downloads,
+            "not_modified": self._not_modified,
+        }
+
+
+def create_feed_parser_pool(kind: str = "thread", max_workers: int = 2) -> Executor:
+    """
+    Create a bounded pool for parsing feeds off the event loop.
+
+    feedparser is pure Python, so parsing in a thread still competes with
+    the event loop for the GIL; a process pool removes that contention at
+    the cost of sending the raw bytes and parsed entries between processes.
+
+    Args:
+        kind: "thread" or "process"
+        max_workers: Maximum number of feeds parsed at the same time
+
+    Returns:
+        Executor to pass to fetch_rss_news
+
+    Raises:
+        ValueError: If kind is not "thread" or "process"
+    """
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="feed-parser")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown feed parser pool kind: {kind!r}")
+
+
+def _parse_feed(content: bytes, limit: int) -> list[dict]:
+    """
+    Parse raw feed bytes into entry dictionaries.
+
+    Pure and module-level so it can run in a thread or process pool.
+    feedparser detects the encoding from the bytes (XML declaration and
+    byte order mark), so no decoded copy of the body is needed.
+
+    Args:
+        content: Raw response body
+        limit: Maximum number of entries to return
+
+    Returns:
+        List of feed entry dictionaries
+    """
+    feed = feedparser.parse(content)
+
+    entries = []
+    for entry in feed.entries[:limit]:
+        # Parse published date
+        published_at = None
+        if hasattr(entry, "published_parsed") and entry.published_parsed:
+            try:
+                published_at = datetime(*entry.published_parsed[:6])
+            except (ValueError, TypeError):
+                pass
+
+        # Fallback to current time if no date available
+        if published_at is None:
+            published_at = datetime.utcnow()
+
+        entries.append(
+            {
+                "title": entry.get("title", ""),
+                "url": entry.get("link", ""),
+                "published_at": published_at,
+            }
+        )
+
+    return entries
+
+
+async def fetch_rss_news(
+    client: httpx.AsyncClient,
+    feed_url: str,
+    limit: int = 50,
+    parser_executor: Executor | None = None,
+    validators: FeedValidatorStore | None = None,
+) -> list[dict]:
     """
     Fetch latest news from an RSS feed.
 
+    The feed is parsed in an executor so a large feed does not block the
+    event loop. With a validator store, the request carries If-None-Match /
+    If-Modified-Since from the previous download, and a 304 response reuses
+    the entries parsed back then.
+
     Args:
+        client: Shared HTTP client
         feed_url: URL of the RSS feed
         limit: Maximum number of items to return
+        parser_executor: Pool used to parse the feed (defaults to the event
+            loop's default thread pool)
+        validators: Store of per-feed validators and entries (None disables
+            conditional requests)
 
     Returns:
         List of feed entry dictionaries
     """
     try:
-        import httpx
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(feed_url)
-            response.raise_for_status()
-            feed = feedparser.parse(response.text)
-
-            entries = []
-            for entry in feed.entries[:limit]:
-                # Parse published date
-                published_at = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    try:
-                        published_at = datetime(*entry.published_parsed[:6])
-                    except (ValueError, TypeError):
-                        pass
-
-                # Fallback to current time if no date available
-                if published_at is None:
-                    published_at = datetime.utcnow()
-
-                entries.append(
-                    {
-                        "title": entry.get("title", ""),
-                        "url": entry.get("link", ""),
-                        "published_at": published_at,
-                    }
-                )
-
-            return entries
+        previous = validators.get(feed_url) if validators is not None else None
+        headers = {}
+        # Stored entries can only answer a request for at most as many items
+        if previous is not None and previous.limit >= limit:
+            if previous.etag is not None:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified is not None:
+                headers["If-Modified-Since"] = previous.last_modified
+
+        response = await client.get(feed_url, headers=headers)
+        if response.status_code == 304 and headers:
+            validators.record_not_modified()
+            logger.debug(f"RSS feed not modified: {feed_url}")
+            return previous.entries[:limit]
+        response.raise_for_status()
+
+        loop = asyncio.get_running_loop()
+        entries = await loop.run_in_executor(parser_executor, _parse_feed, response.content, limit)
+        if validators is not None:
+            validators.record_download(
+                feed_url,
+                FeedState(
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    entries=entries,
+                    limit=limit,
+                ),
+            )
+        return entries
     except Exception as e:
         logger.error(f"Failed to fetch RSS feed from {feed_url}: {e}")
         return []
@@ -0,0 +1,319 @@
+"""Bounded-concurrency, prioritized scheduling of upstream requests."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Request extension carrying the scheduling priority (lower runs first)
+PRIORITY_EXTENSION = "fetch_priority"
+
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` requests per second with bursts of ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens
+        """
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated_at = time.monotonic()
+
+    def try_take(self, now: float | None = None) -> float:
+        """
+        Take a token if one is available.
+
+        Args:
+            now: Reference monotonic time (defaults to the current time)
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available
+        """
+        current_time = time.monotonic() if now is None else now
+        self._tokens = min(
+            self._burst, self._tokens + (current_time - self._updated_at) * self._rate
+        )
+        self._updated_at = current_time
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+
+def parse_rate_limits(spec: str) -> dict[str, tuple[float, int]]:
+    """
+    Parse per-host rate limits from a "host=rate[:burst],..." string.
+
+    Args:
+        spec: Comma-separated host limits, e.g.
+            "hacker-news.firebaseio.com=20:40,techcrunch.com=1"
+
+    Returns:
+        Mapping of host to (requests per second, burst)
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    limits = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        host, _, limit = entry.partition("=")
+        rate, _, burst = limit.partition(":")
+        if not host or not rate:
+            raise ValueError(f"Invalid rate limit {entry!r}, expected host=rate[:burst]")
+        limits[host.strip().lower()] = (float(rate), int(burst) if burst else 1)
+    return limits
+
+
+class _Waiter:
+    """Request waiting for a slot."""
+
+    __slots__ = ("host", "future")
+
+    def __init__(self, host: str, future: asyncio.Future) -> None:
+        self.host = host
+        self.future = future
+
+
+class FetchScheduler:
+    """
+    Grants request slots under a global and a per-host concurrency cap.
+
+    Waiting requests are served by priority (lower first, then in arrival
+    order), skipping requests whose host is saturated so one slow upstream
+    does not hold back the others. Hosts with a token bucket are also held
+    to its request rate. Slots are granted on the event loop without locks.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 20,
+        per_host_concurrency: int = 6,
+        rate_limits: dict[str, tuple[float, int]] | None = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight overall
+            per_host_concurrency: Maximum number of requests in flight per host
+            rate_limits: Optional mapping of host to (requests per second, burst)
+        """
+        self._max_concurrency = max_concurrency
+        self._per_host_concurrency = per_host_concurrency
+        self._buckets = {
+            host: TokenBucket(rate, burst) for host, (rate, burst) in (rate_limits or {}).items()
+        }
+        self._queue: list[tuple[int, int, _Waiter]] = []
+        self._sequence = itertools.count()
+        self._active = 0
+        self._active_by_host: dict[str, int] = {}
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._granted = 0
+        self._max_queued = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get scheduler counters.
+
+        Returns:
+            Dictionary with in-flight, queued, granted and peak queued requests
+        """
+        return {
+            "active": self._active,
+            "queued": sum(1 for _, _, waiter in self._queue if not waiter.future.done()),
+            "granted": self._granted,
+            "max_queued": self._max_queued,
+        }
+
+    async def acquire(self, host: str, priority: int = 0) -> None:
+        """
+        Wait for a request slot for a host.
+
+        Every successful acquire must be followed by exactly one release.
+
+        Args:
+            host: Upstream host name
+            priority: Scheduling priority (lower runs first)
+        """
+        waiter = _Waiter(host.lower(), asyncio.get_running_loop().create_future())
+        heapq.heappush(self._queue, (priority, next(self._sequence), waiter))
+        self._max_queued = max(self._max_queued, len(self._queue))
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # Granted just before the cancellation: give the slot back
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(host)
+            raise
+
+    def release(self, host: str) -> None:
+        """
+        Free a slot and grant it to the next eligible waiter.
+
+        Args:
+            host: Host the slot was acquired for
+        """
+        host = host.lower()
+        self._active -= 1
+        remaining = self._active_by_host[host] - 1
+        if remaining:
+            self._active_by_host[host] = remaining
+        else:
+            del self._active_by_host[host]
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, host: str, priority: int = 0) -> AsyncIterator[None]:
+        """
+        Wait for a request slot for a host and hold it for the block.
+
+        Args:
+            host: Upstream host name
+            priority: Scheduling priority (lower runs first)
+        """
+        await self.acquire(host, priority)
+        try:
+            yield
+        finally:
+            self.release(host)
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiters in priority order."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        skipped = []
+        retry_after = None
+        while self._queue and self._active < self._max_concurrency:
+            entry = heapq.heappop(self._queue)
+            waiter = entry[2]
+            if waiter.future.done():
+                # Cancelled while waiting
+                continue
+            if self._active_by_host.get(waiter.host, 0) >= self._per_host_concurrency:
+                skipped.append(entry)
+                continue
+            bucket = self._buckets.get(waiter.host)
+            if bucket is not None:
+                delay = bucket.try_take()
+                if delay:
+                    skipped.append(entry)
+                    retry_after = delay if retry_after is None else min(retry_after, delay)
+                    continue
+
+            self._active += 1
+            self._active_by_host[waiter.host] = self._active_by_host.get(waiter.host, 0) + 1
+            self._granted += 1
+            waiter.future.set_result(None)
+
+        for entry in skipped:
+            heapq.heappush(self._queue, entry)
+        if retry_after is not None:
+            # Nothing else frees a rate-limited slot: check again when a token is due
+            self._wakeup = asyncio.get_running_loop().call_later(retry_after, self._dispatch)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that releases its scheduler slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, scheduler: FetchScheduler, host: str) -> None:
+        self._stream = stream
+        self._scheduler = scheduler
+        self._host = host
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._scheduler.release(self._host)
+
+
+def release_on_close(
+    response: httpx.Response, scheduler: FetchScheduler, host: str
+) -> httpx.Response:
+    """
+    Tie a granted slot to a response, so closing its body releases the slot.
+
+    Args:
+        response: Response received while holding the slot
+        scheduler: Scheduler the slot was acquired from
+        host: Host the slot was acquired for
+
+    Returns:
+        Response whose body stream releases the slot when closed
+    """
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=response.headers,
+        stream=_ReleasingStream(response.stream, scheduler, host),
+        extensions=response.extensions,
+    )
+
+
+class ScheduledTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper sending every request through a FetchScheduler.
+
+    The slot is held until the response body is closed, so the caps bound
+    the connections actually in use. The priority is read from the
+    ``fetch_priority`` request extension, e.g.
+    ``client.get(url, extensions={"fetch_priority": 3})``.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, scheduler: FetchScheduler) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            transport: Transport performing the requests
+            scheduler: Scheduler granting request slots
+        """
+        self._transport = transport
+        self._scheduler = scheduler
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Wait for a slot, then send the request.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            Response whose body stream releases the slot when closed
+        """
+        host = request.url.host
+        await self._scheduler.acquire(host, request.extensions.get(PRIORITY_EXTENSION, 0))
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._scheduler.release(host)
+            raise
+        return release_on_close(response, self._scheduler, host)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
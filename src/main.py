@@ -1,16 +1,38 @@
 """Main application entry point."""
 
 import os
+from concurrent.futures import Executor
 from contextlib import asynccontextmanager
 
+import httpx
 from dotenv import load_dotenv
 from fastapi import FastAPI
 
+from src.integrations.hackernews import HackerNewsItemCache
+from src.integrations.http import create_http_client
+from src.integrations.latency import HostLatencyTracker
+from src.integrations.rss import create_feed_parser_pool
+from src.integrations.scheduler import FetchScheduler, parse_rate_limits
+from src.modules.news.dedup import Deduplicator
+from src.modules.news.refresher import NewsRefresher
+from src.modules.news.search import SearchIndex
 from src.modules.news.service import NewsService
-from src.server.dependencies import set_news_service
+from src.modules.news.store import NewsStore
+from src.server.dependencies import (
+    set_admin_token,
+    set_cache,
+    set_fetch_scheduler,
+    set_latency_tracker,
+    set_loop_monitor,
+    set_news_service,
+    set_taxonomy_reloader,
+)
 from src.server.routes import router
 from src.utils.cache import AsyncCache
+from src.utils.cache_backends import SQLiteCacheBackend
 from src.utils.logging import setup_logging
+from src.utils.loop_monitor import LoopLagMonitor
+from src.utils.taxonomy import DEFAULT_TAXONOMY_PATH, TaxonomyReloader
 
 # Load environment variables
 load_dotenv()
@@ -20,7 +42,13 @@ setup_logging()
 
 # Global cache instance (controlled singleton)
 _cache: AsyncCache | None = None
+_http_client: httpx.AsyncClient | None = None
 _news_service: NewsService | None = None
+_news_store: NewsStore | None = None
+_refresher: NewsRefresher | None = None
+_taxonomy_reloader: TaxonomyReloader | None = None
+_feed_parser: Executor | None = None
+_loop_monitor: LoopLagMonitor | None = None
 
 
 @asynccontextmanager
@@ -30,11 +58,80 @@ async def lifespan(app: FastAPI):
 
     Initializes and cleans up resources.
     """
-    global _cache, _news_service
+    global _cache, _http_client, _news_service, _refresher, _taxonomy_reloader
+    global _feed_parser, _loop_monitor, _news_store
+
+    # Measure event loop lag (0 disables the measuring task)
+    loop_lag_interval = float(os.getenv("LOOP_LAG_INTERVAL_SECONDS", "0.5"))
+    _loop_monitor = LoopLagMonitor(interval_seconds=loop_lag_interval or 0.5)
+    if loop_lag_interval > 0:
+        _loop_monitor.start()
+    set_loop_monitor(_loop_monitor)
+
+    # Load the topic taxonomy used for tagging and relevance filtering
+    _taxonomy_reloader = TaxonomyReloader(os.getenv("TAXONOMY_PATH", str(DEFAULT_TAXONOMY_PATH)))
+    await _taxonomy_reloader.reload()
+    # Reload the taxonomy when the file changes (0 disables the watcher)
+    taxonomy_watch_interval = float(os.getenv("TAXONOMY_WATCH_INTERVAL_SECONDS", "0"))
+    if taxonomy_watch_interval > 0:
+        _taxonomy_reloader.start_watching(interval_seconds=taxonomy_watch_interval)
+    set_taxonomy_reloader(_taxonomy_reloader)
+    # Admin endpoints are only served with a configured bearer token
+    set_admin_token(os.getenv("ADMIN_TOKEN") or None)
 
     # Initialize cache
     cache_ttl = int(os.getenv("CACHE_TTL_SECONDS", "60"))
-    _cache = AsyncCache(ttl_seconds=cache_ttl)
+    cache_stale_ttl = int(os.getenv("CACHE_STALE_TTL_SECONDS", "0"))
+    # 0 means unbounded
+    cache_max_entries = int(os.getenv("CACHE_MAX_ENTRIES", "1000")) or None
+    cache_backend = None
+    if os.getenv("CACHE_BACKEND", "memory").lower() == "sqlite":
+        # Shared by every worker process pointing at the same file
+        cache_backend = SQLiteCacheBackend(
+            path=os.getenv("CACHE_SQLITE_PATH", "news_cache.sqlite3"),
+            max_entries=cache_max_entries,
+        )
+    _cache = AsyncCache(
+        ttl_seconds=cache_ttl,
+        stale_ttl_seconds=cache_stale_ttl,
+        max_entries=cache_max_entries,
+        max_bytes=int(os.getenv("CACHE_MAX_BYTES", "0")) or None,
+        backend=cache_backend,
+    )
+    cache_sweep_interval = float(os.getenv("CACHE_SWEEP_INTERVAL_SECONDS", "60"))
+    if cache_sweep_interval > 0:
+        _cache.start_sweeper(interval_seconds=cache_sweep_interval)
+    set_cache(_cache)
+
+    # Every upstream request waits for a slot under global and per-host caps
+    fetch_scheduler = FetchScheduler(
+        max_concurrency=int(os.getenv("FETCH_MAX_CONCURRENCY", "20")),
+        per_host_concurrency=int(os.getenv("FETCH_PER_HOST_CONCURRENCY", "6")),
+        rate_limits=parse_rate_limits(os.getenv("FETCH_RATE_LIMITS", "")),
+    )
+    set_fetch_scheduler(fetch_scheduler)
+
+    # Per-host latency drives adaptive timeouts and hedged requests
+    http_timeout = float(os.getenv("HTTP_TIMEOUT_SECONDS", "10"))
+    latency_tracker = HostLatencyTracker(
+        timeout_factor=float(os.getenv("UPSTREAM_TIMEOUT_FACTOR", "3")),
+        min_timeout=float(os.getenv("UPSTREAM_MIN_TIMEOUT_SECONDS", "1")),
+        max_timeout=http_timeout,
+        hedge_quantile=float(os.getenv("HEDGE_QUANTILE", "0.95")),
+        max_hedge_ratio=float(os.getenv("HEDGE_MAX_RATIO", "0.1")),
+    )
+    set_latency_tracker(latency_tracker)
+
+    # Initialize the shared, pooled HTTP client used by every integration
+    _http_client = create_http_client(
+        max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+        keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30")),
+        timeout=http_timeout,
+        http2=os.getenv("HTTP2_ENABLED", "true").lower() in ("1", "true", "yes"),
+        scheduler=fetch_scheduler,
+        latency_tracker=latency_tracker,
+    )
 
     # Initialize news service with multiple RSS feeds focused on AI, Data Science, and Big Tech
     rss_feed_urls_env = os.getenv("RSS_FEED_URLS", "")
@@ -51,16 +148,78 @@ async def lifespan(app: FastAPI):
             "https://www.technologyreview.com/feed/",
         ]
 
-    _news_service = NewsService(cache=_cache, rss_feed_urls=rss_feed_urls)
+    # Parse RSS feeds in a bounded pool so large feeds do not block the event loop
+    _feed_parser = create_feed_parser_pool(
+        kind=os.getenv("RSS_PARSER_POOL", "thread").lower(),
+        max_workers=int(os.getenv("RSS_PARSER_WORKERS", "2")),
+    )
+
+    # Durable item store so restarts serve the last known items (empty path disables)
+    news_store_path = os.getenv("NEWS_STORE_PATH", "news_store.sqlite3")
+    if news_store_path:
+        _news_store = NewsStore(
+            path=news_store_path,
+            max_items=int(os.getenv("NEWS_STORE_MAX_ITEMS", "10000")) or None,
+        )
+
+    _news_service = NewsService(
+        cache=_cache,
+        rss_feed_urls=rss_feed_urls,
+        http_client=_http_client,
+        feed_parser=_feed_parser,
+        # Only stories new to the top list are fetched in full on each refresh
+        hn_item_cache=HackerNewsItemCache(
+            ttl_seconds=float(os.getenv("HN_ITEM_TTL_SECONDS", "900")),
+            refresh_after_seconds=float(os.getenv("HN_SCORE_REFRESH_SECONDS", "300")),
+            max_refreshes=int(os.getenv("HN_MAX_SCORE_REFRESHES", "10")),
+        ),
+        # Slow sources are left to finish in the background (0 waits for every source)
+        fetch_budget_seconds=float(os.getenv("NEWS_FETCH_BUDGET_SECONDS", "5")),
+        store=_news_store,
+        # Full-text index of every ingested item, ranked by relevance and recency
+        search_index=SearchIndex(
+            recency_half_life_seconds=float(os.getenv("SEARCH_RECENCY_HALF_LIFE_HOURS", "24"))
+            * 3600,
+            max_documents=int(os.getenv("SEARCH_MAX_DOCUMENTS", "100000")) or None,
+            max_candidates=int(os.getenv("SEARCH_MAX_CANDIDATES", "1000")) or None,
+        ),
+        # Copies of a story are merged by canonical URL and near-duplicate title
+        deduplicator=Deduplicator(
+            title_similarity=float(os.getenv("NEWS_DEDUP_TITLE_SIMILARITY", "0.8")) or None,
+            title_window_seconds=float(os.getenv("NEWS_DEDUP_WINDOW_HOURS", "48")) * 3600,
+        ),
+    )
+    await _news_service.restore()
 
     # Set the service in dependencies module for route injection
     set_news_service(_news_service)
 
+    # Keep the news snapshot warm in the background (0 disables the refresher)
+    refresh_interval = float(os.getenv("NEWS_REFRESH_INTERVAL_SECONDS", str(cache_ttl)))
+    if refresh_interval > 0:
+        _refresher = NewsRefresher(_news_service, interval_seconds=refresh_interval)
+        _refresher.start()
+
     yield
 
     # Cleanup
+    if _refresher:
+        await _refresher.stop()
+    if _taxonomy_reloader:
+        await _taxonomy_reloader.stop()
+    if _loop_monitor:
+        await _loop_monitor.stop()
+    if _news_service:
+        await _news_service.close()
+    if _http_client:
+        await _http_client.aclose()
+    if _feed_parser:
+        _feed_parser.shutdown(wait=False, cancel_futures=True)
+    if _news_store:
+        _news_store.close()
     if _cache:
-        await _cache.clear()
+        # Clears the in-memory backend; a shared backend keeps its entries
+        await _cache.close()
 
 
 # Create FastAPI app
@@ -0,0 +1,335 @@
+"""Cross-source deduplication of news items."""
+
+import functools
+import hashlib
+import struct
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.modules.news.models import NewsItem
+from src.utils.tagging import tokenize
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = frozenset(
+    {
+        "_hsenc",
+        "_hsmi",
+        "cmpid",
+        "dclid",
+        "fbclid",
+        "gbraid",
+        "gclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "mkt_tok",
+        "msclkid",
+        "ncid",
+        "ref",
+        "ref_src",
+        "ref_url",
+        "smid",
+        "twclid",
+        "wbraid",
+        "yclid",
+    }
+)
+TRACKING_PARAM_PREFIXES = ("utm_", "pk_", "mtm_")
+
+# Host prefixes serving the same pages as the bare domain
+_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+
+# MinHash signatures: 32 32-bit hashes per title, split into 8 LSH bands of
+# 4 hashes. Two titles with a token Jaccard similarity of 0.8 share a band
+# with a probability of 98.5% (0.9: 99.96%, 0.5: 40%, 0.3: 6%), and every
+# shared band is then checked against the exact similarity.
+_SIGNATURE_SIZE = 32
+_BAND_SIZE = 4
+_SIGNATURE_FORMAT = struct.Struct(f"<{_SIGNATURE_SIZE}I")
+
+# Titles with fewer tokens are too generic to be matched on their own
+MIN_TITLE_TOKENS = 3
+
+# Items compared per LSH bucket, which keeps a refresh linear in its size
+# even when many titles share a band
+_MAX_BUCKET_SIZE = 8
+
+
+@functools.lru_cache(maxsize=16384)
+def canonical_url(url: str) -> str:
+    """
+    Normalize a URL so that links to the same page compare equal.
+
+    The scheme becomes https, the host is lowercased without its port,
+    ``www.``-like prefix and trailing dot, tracking parameters and the
+    fragment are dropped, the remaining parameters are sorted and the path
+    loses its trailing slash.
+
+    Args:
+        url: Item URL
+
+    Returns:
+        Canonical form of the URL (the URL itself if it cannot be parsed)
+    """
+    try:
+        parts = urlsplit(url.strip())
+        host = (parts.hostname or "").rstrip(".")
+    except ValueError:
+        return url
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") > 1:
+            host = host.removeprefix(prefix)
+            break
+    query = ""
+    if parts.query:
+        query = urlencode(
+            sorted(
+                (name, value)
+                for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                if name.lower() not in TRACKING_PARAMS
+                and not name.lower().startswith(TRACKING_PARAM_PREFIXES)
+            )
+        )
+    return urlunsplit(("https", host, parts.path.rstrip("/"), query, ""))
+
+
+@functools.lru_cache(maxsize=65536)
+def _token_hashes(token: str) -> tuple[int, ...]:
+    """Hash a title token with each of the MinHash functions."""
+    return _SIGNATURE_FORMAT.unpack(hashlib.shake_128(token.encode()).digest(4 * _SIGNATURE_SIZE))
+
+
+def title_signature(tokens: frozenset[str]) -> tuple[int, ...]:
+    """
+    Compute the MinHash signature of a title.
+
+    Args:
+        tokens: Distinct tokens of the title (at least one)
+
+    Returns:
+        Minimum of each hash function over the tokens
+    """
+    return tuple(map(min, zip(*map(_token_hashes, tokens), strict=True)))
+
+
+@functools.lru_cache(maxsize=16384)
+def _title_bands(title: str) -> tuple[frozenset[str], tuple[tuple[int, ...], ...]]:
+    """
+    Get the tokens of a title and the LSH band keys of its signature.
+
+    Titles are cached, since most items come back at every refresh.
+
+    Args:
+        title: Item title
+
+    Returns:
+        Tuple of (distinct tokens, band keys starting with the band number),
+        without band keys for titles shorter than MIN_TITLE_TOKENS
+    """
+    tokens = frozenset(tokenize(title))
+    if len(tokens) < MIN_TITLE_TOKENS:
+        return tokens, ()
+    signature = title_signature(tokens)
+    return tokens, tuple(
+        (band, *signature[band * _BAND_SIZE : (band + 1) * _BAND_SIZE])
+        for band in range(_SIGNATURE_SIZE // _BAND_SIZE)
+    )
+
+
+class Deduplication(NamedTuple):
+    """Outcome of deduplicating a list of items."""
+
+    # One item per story, in the order of the input
+    items: list[NewsItem]
+    # Items of `items` that were built by merging several items
+    merged: list[NewsItem]
+    # IDs of the items folded into another one
+    dropped: list[str]
+    # Items dropped as copies of the same URL, and as near-duplicate titles
+    url_duplicates: int = 0
+    title_duplicates: int = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the deduplication counters of this run.
+
+        Returns:
+            Dictionary with the items dropped as URL and as title duplicates
+        """
+        return {"url_duplicates": self.url_duplicates, "title_duplicates": self.title_duplicates}
+
+
+class Deduplicator:
+    """
+    Merge copies of the same story coming from several sources.
+
+    Items are duplicates if their canonical URLs are equal, or if their
+    titles are near-duplicates published within ``title_window_seconds`` of
+    each other: the Jaccard similarity of their token sets is at least
+    ``title_similarity``. Near-duplicate titles are found with MinHash and
+    locality-sensitive hashing, so each item is only compared with a
+    bounded number of candidates and deduplication runs in linear time.
+    Duplicates are merged into the Hacker News copy with the highest score,
+    which keeps its score and comments URL, or else into the oldest copy,
+    and the merged item carries the tags of every copy.
+    """
+
+    def __init__(
+        self, title_similarity: float | None = 0.8, title_window_seconds: float = 172800.0
+    ) -> None:
+        """
+        Initialize the deduplicator.
+
+        Args:
+            title_similarity: Minimum Jaccard similarity of the title tokens
+                of duplicates (None or 0 only merges items by URL)
+            title_window_seconds: Maximum publication time difference of
+                items merged on their titles
+        """
+        self._title_similarity = title_similarity or None
+        self._title_window_seconds = title_window_seconds
+
+    def deduplicate(self, items: Sequence[NewsItem]) -> Deduplication:
+        """
+        Merge the duplicates among items.
+
+        Args:
+            items: Items to deduplicate
+
+        Returns:
+            Deduplicated items, the merged ones and the IDs of dropped items
+        """
+        # Union-find over item positions
+        parent = list(range(len(items)))
+
+        def find(position: int) -> int:
+            while parent[position] != position:
+                parent[position] = parent[parent[position]]
+                position = parent[position]
+            return position
+
+        def union(first: int, second: int) -> bool:
+            first, second = find(first), find(second)
+            if first == second:
+                return False
+            parent[max(first, second)] = min(first, second)
+            return True
+
+        by_url: dict[str, int] = {}
+        url_duplicates = 0
+        for position, item in enumerate(items):
+            first = by_url.setdefault(canonical_url(str(item.url)), position)
+            if union(first, position):
+                url_duplicates += 1
+
+        title_duplicates = 0
+        if self._title_similarity is not None:
+            title_duplicates = self._merge_titles(items, find, union)
+
+        groups: dict[int, list[int]] = {}
+        for position in range(len(items)):
+            groups.setdefault(find(position), []).append(position)
+
+        kept: dict[int, NewsItem] = {}
+        merged = []
+        dropped = []
+        for positions in groups.values():
+            if len(positions) == 1:
+                kept[positions[0]] = items[positions[0]]
+                continue
+            base = min(positions, key=lambda position: self._merge_rank(items[position], position))
+            item = self._merge(items[base], [items[position] for position in positions])
+            kept[base] = item
+            if item is not items[base]:
+                merged.append(item)
+            dropped.extend(
+                items[position].id for position in positions if items[position].id != item.id
+            )
+
+        return Deduplication(
+            [kept[position] for position in sorted(kept)],
+            merged,
+            dropped,
+            url_duplicates,
+            title_duplicates,
+        )
+
+    def _merge_titles(
+        self,
+        items: Sequence[NewsItem],
+        find: Callable[[int], int],
+        union: Callable[[int, int], bool],
+    ) -> int:
+        """
+        Union the items whose titles are near-duplicates.
+
+        Args:
+            items: Items being deduplicated
+            find: Root of an item position's group
+            union: Merge the groups of two positions (returns False if they
+                already were one group)
+
+        Returns:
+            Number of items merged on their titles
+        """
+        merged = 0
+        minimum = self._title_similarity
+        window = self._title_window_seconds
+        buckets: dict[tuple[int, ...], list[int]] = {}
+        titles: dict[int, tuple[frozenset[str], float]] = {}
+        for position, item in enumerate(items):
+            tokens, bands = _title_bands(item.title)
+            if not bands:
+                continue
+            published_at = item.published_at.timestamp()
+            titles[position] = (tokens, published_at)
+            candidates = set()
+            for key in bands:
+                bucket = buckets.get(key)
+                if bucket is None:
+                    bucket = buckets[key] = []
+                candidates.update(bucket[-_MAX_BUCKET_SIZE:])
+                bucket.append(position)
+
+            size = len(tokens)
+            for candidate in candidates:
+                other_tokens, other_published_at = titles[candidate]
+                if abs(published_at - other_published_at) > window:
+                    continue
+                other_size = len(other_tokens)
+                # The similarity is at most the ratio of the set sizes
+                if min(size, other_size) < minimum * max(size, other_size):
+                    continue
+                if find(candidate) == find(position):
+                    continue
+                shared = len(tokens & other_tokens)
+                similarity = shared / (size + other_size - shared)
+                if similarity >= minimum and union(candidate, position):
+                    merged += 1
+        return merged
+
+    @staticmethod
+    def _merge_rank(item: NewsItem, position: int) -> tuple:
+        """Sort key of the copies of a story, the one to keep first."""
+        if item.source == "hackernews":
+            return (0, -(item.score or 0), position)
+        return (1, item.published_at.timestamp(), position)
+
+    @staticmethod
+    def _merge(base: NewsItem, copies: list[NewsItem]) -> NewsItem:
+        """
+        Merge the copies of a story into the one to keep.
+
+        Args:
+            base: Copy to keep
+            copies: Every copy, including base
+
+        Returns:
+            The base copy with the tags of every copy (base itself if it
+            already has them all)
+        """
+        tags = list(dict.fromkeys(tag for copy in [base, *copies] for tag in copy.tags))
+        if tags == base.tags:
+            return base
+        return base.model_copy(update={"tags": tags})
@@ -0,0 +1,106 @@
+"""Inverted index over the items of a news snapshot."""
+
+import bisect
+from collections.abc import Iterable, Sequence
+
+from src.modules.news.models import NewsItem
+from src.utils.tagging import tokenize
+
+
+def _contains(postings: list[int], position: int) -> bool:
+    """
+    Check whether a sorted postings list holds a position.
+
+    Args:
+        postings: Ascending item positions
+        position: Position to look for
+
+    Returns:
+        True if the position is in the list
+    """
+    index = bisect.bisect_left(postings, position)
+    return index < len(postings) and postings[index] == position
+
+
+class NewsIndex:
+    """
+    Tag, source and title-token postings of a snapshot's items.
+
+    Each postings list holds the positions of the matching items in the
+    snapshot, which are added in snapshot order, so every list is sorted
+    newest first and any intersection of lists is too. A filtered page is
+    then an intersection plus a binary search, without scanning the items.
+    The index belongs to one snapshot and is never updated afterwards: a
+    refresh builds a new snapshot with a new index and swaps both at once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._tags: dict[str, list[int]] = {}
+        self._sources: dict[str, list[int]] = {}
+        self._tokens: dict[str, list[int]] = {}
+        self._size = 0
+
+    @classmethod
+    def build(cls, items: Iterable[NewsItem]) -> "NewsIndex":
+        """
+        Index items in order.
+
+        Args:
+            items: Snapshot items, newest first
+
+        Returns:
+            Index whose positions are the items' positions in the sequence
+        """
+        index = cls()
+        for item in items:
+            index.add(item)
+        return index
+
+    def add(self, item: NewsItem) -> int:
+        """
+        Index the next item of the snapshot.
+
+        Args:
+            item: News item following every item already added
+
+        Returns:
+            Position given to the item
+        """
+        position = self._size
+        self._size += 1
+        for tag in set(item.tags):
+            self._tags.setdefault(tag.lower(), []).append(position)
+        self._sources.setdefault(item.source, []).append(position)
+        for token in set(tokenize(item.title)):
+            self._tokens.setdefault(token, []).append(position)
+        return position
+
+    def match(
+        self, tags: Sequence[str] = (), source: str | None = None, terms: Sequence[str] = ()
+    ) -> list[int]:
+        """
+        Find the items matching every given tag, the source and every term.
+
+        Args:
+            tags: Tags the items must all have
+            source: Source the items must come from
+            terms: Title tokens the items must all contain
+
+        Returns:
+            Ascending positions of the matching items
+        """
+        postings = [self._tags.get(tag.lower(), []) for tag in tags]
+        postings += [self._tokens.get(term, []) for term in terms]
+        if source is not None:
+            postings.append(self._sources.get(source, []))
+        if not postings:
+            return list(range(self._size))
+
+        postings.sort(key=len)
+        candidates, others = postings[0], postings[1:]
+        return [
+            position
+            for position in candidates
+            if all(_contains(other, position) for other in others)
+        ]
@@ -0,0 +1,145 @@
+"""Keyset pagination over news items ordered newest first."""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import NamedTuple
+
+from src.modules.news.models import NewsItem
+from src.utils.tagging import tokenize
+
+
+class ItemKey(NamedTuple):
+    """
+    Sort key of a news item.
+
+    Items are ordered by descending key: newest first, ties broken by
+    descending ID, so every item has a unique position.
+    """
+
+    published_at: float
+    id: str
+
+
+class PageQuery(NamedTuple):
+    """Bounds and filters of a page of news items, newest first."""
+
+    limit: int
+    # Only items strictly after (older than) this key
+    after: ItemKey | None = None
+    # Only items published strictly after this timestamp
+    since: float | None = None
+    # Only items published at or before this timestamp
+    until: float | None = None
+    # Only items having every one of these tags
+    tags: tuple[str, ...] = ()
+    # Only items from this source
+    source: str | None = None
+    # Only items whose title contains every one of these tokens
+    terms: tuple[str, ...] = ()
+
+    @property
+    def filtered(self) -> bool:
+        """Whether the query filters items by tag, source or text."""
+        return bool(self.tags or self.source or self.terms)
+
+    @property
+    def is_first_page(self) -> bool:
+        """Whether the query is the unbounded, unfiltered newest page."""
+        return (
+            self.after is None and self.since is None and self.until is None and not self.filtered
+        )
+
+
+def item_key(item: NewsItem) -> ItemKey:
+    """
+    Get the sort key of a news item.
+
+    Args:
+        item: News item
+
+    Returns:
+        Publication timestamp and ID of the item
+    """
+    return ItemKey(item.published_at.timestamp(), item.id)
+
+
+def encode_cursor(key: ItemKey) -> str:
+    """
+    Encode a sort key as an opaque cursor.
+
+    Args:
+        key: Key of the last item of a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([key.published_at, key.id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> ItemKey:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Sort key of the last item of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        published_at, item_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor {cursor!r}") from e
+    if not isinstance(published_at, int | float) or not isinstance(item_id, str):
+        raise ValueError(f"Invalid cursor {cursor!r}")
+    return ItemKey(float(published_at), item_id)
+
+
+def build_page_query(
+    limit: int,
+    cursor: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    tags: Sequence[str] | None = None,
+    source: str | None = None,
+    q: str | None = None,
+) -> PageQuery:
+    """
+    Build page bounds and filters from request parameters.
+
+    Args:
+        limit: Maximum number of items
+        cursor: Cursor returned with the previous page
+        since: Only return items published after this time
+        until: Only return items published at or before this time
+        tags: Only return items having all of these tags (each value may
+            hold several comma-separated tags)
+        source: Only return items from this source
+        q: Only return items whose title contains every word of this text
+
+    Returns:
+        Page bounds and filters
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    tag_filter = dict.fromkeys(
+        tag.strip().lower() for value in tags or () for tag in value.split(",") if tag.strip()
+    )
+    return PageQuery(
+        limit=limit,
+        after=decode_cursor(cursor) if cursor else None,
+        since=since.timestamp() if since is not None else None,
+        until=until.timestamp() if until is not None else None,
+        tags=tuple(tag_filter),
+        source=source or None,
+        terms=tuple(dict.fromkeys(tokenize(q))) if q else (),
+    )
@@ -0,0 +1,66 @@
+"""Background task that keeps the news snapshot warm."""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from src.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from src.modules.news.service import NewsService
+
+logger = get_logger(__name__)
+
+
+class NewsRefresher:
+    """
+    Periodically refreshes the news snapshot held by a NewsService.
+
+    Requests then read the in-memory snapshot instead of waiting on
+    upstream round trips after a cache expiry.
+    """
+
+    def __init__(self, service: "NewsService", interval_seconds: float = 60.0) -> None:
+        """
+        Initialize the refresher.
+
+        Args:
+            service: News service whose snapshot is refreshed
+            interval_seconds: Delay between the end of one refresh and the next
+        """
+        self._service = service
+        self._interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is currently running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background refresh loop (no-op if already running)."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name="news-refresher")
+
+    async def stop(self) -> None:
+        """Cancel the background refresh loop and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Refresh the snapshot forever, sleeping between runs."""
+        while True:
+            try:
+                await self._service.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Never let one bad refresh kill the loop
+                logger.exception(f"Background news refresh failed: {e}")
+            await asyncio.sleep(self._interval_seconds)
@@ -0,0 +1,386 @@
+"""Full-text BM25 search over every news item the service has ingested."""
+
+import bisect
+import heapq
+import itertools
+import math
+import operator
+import time
+from collections import Counter
+from collections.abc import Iterable
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+from src.modules.news.models import NewsItem
+from src.utils.tagging import tokenize
+
+
+class SearchHit(NamedTuple):
+    """News item matching a search, with its ranking score."""
+
+    item: NewsItem
+    score: float
+
+
+class SearchResults(NamedTuple):
+    """Best matches of a search."""
+
+    hits: list[SearchHit]
+    # False if the candidate budget ran out before the ranking was final
+    exhaustive: bool
+
+
+def document_terms(item: NewsItem) -> Counter[str]:
+    """
+    Get the indexed terms of a news item.
+
+    Title, URL host and path, and tags (as extracted from the title and URL
+    by the topic taxonomy) are tokenized like search queries.
+
+    Args:
+        item: News item
+
+    Returns:
+        Term frequencies of the item
+    """
+    url = urlsplit(str(item.url))
+    return Counter(tokenize(f"{item.title} {url.hostname or ''} {url.path} {' '.join(item.tags)}"))
+
+
+class _Document:
+    """Indexed item with the data needed to score and remove it."""
+
+    __slots__ = ("item", "terms", "length", "published_at")
+
+    def __init__(self, item: NewsItem, terms: Counter[str]) -> None:
+        self.item = item
+        self.terms = terms
+        self.length = sum(terms.values())
+        self.published_at = item.published_at.timestamp()
+
+
+class _Postings:
+    """
+    Items containing a term, oldest published first.
+
+    Publication times and document numbers are parallel lists, so a
+    posting is found with a plain bisect. Items published at the same time
+    are ordered by document number. Items are mostly added newer than
+    every posting and removed oldest first, so both ends are cheap: new
+    postings are appended, and removed oldest postings only move ``start``
+    past them until the lists are compacted.
+    """
+
+    __slots__ = ("times", "docs", "start", "shapes")
+
+    def __init__(self) -> None:
+        self.times: list[float] = []
+        self.docs: list[int] = []
+        # Position of the oldest live posting (those before it are removed)
+        self.start = 0
+        # Number of postings per (term frequency, document length), the
+        # only inputs of a posting's BM25 weight
+        self.shapes: Counter[tuple[int, int]] = Counter()
+
+    def __len__(self) -> int:
+        """Number of live postings."""
+        return len(self.docs) - self.start
+
+    def insert(self, published_at: float, doc: int, shape: tuple[int, int]) -> None:
+        """Add a document numbered after every document already added."""
+        if not self.times or published_at >= self.times[-1]:
+            self.times.append(published_at)
+            self.docs.append(doc)
+        else:
+            index = bisect.bisect_right(self.times, published_at, lo=self.start)
+            self.times.insert(index, published_at)
+            self.docs.insert(index, doc)
+        self.shapes[shape] += 1
+
+    def remove(self, published_at: float, doc: int, shape: tuple[int, int]) -> None:
+        """Remove a document."""
+        index = self.docs.index(doc, bisect.bisect_left(self.times, published_at, lo=self.start))
+        if index == self.start:
+            self.start += 1
+            # Compact once removed postings make up half of the lists
+            if self.start * 2 >= len(self.docs):
+                del self.times[: self.start]
+                del self.docs[: self.start]
+                self.start = 0
+        else:
+            del self.times[index]
+            del self.docs[index]
+        self.shapes[shape] -= 1
+        if not self.shapes[shape]:
+            del self.shapes[shape]
+
+
+class SearchIndex:
+    """
+    Incremental inverted index ranking items with BM25 and recency.
+
+    Items are added as they are ingested and stay searchable after they
+    leave the snapshot. An item added again under the same ID replaces the
+    previous version, and is only re-tokenized if its text or publication
+    time changed. Each result's BM25 score is multiplied by
+    ``1 + recency_boost * 0.5 ** (age / recency_half_life)``, so among
+    similar matches newer items rank first. Queries match any of their
+    terms. Only the ``max_documents`` most recently published items are
+    kept.
+
+    Postings are kept in publication order and queries walk them newest
+    first with MaxScore: each term's best possible score bounds what it
+    adds to an item. Once the weakest terms together cannot lift an item
+    into the top results, their postings are no longer walked (they are
+    only looked up in the items found through the other terms), and since
+    the recency weight only decreases along the walk, it stops as soon as
+    not even an item containing every term could enter them. Selective
+    terms therefore cost little whatever the size of the index. Queries
+    made only of terms found in a large share of the items may still have
+    to score many of them, so at most ``max_candidates`` items are scored
+    by the walk. Past that, every item containing the query's most
+    selective terms is scored too (within the same budget), so that older
+    items matching them are still found, and the results are flagged as
+    not exhaustive.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        recency_boost: float = 1.0,
+        recency_half_life_seconds: float = 86400.0,
+        max_documents: int | None = 100_000,
+        max_candidates: int | None = 1000,
+    ) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+            recency_boost: Extra weight of a brand-new item (0 ranks by BM25 only)
+            recency_half_life_seconds: Age at which the recency weight halves
+            max_documents: Maximum number of indexed items (None for unbounded);
+                the oldest published items are dropped first
+            max_candidates: Maximum number of items scored by the walk of a
+                query, and then by its selective-term pass (None for
+                exhaustive rankings)
+        """
+        self._k1 = k1
+        self._b = b
+        self._recency_boost = recency_boost
+        self._recency_decay = math.log(2) / recency_half_life_seconds
+        self._max_documents = max_documents
+        self._max_candidates = max_candidates
+        # Item ID -> internal document number
+        self._doc_ids: dict[str, int] = {}
+        self._documents: dict[int, _Document] = {}
+        self._postings: dict[str, _Postings] = {}
+        self._next_doc = 0
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """Number of indexed items."""
+        return len(self._documents)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get index counters.
+
+        Returns:
+            Dictionary with indexed items and distinct terms
+        """
+        return {"documents": len(self._documents), "terms": len(self._postings)}
+
+    def add(self, items: Iterable[NewsItem]) -> None:
+        """
+        Index items, replacing earlier versions with the same ID.
+
+        Args:
+            items: Items to index
+        """
+        added: dict[str, NewsItem] = {}
+        for item in items:
+            doc = self._doc_ids.get(item.id)
+            if doc is not None:
+                current = self._documents[doc]
+                if (
+                    current.item.title == item.title
+                    and current.item.url == item.url
+                    and current.item.tags == item.tags
+                    and current.item.published_at == item.published_at
+                ):
+                    # Same text and position (e.g. only the score changed)
+                    current.item = item
+                    continue
+                self._remove(doc)
+            added[item.id] = item
+        # Oldest first, so that postings are appended rather than inserted
+        # (batches such as the item store's arrive newest first)
+        for item in sorted(added.values(), key=lambda item: item.published_at):
+            self._insert(item)
+
+        if self._max_documents is not None and len(self._documents) > self._max_documents:
+            excess = len(self._documents) - self._max_documents
+            oldest = heapq.nsmallest(
+                excess, self._documents, key=lambda doc: self._documents[doc].published_at
+            )
+            for doc in oldest:
+                self._remove(doc)
+
+    def discard(self, item_ids: Iterable[str]) -> None:
+        """
+        Remove items from the index, ignoring IDs that are not indexed.
+
+        Args:
+            item_ids: IDs of the items to remove
+        """
+        for item_id in item_ids:
+            doc = self._doc_ids.get(item_id)
+            if doc is not None:
+                self._remove(doc)
+
+    def _insert(self, item: NewsItem) -> None:
+        """Index an item under a new document number."""
+        doc = self._next_doc
+        self._next_doc += 1
+        document = _Document(item, document_terms(item))
+        self._doc_ids[item.id] = doc
+        self._documents[doc] = document
+        self._total_length += document.length
+        for term, frequency in document.terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = _Postings()
+            postings.insert(document.published_at, doc, (frequency, document.length))
+
+    def _remove(self, doc: int) -> None:
+        """Remove a document and its postings."""
+        document = self._documents[doc]
+        for term, frequency in document.terms.items():
+            postings = self._postings[term]
+            postings.remove(document.published_at, doc, (frequency, document.length))
+            if not postings:
+                del self._postings[term]
+        del self._documents[doc]
+        del self._doc_ids[document.item.id]
+        self._total_length -= document.length
+
+    def search(self, query: str, limit: int = 20, now: float | None = None) -> SearchResults:
+        """
+        Rank the items matching any term of a query.
+
+        Args:
+            query: Free text query
+            limit: Maximum number of results
+            now: Reference timestamp for recency (defaults to the current time)
+
+        Returns:
+            Best matches, highest score first
+        """
+        terms = [term for term in dict.fromkeys(tokenize(query)) if term in self._postings]
+        if not terms or limit <= 0:
+            return SearchResults([], True)
+
+        documents = self._documents
+        count = len(documents)
+        k1 = self._k1
+        # BM25 length normalization: k1 * (1 - b + b * length / average length)
+        length_base = k1 * (1 - self._b)
+        length_weight = k1 * self._b * count / self._total_length
+        current_time = time.time() if now is None else now
+        boost = self._recency_boost
+        decay = self._recency_decay
+
+        weights = {}
+        # Cursors walk each term's postings from the newest item:
+        # [published_at, doc, position, postings, best possible BM25 score]
+        cursors = []
+        for term in terms:
+            postings = self._postings[term]
+            df = len(postings)
+            weight = math.log(1 + (count - df + 0.5) / (df + 0.5)) * (k1 + 1)
+            weights[term] = weight
+            bound = max(
+                weight * frequency / (frequency + length_base + length_weight * length)
+                for frequency, length in postings.shapes
+            )
+            last = len(postings.docs) - 1
+            cursors.append([postings.times[last], postings.docs[last], last, postings, bound])
+
+        def score(doc: int, recency: float) -> float:
+            document = documents[doc]
+            norm = length_base + length_weight * document.length
+            total = 0.0
+            for term in document.terms.keys() & weights.keys():
+                frequency = document.terms[term]
+                total += weights[term] * frequency / (frequency + norm)
+            return total * recency
+
+        def collect(doc: int, score: float) -> None:
+            if len(best) < limit:
+                heapq.heappush(best, (score, doc))
+            elif score > best[0][0]:
+                heapq.heapreplace(best, (score, doc))
+
+        # Weakest terms first: cursors ranked below `essential` are not walked
+        cursors.sort(key=operator.itemgetter(4))
+        reachable = list(itertools.accumulate(cursor[4] for cursor in cursors))
+        essential = 0
+        # Newest first: (-published_at, -doc, rank of the cursor)
+        frontier = [(-cursor[0], -cursor[1], rank) for rank, cursor in enumerate(cursors)]
+        heapq.heapify(frontier)
+        best: list[tuple[float, int]] = []
+        scored: set[int] = set()
+        exhaustive = True
+        while frontier:
+            newest, doc, rank = frontier[0]
+            if rank < essential:
+                heapq.heappop(frontier)
+                continue
+            # No remaining item is newer, so none has a higher recency weight
+            recency = 1 + boost * math.exp(-decay * max(0.0, current_time + newest))
+            if len(best) == limit:
+                threshold = best[0][0]
+                if reachable[-1] * recency <= threshold:
+                    break
+                while reachable[essential] * recency <= threshold:
+                    essential += 1
+            if len(scored) == self._max_candidates:
+                exhaustive = False
+                break
+
+            collect(-doc, score(-doc, recency))
+            scored.add(-doc)
+            while frontier and frontier[0][1] == doc:
+                rank = heapq.heappop(frontier)[2]
+                cursor = cursors[rank]
+                postings = cursor[3]
+                position = cursor[2] = cursor[2] - 1
+                if position >= postings.start and rank >= essential:
+                    heapq.heappush(
+                        frontier, (-postings.times[position], -postings.docs[position], rank)
+                    )
+
+        if not exhaustive:
+            # Score every item containing the most selective terms, so that
+            # older items matching them are not crowded out by common terms
+            budget = self._max_candidates
+            for cursor in sorted(cursors, key=lambda cursor: len(cursor[3])):
+                postings = cursor[3]
+                budget -= len(postings)
+                if budget < 0:
+                    break
+                live = slice(postings.start, None)
+                for published_at, doc in zip(
+                    postings.times[live], postings.docs[live], strict=True
+                ):
+                    if doc not in scored:
+                        scored.add(doc)
+                        age = max(0.0, current_time - published_at)
+                        collect(doc, score(doc, 1 + boost * math.exp(-decay * age)))
+
+        best.sort(reverse=True)
+        hits = [SearchHit(documents[doc].item, value) for value, doc in best]
+        return SearchResults(hits, exhaustive)
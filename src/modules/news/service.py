@@ -1,18 +1,44 @@
 """News aggregation service."""
 
 import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Executor
+from dataclasses import replace
 from datetime import datetime
+from functools import partial
 
-from src.integrations.hackernews import fetch_hackernews_news
-from src.integrations.rss import fetch_rss_news
+import httpx
+
+from src.integrations.hackernews import HackerNewsItemCache, fetch_hackernews_news
+from src.integrations.http import create_http_client
+from src.integrations.rss import FeedValidatorStore, fetch_rss_news
+from src.modules.news.dedup import Deduplicator
 from src.modules.news.models import NewsItem, NewsResponse
+from src.modules.news.pagination import PageQuery, build_page_query, encode_cursor, item_key
+from src.modules.news.search import SearchIndex
+from src.modules.news.snapshot import EncodedNews, NewsSnapshot, encode_item_list
+from src.modules.news.store import NewsStore, url_hash
 from src.utils.cache import AsyncCache
-from src.utils.filtering import is_relevant_news
+from src.utils.filtering import NewsClassification, classify_news_batch
 from src.utils.logging import get_logger
 from src.utils.tagging import extract_tags
 
 logger = get_logger(__name__)
 
+# Maximum number of items a single request may ask for
+MAX_NEWS_LIMIT = 50
+
+# Number of items fetched per source for the shared pool (superset of any limit)
+NEWS_POOL_SIZE = MAX_NEWS_LIMIT
+
+# Cache key of the shared item pool
+NEWS_POOL_CACHE_KEY = "news_pool"
+
+# Number of newest stored items loaded into the snapshot when a store is used
+STORED_POOL_SIZE = 500
+
 
 class NewsService:
     """Service for aggregating and normalizing news from multiple sources."""
@@ -21,6 +47,13 @@ class NewsService:
         self,
         cache: AsyncCache,
         rss_feed_urls: list[str],
+        http_client: httpx.AsyncClient | None = None,
+        feed_parser: Executor | None = None,
+        hn_item_cache: HackerNewsItemCache | None = None,
+        fetch_budget_seconds: float | None = None,
+        store: NewsStore | None = None,
+        search_index: SearchIndex | None = None,
+        deduplicator: Deduplicator | None = None,
     ) -> None:
         """
         Initialize the news service.
@@ -28,16 +61,102 @@ class NewsService:
         Args:
             cache: Cache instance for storing aggregated results
             rss_feed_urls: List of RSS feed URLs to fetch
+            http_client: Shared HTTP client owned by the application lifespan.
+                If omitted, a short-lived client is created for each fetch.
+            feed_parser: Pool used to parse RSS feeds off the event loop
+                (defaults to the event loop's default thread pool)
+            hn_item_cache: Hacker News story details cache reused across
+                refreshes (defaults to one with default settings)
+            fetch_budget_seconds: Maximum time a refresh waits for the sources
+                before building the pool from those that answered (None or 0
+                waits for all of them). Only applies with a shared http_client.
+            store: Optional durable item store. Fetched items are written to it
+                and the pool is read back from it, so items outlive restarts
+                and the sources' own retention.
+            search_index: Full-text index of every ingested item (defaults to
+                one with default settings)
+            deduplicator: Merges copies of the same story from several
+                sources (defaults to one with default settings)
         """
         self._cache = cache
         self._rss_feed_urls = rss_feed_urls if isinstance(rss_feed_urls, list) else [rss_feed_urls]
+        self._http_client = http_client
+        self._feed_parser = feed_parser
+        # ETag / Last-Modified of each feed, for conditional requests
+        self._feed_validators = FeedValidatorStore()
+        self._hn_item_cache = hn_item_cache or HackerNewsItemCache()
+        self._fetch_budget_seconds = fetch_budget_seconds
+        self._store = store
+        self._search_index = search_index or SearchIndex()
+        self._deduplicator = deduplicator or Deduplicator()
+        # Duplicates merged by the last refresh
+        self._dedup_stats = {"url_duplicates": 0, "title_duplicates": 0}
+        # Fetches still running, possibly past the budget of the refresh that started them
+        self._source_tasks: dict[str, asyncio.Task] = {}
+        # Latest raw items of each source, standing in for sources that are late
+        self._source_results: dict[str, list[dict]] = {}
+        self._snapshot: NewsSnapshot | None = None
+
+    @property
+    def snapshot(self) -> NewsSnapshot | None:
+        """Latest snapshot built by refresh(), or None before the first refresh."""
+        return self._snapshot
+
+    def feed_stats(self) -> dict[str, int]:
+        """
+        Get RSS conditional request counters.
 
-    def _normalize_hackernews_item(self, item: dict) -> NewsItem | None:
+        Returns:
+            Dictionary with stored feed validators, full downloads and 304 responses
+        """
+        return self._feed_validators.stats()
+
+    def hackernews_stats(self) -> dict[str, int]:
+        """
+        Get Hacker News item cache counters.
+
+        Returns:
+            Dictionary with cached stories, hits, full fetches and score refreshes
+        """
+        return self._hn_item_cache.stats()
+
+    def search_stats(self) -> dict[str, int]:
+        """
+        Get full-text search index counters.
+
+        Returns:
+            Dictionary with indexed items and distinct terms
+        """
+        return self._search_index.stats()
+
+    def dedup_stats(self) -> dict[str, int]:
+        """
+        Get the cross-source deduplication counters of the last refresh.
+
+        Copies fetched again by every refresh are counted once per refresh,
+        not added up across refreshes.
+
+        Returns:
+            Dictionary with the items dropped as URL and as title duplicates
+        """
+        return dict(self._dedup_stats)
+
+    async def close(self) -> None:
+        """Cancel source fetches still running past their refresh's budget."""
+        tasks = list(self._source_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _normalize_hackernews_item(
+        self, item: dict, tags: list[str] | None = None
+    ) -> NewsItem | None:
         """
         Normalize a Hacker News story to NewsItem format.
 
         Args:
             item: Raw Hacker News story dictionary
+            tags: Tags already extracted for the item (extracted if omitted)
 
         Returns:
             Normalized NewsItem or None if conversion fails
@@ -71,19 +190,22 @@ class NewsService:
                 published_at=published_at,
                 score=item.get("score"),
                 comments_url=comments_url,
-                tags=extract_tags(title, url),
+                tags=tags if tags is not None else extract_tags(title, url),
             )
         except Exception as e:
             logger.warning(f"Failed to normalize Hacker News item: {e}")
             return None
 
-    def _normalize_rss_item(self, item: dict, index: int) -> NewsItem | None:
+    def _normalize_rss_item(
+        self, item: dict, index: int, tags: list[str] | None = None
+    ) -> NewsItem | None:
         """
         Normalize an RSS feed entry to NewsItem format.
 
         Args:
             item: Raw RSS feed entry dictionary
-            index: Index for generating unique ID
+            index: Position of the entry, for logging
+            tags: Tags already extracted for the item (extracted if omitted)
 
         Returns:
             Normalized NewsItem or None if conversion fails
@@ -99,111 +221,534 @@ class NewsService:
                 return None
 
             return NewsItem(
-                id=f"rss_{index}_{hash(url)}",
+                # Derived from the URL only, so an entry keeps its ID when the
+                # feed shifts or the process restarts
+                id=f"rss_{url_hash(url)}",
                 title=title,
                 url=url,
                 source="rss",
                 published_at=item.get("published_at", datetime.utcnow()),
                 score=None,
                 comments_url=None,
-                tags=extract_tags(title, url),
+                tags=tags if tags is not None else extract_tags(title, url),
             )
         except Exception as e:
             logger.warning(f"Failed to normalize RSS item: {e}")
             return None
 
-    async def _fetch_all_sources(self, limit: int) -> tuple[list[NewsItem], dict]:
+    @staticmethod
+    def _classify(raw_items: list[dict]) -> list[NewsClassification]:
         """
-        Fetch news from all sources concurrently.
+        Tag raw source items and decide their relevance before normalizing.
+
+        Irrelevant items are dropped without building a NewsItem, and the
+        tags of relevant ones are reused by normalization.
 
         Args:
-            limit: Maximum number of items per source
+            raw_items: Raw items with optional "title" and "url" keys
+
+        Returns:
+            Classification of each item, in input order
+        """
+        return classify_news_batch(
+            (item.get("title") or "", item.get("url") or "") for item in raw_items
+        )
+
+    async def _fetch_all_sources(self) -> tuple[list[NewsItem], dict]:
+        """
+        Fetch the shared item pool from all sources concurrently.
+
+        The pool does not depend on any request limit: every limit is served
+        by slicing the same pool.
+
+        Copies of the same story returned by several sources are merged
+        into one item. Every fetched item is also added to the search index,
+        where it stays after leaving the pool.
 
         Returns:
             Tuple of (list of normalized news items, metadata dict)
         """
-        meta: dict = {"failed_sources": []}
+        if self._http_client is not None:
+            items, meta = await self._fetch_with_client(
+                self._http_client, self._fetch_budget_seconds
+            )
+        else:
+            # Late sources cannot outlive a short-lived client, so wait for all of them
+            async with create_http_client() as client:
+                items, meta = await self._fetch_with_client(client)
+
+        deduplication = self._deduplicator.deduplicate(items)
+        self._dedup_stats = deduplication.stats()
+        self._search_index.add(deduplication.items)
+        self._search_index.discard(deduplication.dropped)
+        return deduplication.items, meta
+
+    def _source_fetchers(
+        self, client: httpx.AsyncClient
+    ) -> dict[str, Callable[[], Awaitable[list[dict]]]]:
+        """
+        Build the fetch call of every source, keyed by source name.
 
-        # Fetch from all sources concurrently
-        hn_task = asyncio.create_task(fetch_hackernews_news(limit * 2))  # Fetch more to filter
+        Args:
+            client: HTTP client shared by every integration call
 
-        # Fetch from all RSS feeds
-        rss_tasks = [
-            asyncio.create_task(fetch_rss_news(url, limit))
-            for url in self._rss_feed_urls
-        ]
+        Returns:
+            Mapping of "hackernews" and "rss_<feed index>" to their fetch call
+        """
+        fetchers: dict[str, Callable[[], Awaitable[list[dict]]]] = {
+            # Fetch more to filter
+            "hackernews": partial(
+                fetch_hackernews_news,
+                client,
+                NEWS_POOL_SIZE * 2,
+                item_cache=self._hn_item_cache,
+            ),
+        }
+        for feed_index, url in enumerate(self._rss_feed_urls):
+            fetchers[f"rss_{feed_index}"] = partial(
+                fetch_rss_news,
+                client,
+                url,
+                NEWS_POOL_SIZE,
+                parser_executor=self._feed_parser,
+                validators=self._feed_validators,
+            )
+        return fetchers
 
-        results = await asyncio.gather(
-            hn_task, *rss_tasks, return_exceptions=True
-        )
+    def _start_source(
+        self, source: str, fetch: Callable[[], Awaitable[list[dict]]]
+    ) -> asyncio.Task:
+        """
+        Start fetching a source, or join its fetch still running from a previous refresh.
+
+        Args:
+            source: Source name
+            fetch: Fetch call of the source
+
+        Returns:
+            Task resolving to the raw items of the source
+        """
+        task = self._source_tasks.get(source)
+        if task is None:
+            task = asyncio.create_task(fetch(), name=f"fetch-{source}")
+            self._source_tasks[source] = task
+            task.add_done_callback(partial(self._source_done, source))
+        return task
+
+    def _source_done(self, source: str, task: asyncio.Task) -> None:
+        """
+        Record the outcome of a source fetch.
 
-        hn_results = results[0]
-        rss_results_list = results[1:]
+        Runs for every fetch, including those that outlived their refresh's
+        budget, so their raw items are kept for the next refresh.
 
-        normalized_items: list[NewsItem] = []
+        Args:
+            source: Source name
+            task: Finished fetch task
+        """
+        if self._source_tasks.get(source) is task:
+            del self._source_tasks[source]
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if isinstance(result, list):
+            self._source_results[source] = result
+
+    def _normalize_source(self, source: str, raw_items: list[dict]) -> list[NewsItem]:
+        """
+        Classify and normalize the raw items of one source, dropping irrelevant ones.
 
-        # Process Hacker News results
-        if isinstance(hn_results, Exception):
-            logger.error(f"Hacker News fetch failed: {hn_results}")
-            meta["failed_sources"].append("hackernews")
-        elif isinstance(hn_results, list):
-            for item in hn_results:
-                normalized = self._normalize_hackernews_item(item)
-                if normalized and is_relevant_news(
-                    normalized.title, str(normalized.url), normalized.tags
-                ):
-                    normalized_items.append(normalized)
+        Args:
+            source: Source name ("hackernews" or "rss_<feed index>")
+            raw_items: Raw items returned by the source
+
+        Returns:
+            Relevant normalized items
+        """
+        classifications = self._classify(raw_items)
+        if source == "hackernews":
+            candidates = (
+                self._normalize_hackernews_item(item, classification.tags)
+                for item, classification in zip(raw_items, classifications, strict=True)
+                if classification.relevant
+            )
         else:
-            logger.warning(f"Unexpected Hacker News result type: {type(hn_results)}")
-            meta["failed_sources"].append("hackernews")
-
-        # Process RSS results from all feeds
-        for feed_index, rss_results in enumerate(rss_results_list):
-            feed_url = self._rss_feed_urls[feed_index] if feed_index < len(self._rss_feed_urls) else "unknown"
-            if isinstance(rss_results, Exception):
-                logger.error(f"RSS fetch failed for {feed_url}: {rss_results}")
-                meta["failed_sources"].append(f"rss_{feed_index}")
-            elif isinstance(rss_results, list):
-                for item_index, item in enumerate(rss_results):
-                    normalized = self._normalize_rss_item(item, feed_index * 1000 + item_index)
-                    if normalized and is_relevant_news(
-                        normalized.title, str(normalized.url), normalized.tags
-                    ):
-                        normalized_items.append(normalized)
+            feed_index = int(source.removeprefix("rss_"))
+            candidates = (
+                self._normalize_rss_item(item, feed_index * 1000 + item_index, classification.tags)
+                for item_index, (item, classification) in enumerate(
+                    zip(raw_items, classifications, strict=True)
+                )
+                if classification.relevant
+            )
+        return [item for item in candidates if item]
+
+    async def _fetch_with_client(
+        self, client: httpx.AsyncClient, budget_seconds: float | None = None
+    ) -> tuple[list[NewsItem], dict]:
+        """
+        Fetch the shared item pool from all sources using the given HTTP client.
+
+        With a latency budget, sources still running when it runs out are
+        reported in ``meta.late_sources`` and left running in the background:
+        they warm the feed validator and Hacker News item caches, and their
+        items are used by the next refresh. Meanwhile the items they returned
+        last time, if any, stand in for them.
+
+        Args:
+            client: HTTP client shared by every integration call
+            budget_seconds: Maximum time to wait for the sources (None waits
+                for all of them)
+
+        Returns:
+            Tuple of (list of normalized news items, metadata dict)
+        """
+        meta: dict = {"failed_sources": [], "late_sources": []}
+
+        # Fetch from all sources concurrently
+        tasks = {
+            source: self._start_source(source, fetch)
+            for source, fetch in self._source_fetchers(client).items()
+        }
+        done, _ = await asyncio.wait(tasks.values(), timeout=budget_seconds or None)
+
+        normalized_items: list[NewsItem] = []
+        for source, task in tasks.items():
+            if task not in done:
+                logger.warning(f"Source {source} exceeded the {budget_seconds}s fetch budget")
+                meta["late_sources"].append(source)
+                results = self._source_results.get(source)
+                if results is None:
+                    continue
+            elif task.exception() is not None:
+                logger.error(f"Fetch failed for source {source}: {task.exception()}")
+                meta["failed_sources"].append(source)
+                continue
             else:
-                logger.warning(f"Unexpected RSS result type for {feed_url}: {type(rss_results)}")
-                meta["failed_sources"].append(f"rss_{feed_index}")
+                results = task.result()
+                if not isinstance(results, list):
+                    logger.warning(f"Unexpected result type for source {source}: {type(results)}")
+                    meta["failed_sources"].append(source)
+                    continue
+            normalized_items.extend(self._normalize_source(source, results))
 
         return normalized_items, meta
 
-    async def get_latest_news(self, limit: int = 20) -> NewsResponse:
+    @staticmethod
+    def _sort_items(items: list[NewsItem]) -> None:
         """
-        Get the latest news items from all sources.
+        Sort items in place by published_at descending (newest first), then
+        by ID descending, the order pages are cut in.
+
+        Args:
+            items: Items to sort
+        """
+        try:
+            items.sort(key=item_key, reverse=True)
+        except Exception as e:
+            logger.error(f"Failed to sort items: {e}")
+            # Continue with unsorted items
 
-        Results are cached and sorted by published_at descending.
+    async def _build_snapshot(self) -> NewsSnapshot:
+        """
+        Fetch the shared item pool and build a sorted snapshot from it.
+
+        Returns:
+            New snapshot
+
+        Raises:
+            Exception: If fetching from the sources fails entirely
+        """
+        items, meta = await self._fetch_all_sources()
+        if self._store is not None:
+            try:
+                await self._store.upsert(items)
+                items = await self._merge_stored_duplicates(
+                    await self._store.latest(STORED_POOL_SIZE)
+                )
+            except Exception as e:
+                # Serve the fetched items even if the store is unavailable
+                logger.error(f"Failed to update news store: {e}")
+        self._sort_items(items)
+        snapshot = NewsSnapshot(items=items, meta=meta)
+        # Index while refreshing so filtered requests never pay for it
+        snapshot.index()
+        return snapshot
+
+    async def _merge_stored_duplicates(self, items: list[NewsItem]) -> list[NewsItem]:
+        """
+        Merge duplicates among stored items, in the store and search index too.
+
+        A story stored by an earlier refresh may come back from another
+        source later, after the fetched items were deduplicated.
 
         Args:
-            limit: Maximum number of items to return (max 50)
+            items: Items read from the store, newest first
 
         Returns:
-            NewsResponse with items and metadata
+            Deduplicated items, newest first
         """
-        # Enforce max limit
-        limit = min(limit, 50)
+        deduplication = self._deduplicator.deduplicate(items)
+        for name, count in deduplication.stats().items():
+            self._dedup_stats[name] += count
+        if deduplication.dropped:
+            await self._store.upsert(deduplication.merged)
+            await self._store.delete(deduplication.dropped)
+            self._search_index.add(deduplication.merged)
+            self._search_index.discard(deduplication.dropped)
+        return deduplication.items
+
+    async def restore(self) -> NewsSnapshot | None:
+        """
+        Seed the shared pool with the items of the store.
 
-        # Check cache (fail gracefully if cache fails)
-        cache_key = f"news_limit_{limit}"
+        Called at startup so a restarted process serves the last known items
+        right away instead of waiting for its first fetch. The restored
+        snapshot keeps the time of the last store write, so its age and
+        staleness are reported truthfully, and it is flagged with
+        ``meta.restored_from_store``. A pool already in the cache (e.g.
+        shared with other workers) is left untouched. Duplicates among the
+        stored items are merged, and every stored item is made searchable in
+        either case.
+
+        Returns:
+            Restored snapshot, or None if there was nothing to restore
+        """
+        if self._store is None:
+            return None
         try:
-            cached = await self._cache.get(cache_key)
-            if cached is not None:
-                logger.debug(f"Returning cached news for limit={limit}")
+            stats = await self._store.stats()
+            stored = await self._merge_stored_duplicates(
+                await self._store.latest(stats["items"])
+            )
+        except Exception as e:
+            logger.error(f"Failed to read news store: {e}")
+            return None
+        self._search_index.add(stored)
+        if not stored or await self._cache.get(NEWS_POOL_CACHE_KEY) is not None:
+            return None
+
+        items = stored[:STORED_POOL_SIZE]
+
+        snapshot = NewsSnapshot(
+            items=items,
+            meta={"failed_sources": [], "late_sources": [], "restored_from_store": True},
+            fetched_at=stats["updated_at"],
+        )
+        snapshot.index()
+        await self._cache.set(NEWS_POOL_CACHE_KEY, snapshot)
+        logger.info(f"Restored {len(items)} news items from the store")
+        return snapshot
+
+    async def _refresh_snapshot(self) -> NewsSnapshot:
+        """
+        Get a newer pool than the current snapshot, fetching it if needed.
+
+        The pool is recomputed through the cache so that it is shared with
+        on-demand requests. When the cache is shared between worker
+        processes, a pool already refreshed by another worker is adopted
+        instead of fetching the upstreams again.
+
+        Returns:
+            New snapshot
+        """
+        if self._cache.shared:
+            cached = await self._cache.get(NEWS_POOL_CACHE_KEY)
+            if (
+                cached is not None
+                and not cached.meta.get("restored_from_store")
+                and (self._snapshot is None or cached.fetched_at > self._snapshot.fetched_at)
+            ):
+                # Fetched by another worker, so not indexed here yet
+                self._search_index.add(cached.items)
                 return cached
+        return await self._cache.refresh(NEWS_POOL_CACHE_KEY, self._build_snapshot)
+
+    async def refresh(self) -> NewsSnapshot | None:
+        """
+        Fetch the full item pool from all sources and replace the snapshot.
+
+        If the fetch fails entirely, the previous items are kept and only the
+        snapshot metadata is updated with the failure.
+
+        Returns:
+            The current snapshot (None if no refresh has ever succeeded)
+        """
+        try:
+            snapshot = await self._refresh_snapshot()
         except Exception as e:
-            logger.warning(f"Cache read failed, continuing without cache: {e}")
+            logger.error(f"Failed to refresh news snapshot: {e}")
+            failure_meta = {"failed_sources": ["all"], "error": str(e)}
+            if self._snapshot is not None:
+                self._snapshot = replace(self._snapshot, meta=failure_meta)
+            return self._snapshot
+
+        self._snapshot = snapshot
+        logger.info(
+            f"Refreshed news snapshot: {len(snapshot.items)} items, "
+            f"failed sources: {snapshot.meta.get('failed_sources', [])}"
+        )
+        return self._snapshot
+
+    def _snapshot_meta(self, snapshot: NewsSnapshot) -> dict:
+        """
+        Build the per-request metadata of a snapshot.
+
+        Args:
+            snapshot: Snapshot being served
+
+        Returns:
+            Snapshot metadata with its age and staleness
+        """
+        age = snapshot.age_seconds()
+        meta = dict(snapshot.meta)
+        meta["snapshot_age_seconds"] = round(age, 3)
+        # Older than the cache TTL means it is being served while revalidating
+        meta["served_stale"] = age >= self._cache.ttl_seconds
+        return meta
+
+    async def _locate_page(
+        self, snapshot: NewsSnapshot, query: PageQuery
+    ) -> tuple[Sequence[int], list[NewsItem]]:
+        """
+        Find the items of a page in the snapshot, then in the store past its end.
+
+        Filtered pages are answered from the snapshot's inverted index, then
+        continue with the matching stored items.
 
-        # Fetch from all sources
+        Args:
+            snapshot: Snapshot to read from
+            query: Page bounds and filters
+
+        Returns:
+            Tuple of (positions of the snapshot items, older items read from
+            the store)
+        """
+        positions, open_ended = snapshot.page_positions(query)
+        missing = query.limit - len(positions)
+        if self._store is None or missing <= 0 or not open_ended:
+            return positions, []
+
+        # Continue strictly after the snapshot's oldest item so nothing is repeated
+        after = query.after
+        if snapshot.items:
+            oldest = item_key(snapshot.items[-1])
+            after = oldest if after is None else min(after, oldest)
         try:
-            items, meta = await self._fetch_all_sources(limit)
+            older = await self._store.page(query._replace(limit=missing, after=after))
+        except Exception as e:
+            logger.error(f"Failed to read news store: {e}")
+            older = []
+        return positions, older
+
+    @staticmethod
+    def _next_cursor(
+        snapshot: NewsSnapshot, query: PageQuery, positions: Sequence[int], older: list[NewsItem]
+    ) -> str | None:
+        """
+        Build the cursor of the page following a full page.
+
+        Args:
+            snapshot: Snapshot the page was read from
+            query: Page bounds
+            positions: Positions of the snapshot items of the page
+            older: Items of the page read from the store
+
+        Returns:
+            Opaque cursor, or None if the page is not full
+        """
+        if len(positions) + len(older) < query.limit:
+            return None
+        last = older[-1] if older else snapshot.items[positions[-1]]
+        return encode_cursor(item_key(last))
+
+    async def _response_from_snapshot(
+        self, snapshot: NewsSnapshot, query: PageQuery
+    ) -> NewsResponse:
+        """
+        Build a response from a snapshot without touching any upstream.
+
+        Args:
+            snapshot: Snapshot to read from
+            query: Page bounds and filters
+
+        Returns:
+            NewsResponse with the page items and snapshot metadata
+        """
+        positions, older = await self._locate_page(snapshot, query)
+        items = [snapshot.items[position] for position in positions] + older
+        meta = self._snapshot_meta(snapshot)
+        meta["next_cursor"] = self._next_cursor(snapshot, query, positions, older)
+        return NewsResponse(items=items, meta=meta)
+
+    async def _current_snapshot(self) -> NewsSnapshot:
+        """
+        Get the snapshot to serve requests from.
+
+        Returns the warm snapshot maintained by the background refresher when
+        there is one; otherwise reads the shared pool from cache, coalescing
+        concurrent misses into a single fetch.
+
+        Returns:
+            Snapshot to serve
+
+        Raises:
+            Exception: If the pool is not cached and fetching it fails
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        return await self._cache.get_or_compute(NEWS_POOL_CACHE_KEY, self._build_snapshot)
+
+    async def get_latest_news(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        tags: Sequence[str] | None = None,
+        source: str | None = None,
+        q: str | None = None,
+    ) -> NewsResponse:
+        """
+        Get the latest news items from all sources.
+
+        Served from the in-memory snapshot when the background refresher has
+        built one; otherwise the shared item pool is fetched on demand,
+        coalescing concurrent cache misses into a single fetch, and cached
+        once for every limit. Stale pools are served while they are
+        revalidated in the background (``meta.served_stale``). Items are
+        sorted by published_at descending, then ID descending.
+
+        Full pages carry ``meta.next_cursor``; passing it back as ``cursor``
+        returns the following (older) items. Pages past the end of the
+        snapshot are read from the item store, if any. Tag, source and text
+        filters are answered from the snapshot's inverted index, then from
+        the store.
+
+        Args:
+            limit: Maximum number of items to return (max 50)
+            cursor: Cursor returned with the previous page
+            since: Only return items published after this time
+            until: Only return items published at or before this time
+            tags: Only return items having all of these tags (comma-separated
+                values are split)
+            source: Only return items from this source
+            q: Only return items whose title contains every word of this text
+
+        Returns:
+            NewsResponse with items and metadata
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        # Enforce max limit
+        query = build_page_query(
+            min(limit, MAX_NEWS_LIMIT), cursor, since, until, tags=tags, source=source, q=q
+        )
+
+        try:
+            snapshot = await self._current_snapshot()
         except Exception as e:
             logger.error(f"Failed to fetch news from sources: {e}")
             # Return empty response rather than failing completely
@@ -212,23 +757,110 @@ class NewsService:
                 meta={"failed_sources": ["all"], "error": str(e)}
             )
 
-        # Sort by published_at descending
-        try:
-            items.sort(key=lambda x: x.published_at, reverse=False)
-        except Exception as e:
-            logger.error(f"Failed to sort items: {e}")
-            # Continue with unsorted items
+        return await self._response_from_snapshot(snapshot, query)
 
-        # Apply limit after sorting
-        items = items[:limit]
+    async def get_latest_news_json(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        tags: Sequence[str] | None = None,
+        source: str | None = None,
+        q: str | None = None,
+    ) -> EncodedNews:
+        """
+        Get the latest news as a pre-serialized JSON body.
 
-        # Create response
-        response = NewsResponse(items=items, meta=meta)
+        Same content as get_latest_news, but each item is encoded once per
+        snapshot, and the item list of the newest page is memoized per limit
+        together with its ETag, so cache hits skip model validation and
+        serialization.
+
+        Args:
+            limit: Maximum number of items to return (max 50)
+            cursor: Cursor returned with the previous page
+            since: Only return items published after this time
+            until: Only return items published at or before this time
+            tags: Only return items having all of these tags (comma-separated
+                values are split)
+            source: Only return items from this source
+            q: Only return items whose title contains every word of this text
+
+        Returns:
+            EncodedNews with the JSON body, its ETag and cache lifetimes
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        # Enforce max limit
+        query = build_page_query(
+            min(limit, MAX_NEWS_LIMIT), cursor, since, until, tags=tags, source=source, q=q
+        )
 
-        # Cache the response (fail gracefully if cache fails)
         try:
-            await self._cache.set(cache_key, response)
+            snapshot = await self._current_snapshot()
         except Exception as e:
-            logger.warning(f"Cache write failed: {e}")
+            logger.error(f"Failed to fetch news from sources: {e}")
+            # Return empty response rather than failing completely
+            response = NewsResponse(items=[], meta={"failed_sources": ["all"], "error": str(e)})
+            return EncodedNews(body=response.model_dump_json().encode())
+
+        positions, older = await self._locate_page(snapshot, query)
+        if query.is_first_page and not older:
+            items_json, etag = snapshot.encoded_items(query.limit)
+        else:
+            items_json, etag = encode_item_list(
+                snapshot.item_json(positions)
+                + [item.model_dump_json().encode() for item in older],
+                snapshot.meta,
+            )
+        meta = self._snapshot_meta(snapshot)
+        meta["next_cursor"] = self._next_cursor(snapshot, query, positions, older)
+        meta_json = json.dumps(meta, separators=(",", ":")).encode()
+        return EncodedNews(
+            body=b'{"items":' + items_json + b',"meta":' + meta_json + b"}",
+            etag=etag,
+            # Downstream caches may keep the body until the pool itself expires
+            max_age=max(0, int(self._cache.ttl_seconds - meta["snapshot_age_seconds"])),
+            stale_while_revalidate=self._cache.stale_ttl_seconds,
+        )
+
+    async def search(self, q: str, limit: int = 20) -> NewsResponse:
+        """
+        Search every item ingested so far, including those no longer in the pool.
+
+        Items are ranked by BM25 relevance of their title, URL and tags to
+        the query, weighted by recency. Without a background refresher, the
+        pool is fetched first if it is not cached, so that a cold process has
+        items to search.
 
-        return response
+        Args:
+            q: Free text query (items matching any of its words are returned)
+            limit: Maximum number of items to return (max 50)
+
+        Returns:
+            NewsResponse with the best matches first; ``meta.scores`` holds
+            their ranking scores and ``meta.exhaustive`` is False when the
+            query was too broad for every match to be ranked
+        """
+        if self._snapshot is None:
+            try:
+                await self._current_snapshot()
+            except Exception as e:
+                # Search whatever was indexed before
+                logger.error(f"Failed to fetch news from sources: {e}")
+
+        started = time.perf_counter()
+        results = self._search_index.search(q, min(limit, MAX_NEWS_LIMIT))
+        took_ms = (time.perf_counter() - started) * 1000
+        return NewsResponse(
+            items=[hit.item for hit in results.hits],
+            meta={
+                "query": q,
+                "scores": [round(hit.score, 4) for hit in results.hits],
+                "exhaustive": results.exhaustive,
+                "indexed_items": len(self._search_index),
+                "took_ms": round(took_ms, 3),
+            },
+        )
@@ -0,0 +1,204 @@
+"""In-memory snapshot of the aggregated news pool."""
+
+import bisect
+import hashlib
+import json
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from src.modules.news.index import NewsIndex
+from src.modules.news.models import NewsItem
+from src.modules.news.pagination import ItemKey, PageQuery, item_key
+
+
+def encode_item_list(item_json: list[bytes], meta: dict) -> tuple[bytes, str]:
+    """
+    Join encoded items into a JSON array and derive its weak ETag.
+
+    The ETag is weak because the response body also carries per-request
+    metadata (snapshot age, staleness, next cursor) that it does not cover:
+    bodies sharing it are equivalent, not byte-identical.
+
+    Args:
+        item_json: JSON encoding of each item
+        meta: Metadata the ETag also depends on
+
+    Returns:
+        Tuple of (JSON bytes of the item list, weak ETag)
+    """
+    items_json = b"[" + b",".join(item_json) + b"]"
+    digest = hashlib.blake2b(items_json, digest_size=16)
+    digest.update(json.dumps(meta, sort_keys=True, default=str).encode())
+    return items_json, f'W/"{digest.hexdigest()}"'
+
+
+@dataclass(frozen=True)
+class EncodedNews:
+    """
+    Pre-serialized /news response body with its HTTP caching metadata.
+
+    ``max_age`` and ``stale_while_revalidate`` are the seconds for which
+    downstream caches may serve the body fresh and then stale.
+    """
+
+    body: bytes
+    etag: str | None = None
+    max_age: int = 0
+    stale_while_revalidate: int = 0
+
+
+@dataclass(frozen=True)
+class NewsSnapshot:
+    """
+    Immutable result of one aggregation run.
+
+    Items are sorted by published_at descending, then ID descending, so any
+    limit can be served by slicing and any page (cursor, since/until) by
+    binary search on their sort keys. A new snapshot replaces the previous
+    one atomically.
+
+    The JSON encoding of each item is computed once per snapshot, and the
+    encoded item list and ETag of each limit are memoized, so serving a
+    request does not re-validate or re-serialize any model. The ETag is
+    derived from the snapshot content (items and refresh metadata), so it
+    only changes when a refresh produces different data.
+    """
+
+    items: list[NewsItem]
+    meta: dict = field(default_factory=dict)
+    fetched_at: float = field(default_factory=time.time)
+    _item_json: list[bytes] = field(default_factory=list, init=False, repr=False, compare=False)
+    _encoded: dict[int, tuple[bytes, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Sort keys in ascending order (the reverse of the item order)
+    _ascending_keys: list[ItemKey] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Inverted index of the items, built once
+    _index: list[NewsIndex] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def age_seconds(self, now: float | None = None) -> float:
+        """
+        Get the age of the snapshot.
+
+        Args:
+            now: Reference timestamp (defaults to the current time)
+
+        Returns:
+            Seconds elapsed since the snapshot was fetched
+        """
+        current_time = time.time() if now is None else now
+        return max(0.0, current_time - self.fetched_at)
+
+    def index(self) -> NewsIndex:
+        """
+        Get the inverted index of the items, building it on first use.
+
+        Returns:
+            Tag, source and title-token index of the items
+        """
+        if not self._index:
+            self._index.append(NewsIndex.build(self.items))
+        return self._index[0]
+
+    def item_json(self, positions: Sequence[int]) -> list[bytes]:
+        """
+        Get the JSON encoding of some items, encoding every item once.
+
+        Args:
+            positions: Positions of the items
+
+        Returns:
+            JSON bytes of each item, in the given order
+        """
+        if len(self._item_json) != len(self.items):
+            self._item_json[:] = [item.model_dump_json().encode() for item in self.items]
+        if isinstance(positions, range) and positions.step == 1:
+            return self._item_json[positions.start : positions.stop]
+        return [self._item_json[position] for position in positions]
+
+    def encoded_items(self, limit: int) -> tuple[bytes, str]:
+        """
+        Get the JSON array of the newest items and its weak ETag.
+
+        Args:
+            limit: Maximum number of items
+
+        Returns:
+            Tuple of (JSON bytes of the item list, weak ETag)
+        """
+        encoded = self._encoded.get(limit)
+        if encoded is None:
+            encoded = encode_item_list(self.item_json(range(limit)), self.meta)
+            self._encoded[limit] = encoded
+        return encoded
+
+    def _window(self, query: PageQuery) -> tuple[int, int]:
+        """
+        Find the range of items within the query's cursor and time bounds.
+
+        Args:
+            query: Page bounds
+
+        Returns:
+            Tuple of (index of the first item in bounds, index after the last)
+        """
+        count = len(self.items)
+        if len(self._ascending_keys) != count:
+            self._ascending_keys[:] = [item_key(item) for item in reversed(self.items)]
+        keys = self._ascending_keys
+
+        start = 0
+        if query.after is not None:
+            start = count - bisect.bisect_left(keys, query.after)
+        if query.until is not None:
+            newer_than_until = count - bisect.bisect_right(
+                keys, query.until, key=lambda key: key.published_at
+            )
+            start = max(start, newer_than_until)
+
+        end = count
+        if query.since is not None:
+            end = count - bisect.bisect_right(keys, query.since, key=lambda key: key.published_at)
+        return start, max(start, end)
+
+    def page_bounds(self, query: PageQuery) -> tuple[int, int, bool]:
+        """
+        Locate a page of items in O(log n), ignoring the query's filters.
+
+        Args:
+            query: Page bounds
+
+        Returns:
+            Tuple of (start index, stop index, whether items older than the
+            snapshot's oldest one could still match the query)
+        """
+        start, end = self._window(query)
+        return start, min(start + query.limit, end), end == len(self.items)
+
+    def page_positions(self, query: PageQuery) -> tuple[Sequence[int], bool]:
+        """
+        Locate a page of items matching the query's bounds and filters.
+
+        Unfiltered pages are a contiguous range. Filtered pages intersect
+        the inverted index postings and binary-search the bounds in the
+        result, without scanning the items.
+
+        Args:
+            query: Page bounds and filters
+
+        Returns:
+            Tuple of (positions of the page items, whether items older than
+            the snapshot's oldest one could still match the query)
+        """
+        if not query.filtered:
+            start, stop, open_ended = self.page_bounds(query)
+            return range(start, stop), open_ended
+
+        start, end = self._window(query)
+        matches = self.index().match(query.tags, query.source, query.terms)
+        first = bisect.bisect_left(matches, start)
+        last = bisect.bisect_left(matches, end, lo=first)
+        return matches[first : min(last, first + query.limit)], end == len(self.items)
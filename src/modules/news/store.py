@@ -0,0 +1,319 @@
+"""Durable SQLite store of normalized news items."""
+
+import asyncio
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Sequence
+
+from src.modules.news.models import NewsItem
+from src.modules.news.pagination import PageQuery
+from src.utils.logging import get_logger
+from src.utils.tagging import tokenize
+
+logger = get_logger(__name__)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS news_items ("
+    " id TEXT PRIMARY KEY,"
+    " url_hash TEXT NOT NULL,"
+    " source TEXT NOT NULL,"
+    " published_at REAL NOT NULL,"
+    " data TEXT NOT NULL,"
+    " updated_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_news_items_published_at"
+    " ON news_items (published_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_news_items_source ON news_items (source, published_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_news_items_url_hash ON news_items (url_hash)",
+    "CREATE TABLE IF NOT EXISTS news_item_tags ("
+    " tag TEXT NOT NULL,"
+    " published_at REAL NOT NULL,"
+    " item_id TEXT NOT NULL,"
+    " PRIMARY KEY (tag, published_at, item_id))",
+    "CREATE INDEX IF NOT EXISTS idx_news_item_tags_item_id ON news_item_tags (item_id)",
+)
+
+# Statements are constant strings so sqlite3's per-connection statement
+# cache prepares each of them once
+_UPSERT_ITEM = (
+    "INSERT INTO news_items (id, url_hash, source, published_at, data, updated_at)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT(id) DO UPDATE SET url_hash = excluded.url_hash,"
+    " source = excluded.source, published_at = excluded.published_at,"
+    " data = excluded.data, updated_at = excluded.updated_at"
+)
+_SELECT_SAME_URL = "SELECT id FROM news_items WHERE url_hash = ? AND source = ? AND id != ?"
+_DELETE_ITEM_TAGS = "DELETE FROM news_item_tags WHERE item_id = ?"
+_DELETE_ITEM = "DELETE FROM news_items WHERE id = ?"
+_INSERT_TAG = "INSERT OR IGNORE INTO news_item_tags (tag, published_at, item_id) VALUES (?, ?, ?)"
+_SELECT_PRUNED = "SELECT id FROM news_items ORDER BY published_at DESC, id DESC LIMIT -1 OFFSET ?"
+_SELECT_LATEST = "SELECT data FROM news_items ORDER BY published_at DESC, id DESC LIMIT ?"
+_SELECT_PAGE = (
+    "SELECT published_at, id, data FROM news_items"
+    " WHERE (published_at, id) < (?, ?)"
+    " AND published_at > ? AND published_at <= ?"
+    " ORDER BY published_at DESC, id DESC LIMIT ?"
+)
+_SELECT_PAGE_BY_SOURCE = (
+    "SELECT published_at, id, data FROM news_items"
+    " WHERE source = ? AND (published_at, id) < (?, ?)"
+    " AND published_at > ? AND published_at <= ?"
+    " ORDER BY published_at DESC, id DESC LIMIT ?"
+)
+# Source is optional here (NULL matches every source): the tag drives the scan
+_SELECT_PAGE_BY_TAG = (
+    "SELECT news_item_tags.published_at, news_item_tags.item_id, news_items.data"
+    " FROM news_item_tags JOIN news_items ON news_items.id = news_item_tags.item_id"
+    " WHERE news_item_tags.tag = ? AND (? IS NULL OR news_items.source = ?)"
+    " AND (news_item_tags.published_at, news_item_tags.item_id) < (?, ?)"
+    " AND news_item_tags.published_at > ? AND news_item_tags.published_at <= ?"
+    " ORDER BY news_item_tags.published_at DESC, news_item_tags.item_id DESC LIMIT ?"
+)
+# Rows read per batch when a page is filtered on tags or title words
+_FILTERED_PAGE_BATCH = 200
+_SELECT_STATS = "SELECT COUNT(*), MAX(updated_at) FROM news_items"
+
+
+def url_hash(url: str) -> str:
+    """
+    Hash a URL into a short, process-independent key.
+
+    Args:
+        url: Item URL
+
+    Returns:
+        Hex digest of the URL
+    """
+    return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+
+
+class NewsStore:
+    """
+    SQLite store of normalized news items, in WAL mode.
+
+    Items are upserted by ID after every refresh and read back newest first,
+    in pages optionally restricted to a source or a tag through indexed
+    queries, so a restarted process can serve the last known items before
+    its first refresh completes. An item stored again under another ID with the same
+    URL and source replaces the previous row. Only the newest
+    ``max_items`` items are kept. Blocking SQLite calls run in a worker
+    thread so they never stall the event loop.
+    """
+
+    def __init__(self, path: str, max_items: int | None = 10000) -> None:
+        """
+        Open the store and create the schema if needed.
+
+        Args:
+            path: Path of the SQLite database file
+            max_items: Maximum number of items kept (None for unbounded);
+                the oldest published items are dropped first
+        """
+        self._path = path
+        self._max_items = max_items
+        self._conn_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+
+    def _upsert_sync(self, items: Sequence[NewsItem]) -> None:
+        """Blocking implementation of upsert."""
+        now = time.time()
+        rows = [
+            (
+                item.id,
+                url_hash(str(item.url)),
+                item.source,
+                item.published_at.timestamp(),
+                item.model_dump_json(),
+                now,
+            )
+            for item in items
+        ]
+        with self._conn_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for item, row in zip(items, rows, strict=True):
+                    self._conn.execute(_UPSERT_ITEM, row)
+                    self._delete_rows(
+                        self._conn.execute(_SELECT_SAME_URL, (row[1], row[2], row[0])).fetchall()
+                    )
+                    self._conn.execute(_DELETE_ITEM_TAGS, (item.id,))
+                    self._conn.executemany(
+                        _INSERT_TAG, [(tag, row[3], item.id) for tag in item.tags]
+                    )
+                if self._max_items is not None:
+                    self._delete_rows(
+                        self._conn.execute(_SELECT_PRUNED, (self._max_items,)).fetchall()
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _delete_rows(self, rows: Sequence[tuple[str]]) -> None:
+        """
+        Delete items and their tags, within the caller's transaction.
+
+        Args:
+            rows: Single-column rows holding the IDs of the items to delete
+        """
+        self._conn.executemany(_DELETE_ITEM, rows)
+        self._conn.executemany(_DELETE_ITEM_TAGS, rows)
+
+    def _delete_sync(self, item_ids: Sequence[str]) -> None:
+        """Blocking implementation of delete."""
+        with self._conn_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._delete_rows([(item_id,) for item_id in item_ids])
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _latest_sync(self, limit: int) -> list[NewsItem]:
+        """Blocking implementation of latest."""
+        return self._fetch_items(_SELECT_LATEST, (limit,))
+
+    def _page_sync(self, query: PageQuery) -> list[NewsItem]:
+        """Blocking implementation of page."""
+        bounds = (
+            -math.inf if query.since is None else query.since,
+            math.inf if query.until is None else query.until,
+        )
+        if query.tags:
+            sql, prefix = _SELECT_PAGE_BY_TAG, (query.tags[0], query.source, query.source)
+        elif query.source is not None:
+            sql, prefix = _SELECT_PAGE_BY_SOURCE, (query.source,)
+        else:
+            sql, prefix = _SELECT_PAGE, ()
+        # Other tags and title words are checked on the rows read
+        tags = set(query.tags[1:])
+        terms = set(query.terms)
+        batch = query.limit if not tags and not terms else max(query.limit, _FILTERED_PAGE_BATCH)
+
+        after = query.after or (math.inf, "")
+        items: list[NewsItem] = []
+        while True:
+            with self._conn_lock:
+                rows = self._conn.execute(sql, (*prefix, *after, *bounds, batch)).fetchall()
+            for item in self._decode(data for _, _, data in rows):
+                if tags.issubset(item.tags) and terms.issubset(tokenize(item.title)):
+                    items.append(item)
+                    if len(items) == query.limit:
+                        return items
+            if len(rows) < batch:
+                return items
+            after = rows[-1][:2]
+
+    def _fetch_items(self, sql: str, params: tuple) -> list[NewsItem]:
+        """
+        Run a query selecting item data and decode the items.
+
+        Args:
+            sql: Query selecting a single data column
+            params: Query parameters
+
+        Returns:
+            Decoded items in query order (unreadable rows are skipped)
+        """
+        with self._conn_lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return self._decode(data for (data,) in rows)
+
+    @staticmethod
+    def _decode(rows: Iterable[str]) -> list[NewsItem]:
+        """
+        Decode stored item data.
+
+        Args:
+            rows: JSON data of the items
+
+        Returns:
+            Decoded items in order (unreadable rows are skipped)
+        """
+        items = []
+        for data in rows:
+            try:
+                items.append(NewsItem.model_validate_json(data))
+            except ValueError as e:
+                logger.warning(f"Skipping unreadable stored news item: {e}")
+        return items
+
+    def _stats_sync(self) -> dict:
+        """Blocking implementation of stats."""
+        with self._conn_lock:
+            count, updated_at = self._conn.execute(_SELECT_STATS).fetchone()
+        return {"items": count, "updated_at": updated_at}
+
+    async def upsert(self, items: Sequence[NewsItem]) -> None:
+        """
+        Insert or update items in a single transaction.
+
+        Args:
+            items: Normalized news items
+        """
+        if items:
+            await asyncio.to_thread(self._upsert_sync, list(items))
+
+    async def delete(self, item_ids: Sequence[str]) -> None:
+        """
+        Delete items by ID in a single transaction.
+
+        Args:
+            item_ids: IDs of the items to delete (unknown IDs are ignored)
+        """
+        if item_ids:
+            await asyncio.to_thread(self._delete_sync, list(item_ids))
+
+    async def latest(self, limit: int) -> list[NewsItem]:
+        """
+        Get the newest stored items.
+
+        Args:
+            limit: Maximum number of items
+
+        Returns:
+            Items sorted by published_at descending
+        """
+        return await asyncio.to_thread(self._latest_sync, limit)
+
+    async def page(self, query: PageQuery) -> list[NewsItem]:
+        """
+        Get a page of stored items with an index range scan.
+
+        Cost grows with the page size, not with how deep the page is. Pages
+        filtered on a tag scan that tag's index, those filtered on a source
+        only that source's items. Further tags and title words are checked
+        on the rows read, so such pages may read every older row when few
+        of them match.
+
+        Args:
+            query: Page bounds and filters
+
+        Returns:
+            Items sorted by published_at descending, then ID descending
+        """
+        return await asyncio.to_thread(self._page_sync, query)
+
+    async def stats(self) -> dict:
+        """
+        Get store counters.
+
+        Returns:
+            Dictionary with the number of stored items and the timestamp of
+            the last write (None when empty)
+        """
+        return await asyncio.to_thread(self._stats_sync)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._conn_lock:
+            self._conn.close()
@@ -3,10 +3,21 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from src.integrations.latency import HostLatencyTracker
+    from src.integrations.scheduler import FetchScheduler
     from src.modules.news.service import NewsService
+    from src.utils.cache import AsyncCache
+    from src.utils.loop_monitor import LoopLagMonitor
+    from src.utils.taxonomy import TaxonomyReloader
 
-# This will be set by main.py after initialization
+# These will be set by main.py after initialization
 _news_service = None
+_cache = None
+_taxonomy_reloader = None
+_loop_monitor = None
+_fetch_scheduler = None
+_latency_tracker = None
+_admin_token: str | None = None
 
 
 def set_news_service(service: "NewsService") -> None:  # type: ignore
@@ -35,3 +46,166 @@ def get_news_service() -> "NewsService":  # type: ignore
     if _news_service is None:
         raise RuntimeError("NewsService not initialized")
     return _news_service
+
+
+def set_cache(cache: "AsyncCache") -> None:  # type: ignore
+    """
+    Set the cache instance.
+
+    This is called during application startup.
+
+    Args:
+        cache: AsyncCache instance
+    """
+    global _cache
+    _cache = cache
+
+
+def get_cache() -> "AsyncCache":  # type: ignore
+    """
+    Dependency function to get the cache instance.
+
+    Returns:
+        AsyncCache instance
+
+    Raises:
+        RuntimeError: If the cache has not been initialized
+    """
+    if _cache is None:
+        raise RuntimeError("Cache not initialized")
+    return _cache
+
+
+def set_taxonomy_reloader(reloader: "TaxonomyReloader") -> None:  # type: ignore
+    """
+    Set the taxonomy reloader instance.
+
+    This is called during application startup.
+
+    Args:
+        reloader: TaxonomyReloader instance
+    """
+    global _taxonomy_reloader
+    _taxonomy_reloader = reloader
+
+
+def get_taxonomy_reloader() -> "TaxonomyReloader":  # type: ignore
+    """
+    Dependency function to get the taxonomy reloader instance.
+
+    Returns:
+        TaxonomyReloader instance
+
+    Raises:
+        RuntimeError: If the reloader has not been initialized
+    """
+    if _taxonomy_reloader is None:
+        raise RuntimeError("Taxonomy reloader not initialized")
+    return _taxonomy_reloader
+
+
+def set_loop_monitor(monitor: "LoopLagMonitor") -> None:  # type: ignore
+    """
+    Set the event loop lag monitor instance.
+
+    This is called during application startup.
+
+    Args:
+        monitor: LoopLagMonitor instance
+    """
+    global _loop_monitor
+    _loop_monitor = monitor
+
+
+def get_loop_monitor() -> "LoopLagMonitor":  # type: ignore
+    """
+    Dependency function to get the event loop lag monitor instance.
+
+    Returns:
+        LoopLagMonitor instance
+
+    Raises:
+        RuntimeError: If the monitor has not been initialized
+    """
+    if _loop_monitor is None:
+        raise RuntimeError("Loop monitor not initialized")
+    return _loop_monitor
+
+
+def set_fetch_scheduler(scheduler: "FetchScheduler") -> None:  # type: ignore
+    """
+    Set the fetch scheduler instance.
+
+    This is called during application startup.
+
+    Args:
+        scheduler: FetchScheduler instance
+    """
+    global _fetch_scheduler
+    _fetch_scheduler = scheduler
+
+
+def get_fetch_scheduler() -> "FetchScheduler":  # type: ignore
+    """
+    Dependency function to get the fetch scheduler instance.
+
+    Returns:
+        FetchScheduler instance
+
+    Raises:
+        RuntimeError: If the scheduler has not been initialized
+    """
+    if _fetch_scheduler is None:
+        raise RuntimeError("Fetch scheduler not initialized")
+    return _fetch_scheduler
+
+
+def set_latency_tracker(tracker: "HostLatencyTracker") -> None:  # type: ignore
+    """
+    Set the upstream latency tracker instance.
+
+    This is called during application startup.
+
+    Args:
+        tracker: HostLatencyTracker instance
+    """
+    global _latency_tracker
+    _latency_tracker = tracker
+
+
+def get_latency_tracker() -> "HostLatencyTracker":  # type: ignore
+    """
+    Dependency function to get the upstream latency tracker instance.
+
+    Returns:
+        HostLatencyTracker instance
+
+    Raises:
+        RuntimeError: If the tracker has not been initialized
+    """
+    if _latency_tracker is None:
+        raise RuntimeError("Latency tracker not initialized")
+    return _latency_tracker
+
+
+def set_admin_token(token: str | None) -> None:
+    """
+    Set the token required by the admin endpoints.
+
+    This is called during application startup.
+
+    Args:
+        token: Bearer token, or None to disable the admin endpoints
+    """
+    global _admin_token
+    _admin_token = token or None
+
+
+def get_admin_token() -> str | None:
+    """
+    Dependency function to get the token required by the admin endpoints.
+
+    Returns:
+        Bearer token, or None if the admin endpoints are disabled
+    """
+    return _admin_token
@@ -1,21 +1,58 @@
 """API route handlers."""
 
-from typing import Annotated
+import hmac
+from datetime import datetime
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import HTMLResponse, Response
 
+from src.integrations.latency import HostLatencyTracker
+from src.integrations.scheduler import FetchScheduler
 from src.modules.news.models import NewsResponse
 from src.modules.news.service import NewsService
-from src.server.dependencies import get_news_service
+from src.server.dependencies import (
+    get_admin_token,
+    get_cache,
+    get_fetch_scheduler,
+    get_latency_tracker,
+    get_loop_monitor,
+    get_news_service,
+    get_taxonomy_reloader,
+)
 from src.server.templates import HTML_TEMPLATE
+from src.utils.cache import AsyncCache
 from src.utils.logging import get_logger
+from src.utils.loop_monitor import LoopLagMonitor
+from src.utils.taxonomy import TaxonomyReloader
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an entity tag.
+
+    Uses the weak comparison required for If-None-Match, so ``W/`` prefixes
+    are ignored, and supports lists of tags and ``*``.
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current entity tag (quoted)
+
+    Returns:
+        True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
 @router.get("/", response_class=HTMLResponse)
 async def home() -> HTMLResponse:
     """
@@ -38,26 +75,122 @@ async def health_check() -> dict[str, bool]:
     return {"ok": True}
 
 
+@router.get("/stats")
+async def get_stats(
+    cache: AsyncCache = Depends(get_cache),
+    loop_monitor: LoopLagMonitor = Depends(get_loop_monitor),
+    news_service: NewsService = Depends(get_news_service),
+    scheduler: FetchScheduler = Depends(get_fetch_scheduler),
+) -> dict[str, dict]:
+    """
+    Runtime statistics endpoint.
+
+    Args:
+        cache: Injected cache instance
+        loop_monitor: Injected event loop lag monitor
+        news_service: Injected news service instance
+        scheduler: Injected upstream fetch scheduler
+
+    Returns:
+        Dictionary with cache counters (hits, misses, evictions, expirations),
+        event loop lag statistics, RSS conditional request counters,
+        Hacker News item cache counters, search index counters,
+        deduplication counters and fetch scheduler counters
+    """
+    return {
+        "cache": await cache.stats(),
+        "event_loop": loop_monitor.stats(),
+        "feeds": news_service.feed_stats(),
+        "hackernews": news_service.hackernews_stats(),
+        "search": news_service.search_stats(),
+        "dedup": news_service.dedup_stats(),
+        "scheduler": scheduler.stats(),
+    }
+
+
+@router.get("/stats/upstreams")
+async def get_upstream_stats(
+    latency_tracker: HostLatencyTracker = Depends(get_latency_tracker),
+) -> dict[str, dict]:
+    """
+    Per-host upstream latency statistics endpoint.
+
+    Args:
+        latency_tracker: Injected upstream latency tracker
+
+    Returns:
+        Mapping of upstream host to request, error, timeout and hedging
+        counters, p50/p95/p99 latency in milliseconds and current timeout
+    """
+    return latency_tracker.stats()
+
+
 @router.get("/news", response_model=NewsResponse)
 async def get_news(
     limit: Annotated[int, Query(ge=1, le=50, description="Number of news items to return")] = 20,
+    cursor: Annotated[
+        str | None, Query(description="meta.next_cursor of the previous page")
+    ] = None,
+    since: Annotated[
+        datetime | None, Query(description="Only items published after this time")
+    ] = None,
+    until: Annotated[
+        datetime | None, Query(description="Only items published at or before this time")
+    ] = None,
+    tags: Annotated[
+        list[str] | None,
+        Query(description="Only items having all of these tags (repeated or comma-separated)"),
+    ] = None,
+    source: Annotated[
+        Literal["hackernews", "rss"] | None, Query(description="Only items from this source")
+    ] = None,
+    q: Annotated[
+        str | None,
+        Query(max_length=200, description="Only items whose title contains every word"),
+    ] = None,
     news_service: NewsService = Depends(get_news_service),
-) -> NewsResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """
     Get latest tech news from aggregated sources.
 
+    The body is pre-serialized by the service and returned as-is, so it is
+    not validated against NewsResponse or re-encoded on every request.
+    Responses carry a weak ETag that only changes with the snapshot
+    content (not with the per-request snapshot age); a matching
+    If-None-Match gets an empty 304. Cache-Control lets
+    browsers, CDNs and reverse proxies reuse the body until the pool expires.
+
+    Pages are cut by keyset on (published_at, id): a full page carries
+    ``meta.next_cursor``, which returns the following older items when
+    passed back as ``cursor``. Tag, source and text filters are answered
+    from the snapshot's inverted index, and cursors page through the
+    filtered items, past the snapshot into the item store.
+
     Args:
         limit: Maximum number of news items to return (1-50, default 20)
+        cursor: Opaque cursor of the previous page
+        since: Only return items published after this time
+        until: Only return items published at or before this time
+        tags: Only return items having all of these tags
+        source: Only return items from this source
+        q: Only return items whose title contains every word of this text
         news_service: Injected news service instance
+        if_none_match: Entity tag(s) of the client's cached copy
 
     Returns:
-        NewsResponse with aggregated news items
+        JSON response matching NewsResponse, or 304 Not Modified
 
     Raises:
-        HTTPException: If the service fails to fetch news or is not initialized
+        HTTPException: If the cursor is invalid, or the service fails to fetch
+            news or is not initialized
     """
     try:
-        return await news_service.get_latest_news(limit=limit)
+        payload = await news_service.get_latest_news_json(
+            limit=limit, cursor=cursor, since=since, until=until, tags=tags, source=source, q=q
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except RuntimeError as e:
         # Service not initialized
         logger.error(f"Service initialization error: {e}")
@@ -72,3 +205,113 @@ async def get_news(
             status_code=500,
             detail="Failed to fetch news. Please try again later."
         ) from e
+
+    if payload.etag is None:
+        # Error payloads must not be cached downstream
+        return Response(
+            content=payload.body,
+            media_type="application/json",
+            headers={"Cache-Control": "no-store"},
+        )
+
+    headers = {
+        "ETag": payload.etag,
+        "Cache-Control": (
+            f"public, max-age={payload.max_age}, "
+            f"stale-while-revalidate={payload.stale_while_revalidate}"
+        ),
+    }
+    if _etag_matches(if_none_match, payload.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
+
+
+@router.get("/search", response_model=NewsResponse)
+async def search_news(
+    q: Annotated[str, Query(min_length=1, max_length=200, description="Search text")],
+    limit: Annotated[int, Query(ge=1, le=50, description="Number of news items to return")] = 20,
+    news_service: NewsService = Depends(get_news_service),
+) -> NewsResponse:
+    """
+    Search every news item the service has seen.
+
+    Unlike the ``q`` filter of /news, which only keeps the current items
+    whose title contains every word, this matches items containing any word
+    of the query in their title, URL or tags, including items that have
+    left the news pool, and ranks them by relevance and recency.
+
+    Queries made only of very common words score a bounded number of
+    candidates (SEARCH_MAX_CANDIDATES). This keeps latency low, but their
+    results may miss some of the best matches and are then flagged
+    ``meta.exhaustive = false``.
+
+    Args:
+        q: Search text
+        limit: Maximum number of news items to return (1-50, default 20)
+        news_service: Injected news service instance
+
+    Returns:
+        NewsResponse with the best matches first
+
+    Raises:
+        HTTPException: If the service is not initialized
+    """
+    try:
+        return await news_service.search(q, limit)
+    except RuntimeError as e:
+        # Service not initialized
+        logger.error(f"Service initialization error: {e}")
+        raise HTTPException(
+            status_code=503, detail="News service is not available. Please try again later."
+        ) from e
+
+
+@router.post("/admin/taxonomy/reload")
+async def reload_taxonomy(
+    authorization: Annotated[str | None, Header()] = None,
+    admin_token: str | None = Depends(get_admin_token),
+    reloader: TaxonomyReloader = Depends(get_taxonomy_reloader),
+) -> dict[str, int | str]:
+    """
+    Reload the topic taxonomy file without restarting.
+
+    The new taxonomy is compiled off the event loop and swapped in
+    atomically. Items already in the news snapshot keep their tags until
+    the next refresh. The endpoint only exists when ``ADMIN_TOKEN`` is set,
+    and requires it as a bearer token.
+
+    Args:
+        authorization: Authorization header ("Bearer <ADMIN_TOKEN>")
+        admin_token: Injected admin token (None when admin endpoints are disabled)
+        reloader: Injected taxonomy reloader
+
+    Returns:
+        Dictionary with the file path and the number of topics and tags loaded
+
+    Raises:
+        HTTPException: If admin endpoints are disabled (404), the token is
+            missing or wrong (401), or the file cannot be read or is not a
+            valid taxonomy (500, the previous taxonomy stays active)
+    """
+    if admin_token is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not hmac.compare_digest((authorization or "").encode(), f"Bearer {admin_token}".encode()):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or missing admin token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        compiled = await reloader.reload()
+    except (OSError, ValueError) as e:
+        logger.exception(f"Taxonomy reload failed: {e}")
+        raise HTTPException(
+            status_code=500, detail="Taxonomy reload failed; the previous taxonomy stays active"
+        ) from e
+
+    return {
+        "path": str(reloader.path),
+        "topics": len(compiled.taxonomy.topics),
+        "tags": len(compiled.tags),
+    }
@@ -297,34 +297,52 @@ HTML_TEMPLATE = """<!DOCTYPE html>
     </div>
     
     <script>
+        // ETag of the news currently rendered, used for conditional polling
+        let lastUrl = null;
+        let lastEtag = null;
+        
         async function loadNews(showLoading = true) {
             const limit = document.getElementById('limit').value || 20;
+            const url = `/news?limit=${limit}`;
             const container = document.getElementById('news-container');
             const loading = document.getElementById('loading');
             const status = document.getElementById('status');
             const refreshBtn = document.getElementById('refreshBtn');
             
-            // Reset
-            status.style.display = 'none';
-            status.className = 'status';
-            container.innerHTML = '';
-            
             if (showLoading) {
                 loading.style.display = 'block';
             }
             refreshBtn.disabled = true;
             
             try {
-                const response = await fetch(`/news?limit=${limit}`);
-                const data = await response.json();
+                const headers = {};
+                if (url === lastUrl && lastEtag) {
+                    headers['If-None-Match'] = lastEtag;
+                }
+                const response = await fetch(url, { headers, cache: 'no-store' });
                 
                 loading.style.display = 'none';
                 refreshBtn.disabled = false;
                 
+                // Nothing changed since the last load: keep the rendered news
+                if (response.status === 304) {
+                    return;
+                }
+                
+                const data = await response.json();
+                
+                // Reset
+                status.style.display = 'none';
+                status.className = 'status';
+                container.innerHTML = '';
+                
                 if (!response.ok) {
                     throw new Error(data.detail || 'Erreur lors du chargement');
                 }
                 
+                lastUrl = url;
+                lastEtag = response.headers.get('ETag');
+                
                 // Show status if sources failed
                 if (data.meta && data.meta.failed_sources && data.meta.failed_sources.length > 0) {
                     status.textContent = `⚠️ Certaines sources ont échoué: ${data.meta.failed_sources.join(', ')}`;
@@ -338,6 +356,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                     container.innerHTML = '<div class="empty-state">Aucune news disponible pour le moment.</div>';
                 }
             } catch (error) {
+                lastEtag = null;
                 loading.style.display = 'none';
                 refreshBtn.disabled = false;
                 status.textContent = `❌ Erreur: ${error.message}`;
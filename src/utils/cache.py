@@ -2,8 +2,14 @@
 
 import asyncio
 import time
+from collections.abc import Awaitable, Callable
 from typing import Any, Optional, TypeVar
 
+from src.utils.cache_backends import CacheBackend, CacheRecord, MemoryCacheBackend
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
 T = TypeVar("T")
 
 
@@ -12,19 +18,106 @@ class AsyncCache:
     Thread-safe in-memory cache with TTL support.
 
     This cache stores key-value pairs with an expiration time.
-    Expired entries are automatically removed on access.
+    Expired entries are automatically removed on access, and by an optional
+    background sweeper for keys that are never read again.
+
+    With a non-zero stale TTL, entries go through two phases: fresh for
+    ``ttl_seconds`` (soft TTL), then stale for another ``stale_ttl_seconds``
+    (up to the hard TTL). ``get_or_compute`` serves stale values immediately
+    while recomputing them in the background (stale-while-revalidate).
+
+    Storage is delegated to a backend. The default in-memory backend can be
+    bounded by entry count and/or total estimated size, evicting the least
+    recently used entries first; its reads are lock-free because they never
+    await, and the lock only serializes mutations. A shared backend (e.g.
+    SQLiteCacheBackend) lets several worker processes share one cache, with
+    leases ensuring only one process recomputes a key at a time.
     """
 
-    def __init__(self, ttl_seconds: int = 60) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int = 60,
+        stale_ttl_seconds: int = 0,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        backend: CacheBackend | None = None,
+        lease_seconds: float = 30.0,
+    ) -> None:
         """
         Initialize the cache.
 
         Args:
-            ttl_seconds: Time-to-live in seconds for cache entries
+            ttl_seconds: Time-to-live in seconds for cache entries (soft TTL)
+            stale_ttl_seconds: Extra seconds after the TTL during which an
+                entry may still be served stale by get_or_compute (0 disables)
+            max_entries: Maximum number of entries of the default in-memory
+                backend (None for unbounded)
+            max_bytes: Maximum total estimated size in bytes of the default
+                in-memory backend (None for unbounded)
+            backend: Storage backend (defaults to a MemoryCacheBackend)
+            lease_seconds: How long another process may hold the recompute
+                lease of a key before this process computes it itself
         """
-        self._cache: dict[str, tuple[Any, float]] = {}
+        self._backend: CacheBackend = backend or MemoryCacheBackend(
+            max_entries=max_entries, max_bytes=max_bytes
+        )
         self._lock = asyncio.Lock()
         self._ttl_seconds = ttl_seconds
+        self._stale_ttl_seconds = stale_ttl_seconds
+        self._lease_seconds = lease_seconds
+        self._lease_poll_seconds = 0.05
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._sweeper_task: asyncio.Task | None = None
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+
+    @property
+    def ttl_seconds(self) -> int:
+        """Seconds during which a cached entry is considered fresh."""
+        return self._ttl_seconds
+
+    @property
+    def stale_ttl_seconds(self) -> int:
+        """Extra seconds during which an expired entry may be served stale."""
+        return self._stale_ttl_seconds
+
+    @property
+    def shared(self) -> bool:
+        """Whether the backend storage is shared with other processes."""
+        return self._backend.shared
+
+    async def stats(self) -> dict[str, int]:
+        """
+        Get cache counters and current size.
+
+        Returns:
+            Dictionary of hit, miss, eviction and expiration counters
+        """
+        return {
+            **await self._backend.stats(),
+            "hits": self._hits,
+            "stale_hits": self._stale_hits,
+            "misses": self._misses,
+        }
+
+    async def _lookup(self, key: str) -> tuple[Any, bool] | None:
+        """
+        Look up an entry that has not passed its hard TTL.
+
+        Takes no lock: with the in-memory backend the lookup never awaits, so
+        it cannot interleave with a mutation.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, is_fresh), or None if not found or expired
+        """
+        record = await self._backend.get(key)
+        if record is None:
+            return None
+        return record.value, time.time() < record.fresh_until
 
     async def get(self, key: str) -> Optional[T]:
         """
@@ -36,49 +129,262 @@ class AsyncCache:
         Returns:
             Cached value or None if not found or expired
         """
+        found = await self._lookup(key)
+        if found is None or not found[1]:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return found[0]
+
+    async def set(self, key: str, value: T) -> None:
+        """
+        Store a value in the cache with TTL.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
         async with self._lock:
-            if key not in self._cache:
-                return None
+            fresh_until = time.time() + self._ttl_seconds
+            record = CacheRecord(value, fresh_until, fresh_until + self._stale_ttl_seconds)
+            await self._backend.set(key, record)
+
+    async def get_or_compute(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Get a value from the cache, computing and storing it on a miss.
+
+        Concurrent misses for the same key are coalesced (single-flight):
+        only the first caller runs the factory and every other caller awaits
+        the same in-flight computation. A stale entry (past the soft TTL but
+        within the hard TTL) is returned immediately and a single background
+        recomputation is scheduled. Cache read and write failures are logged
+        and treated as a miss or ignored respectively.
+
+        Args:
+            key: Cache key
+            factory: Zero-argument callable returning an awaitable of the value
 
-            value, expiry_time = self._cache[key]
-            current_time = time.time()
+        Returns:
+            Cached (possibly stale) or freshly computed value
 
-            if current_time >= expiry_time:
-                # Entry has expired, remove it
-                del self._cache[key]
-                return None
+        Raises:
+            Exception: Whatever the factory raised (propagated to every waiter)
+        """
+        try:
+            found = await self._lookup(key)
+        except Exception as e:
+            logger.warning(f"Cache read failed for {key}, computing value: {e}")
+            found = None
 
+        if found is not None:
+            value, is_fresh = found
+            if is_fresh:
+                self._hits += 1
+            else:
+                # Stale-while-revalidate: serve now, refresh in the background
+                self._stale_hits += 1
+                self._start_compute(key, factory)
             return value
 
-    async def set(self, key: str, value: T) -> None:
+        self._misses += 1
+        task = self._start_compute(key, factory)
+        # Shield so a cancelled caller does not cancel the computation for the others
+        return await asyncio.shield(task)
+
+    def _start_compute(self, key: str, factory: Callable[[], Awaitable[T]]) -> asyncio.Task:
         """
-        Store a value in the cache with TTL.
+        Get the in-flight computation for a key, starting one if needed.
 
         Args:
             key: Cache key
-            value: Value to cache
+            factory: Zero-argument callable returning an awaitable of the value
+
+        Returns:
+            Task computing and storing the value
         """
-        async with self._lock:
-            expiry_time = time.time() + self._ttl_seconds
-            self._cache[key] = (value, expiry_time)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._compute_and_store(key, factory))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        return task
+
+    async def _compute_and_store(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run the factory and store its result.
+
+        With a shared backend, another process may already be computing the
+        key; in that case return the stored value if it is fresh, or else
+        wait for the value it publishes instead of computing it again,
+        unless its lease runs out first.
+
+        Args:
+            key: Cache key
+            factory: Zero-argument callable returning an awaitable of the value
+
+        Returns:
+            Computed value
+        """
+        try:
+            previous = await self._backend.get(key)
+            acquired = await self._backend.acquire_lease(key, self._lease_seconds)
+        except Exception as e:
+            logger.warning(f"Cache lease failed for {key}, computing value: {e}")
+            previous, acquired = None, False
+        else:
+            if not acquired:
+                if previous is not None and previous.fresh_until > time.time():
+                    # Already fresh, e.g. published by the holder just before
+                    # our read: waiting for a newer one would only time out
+                    return previous.value
+                published = await self._wait_for_newer(key, previous)
+                if published is not None:
+                    return published.value
+                logger.warning(f"Lease holder did not publish {key} in time, computing value")
+
+        try:
+            value = await factory()
+            try:
+                await self.set(key, value)
+            except Exception as e:
+                logger.warning(f"Cache write failed for {key}: {e}")
+            return value
+        finally:
+            if acquired:
+                try:
+                    await self._backend.release_lease(key)
+                except Exception as e:
+                    logger.warning(f"Cache lease release failed for {key}: {e}")
+
+    async def _wait_for_newer(
+        self, key: str, previous: CacheRecord | None
+    ) -> CacheRecord | None:
+        """
+        Wait for another process to publish a newer record for a key.
+
+        Args:
+            key: Cache key
+            previous: Record seen before the wait (None if there was none)
+
+        Returns:
+            Newer record, or None if none was published within the lease time
+        """
+        baseline = previous.fresh_until if previous is not None else 0.0
+        deadline = time.monotonic() + self._lease_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self._lease_poll_seconds)
+            try:
+                record = await self._backend.get(key)
+            except Exception as e:
+                logger.warning(f"Cache read failed for {key} while waiting: {e}")
+                continue
+            if record is not None and record.fresh_until > baseline:
+                return record
+        return None
+
+    async def refresh(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Recompute a value even if a fresh one is cached.
+
+        Shares in-flight computations like get_or_compute, and with a shared
+        backend returns the value published by another process if that
+        process already holds the recompute lease.
+
+        Args:
+            key: Cache key
+            factory: Zero-argument callable returning an awaitable of the value
+
+        Returns:
+            Freshly computed value
+
+        Raises:
+            Exception: Whatever the factory raised
+        """
+        task = self._start_compute(key, factory)
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: str, task: asyncio.Task) -> None:
+        """
+        Forget a finished in-flight computation.
+
+        Args:
+            key: Cache key the computation was running for
+            task: Finished computation task
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception in case nobody awaits the task (background
+        # revalidation, or every waiter was cancelled)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Cache computation failed for {key}: {task.exception()}")
 
     async def clear(self) -> None:
         """Clear all entries from the cache."""
         async with self._lock:
-            self._cache.clear()
+            await self._backend.clear()
+
+    async def close(self) -> None:
+        """
+        Stop the sweeper and release the backend.
 
-    async def _cleanup_expired(self) -> None:
+        A process-local backend is cleared; a shared backend keeps its
+        entries for the other processes.
+        """
+        await self.stop_sweeper()
+        await self._backend.close()
+
+    async def _cleanup_expired(self) -> int:
         """
         Remove all expired entries from the cache.
 
-        This is called automatically but can be invoked manually.
+        This is called by the background sweeper but can be invoked manually.
+
+        Returns:
+            Number of entries removed
         """
         async with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key
-                for key, (_, expiry_time) in self._cache.items()
-                if current_time >= expiry_time
-            ]
-            for key in expired_keys:
-                del self._cache[key]
+            return await self._backend.purge_expired()
+
+    def start_sweeper(self, interval_seconds: float = 60.0) -> None:
+        """
+        Start a background task that periodically removes expired entries.
+
+        Args:
+            interval_seconds: Delay between two sweeps
+        """
+        if self._sweeper_task is not None and not self._sweeper_task.done():
+            return
+        self._sweeper_task = asyncio.create_task(
+            self._sweep_forever(interval_seconds), name="cache-sweeper"
+        )
+
+    async def stop_sweeper(self) -> None:
+        """Cancel the background sweeper and wait for it to finish."""
+        if self._sweeper_task is None:
+            return
+        self._sweeper_task.cancel()
+        try:
+            await self._sweeper_task
+        except asyncio.CancelledError:
+            pass
+        self._sweeper_task = None
+
+    async def _sweep_forever(self, interval_seconds: float) -> None:
+        """
+        Sweep expired entries forever.
+
+        Args:
+            interval_seconds: Delay between two sweeps
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = await self._cleanup_expired()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Never let one failed sweep (e.g. a locked database) kill the loop
+                logger.exception(f"Cache sweep failed: {e}")
+                continue
+            if removed:
+                logger.debug(f"Cache sweeper removed {removed} expired entries")
@@ -0,0 +1,439 @@
+"""Storage backends for AsyncCache."""
+
+import asyncio
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, NamedTuple, Protocol
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CacheRecord(NamedTuple):
+    """Stored value with its expiry times."""
+
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+class CacheBackend(Protocol):
+    """
+    Storage interface used by AsyncCache.
+
+    Backends store records and enforce the hard TTL; freshness decisions,
+    hit/miss accounting and single-flight live in AsyncCache. Backends that
+    are shared between processes also implement leases so that only one
+    process recomputes a key at a time.
+    """
+
+    #: Whether the storage is shared with other processes
+    shared: bool
+
+    async def get(self, key: str) -> CacheRecord | None:
+        """Get a record that has not passed its hard TTL."""
+        ...
+
+    async def set(self, key: str, record: CacheRecord) -> None:
+        """Store a record, replacing any previous one."""
+        ...
+
+    async def clear(self) -> None:
+        """Remove every record."""
+        ...
+
+    async def purge_expired(self) -> int:
+        """Remove records past their hard TTL and return how many were removed."""
+        ...
+
+    async def acquire_lease(self, key: str, ttl_seconds: float) -> bool:
+        """Try to become the only process computing a key."""
+        ...
+
+    async def release_lease(self, key: str) -> None:
+        """Release a lease obtained with acquire_lease."""
+        ...
+
+    async def close(self) -> None:
+        """Release resources held by the backend."""
+        ...
+
+    async def stats(self) -> dict[str, int]:
+        """Get storage counters (entries, bytes, evictions, expirations)."""
+        ...
+
+
+def _estimate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Bytes and strings use their length; other values use their pickled size,
+    which accounts for nested objects, falling back to the shallow size.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, bytes | bytearray | str):
+        return len(value)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class MemoryCacheBackend:
+    """
+    Process-local backend storing records in an LRU-ordered dict.
+
+    Every operation runs without awaiting, so it needs no lock on a single
+    event loop. Leases always succeed: in-process single-flight in AsyncCache
+    is enough when nothing else shares the storage.
+    """
+
+    shared = False
+
+    def __init__(self, max_entries: int | None = None, max_bytes: int | None = None) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            max_entries: Maximum number of entries (None for unbounded)
+            max_bytes: Maximum total estimated size in bytes (None for unbounded)
+        """
+        # Ordered from least to most recently used: key -> (record, size)
+        self._entries: OrderedDict[str, tuple[CacheRecord, int]] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._total_bytes = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _remove(self, key: str) -> None:
+        """
+        Remove an entry and update the size accounting.
+
+        Args:
+            key: Cache key
+        """
+        _, size = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def _evict_overflow(self) -> None:
+        """Evict least recently used entries until within bounds."""
+        while self._entries and (
+            (self._max_entries is not None and len(self._entries) > self._max_entries)
+            or (self._max_bytes is not None and self._total_bytes > self._max_bytes)
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+    async def get(self, key: str) -> CacheRecord | None:
+        """
+        Get a record that has not passed its hard TTL.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored record or None if not found or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        record = entry[0]
+        if time.time() >= record.stale_until:
+            # Entry has expired, remove it
+            self._remove(key)
+            self._expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return record
+
+    async def set(self, key: str, record: CacheRecord) -> None:
+        """
+        Store a record, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key
+            record: Record to store
+        """
+        size = _estimate_size(record.value) if self._max_bytes is not None else 0
+        if key in self._entries:
+            self._remove(key)
+
+        if self._max_bytes is not None and size > self._max_bytes:
+            logger.warning(f"Not caching {key}: {size} bytes exceeds max_bytes")
+            return
+
+        self._entries[key] = (record, size)
+        self._total_bytes += size
+        self._evict_overflow()
+
+    async def clear(self) -> None:
+        """Remove every record."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    async def purge_expired(self) -> int:
+        """
+        Remove records past their hard TTL.
+
+        Returns:
+            Number of records removed
+        """
+        current_time = time.time()
+        expired_keys = [
+            key for key, (record, _) in self._entries.items() if current_time >= record.stale_until
+        ]
+        for key in expired_keys:
+            self._remove(key)
+        self._expirations += len(expired_keys)
+        return len(expired_keys)
+
+    async def acquire_lease(self, key: str, ttl_seconds: float) -> bool:
+        """Always succeeds: nothing outside this process can compute the key."""
+        return True
+
+    async def release_lease(self, key: str) -> None:
+        """Nothing to release for a process-local backend."""
+
+    async def close(self) -> None:
+        """Drop every record."""
+        await self.clear()
+
+    async def stats(self) -> dict[str, int]:
+        """
+        Get storage counters.
+
+        Returns:
+            Dictionary with entry count, bytes, evictions and expirations
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+
+class SQLiteCacheBackend:
+    """
+    File-backed backend shared by every process that opens the same path.
+
+    Several uvicorn workers pointing at one file share a single cached
+    snapshot, and leases stored in the same database make sure only one
+    worker recomputes a key at a time. Blocking SQLite calls run in a worker
+    thread so they never stall the event loop. Values are pickled, so the
+    file must only be writable by trusted processes.
+    """
+
+    shared = True
+
+    def __init__(self, path: str, max_entries: int | None = None) -> None:
+        """
+        Initialize the backend and create the schema if needed.
+
+        Args:
+            path: Path of the SQLite database file
+            max_entries: Maximum number of entries (None for unbounded);
+                the oldest stored entries are evicted first
+        """
+        self._path = path
+        self._max_entries = max_entries
+        self._owner = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self._conn_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " fresh_until REAL NOT NULL,"
+            " stale_until REAL NOT NULL,"
+            " stored_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_stored_at ON cache_entries (stored_at)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_leases ("
+            " key TEXT PRIMARY KEY,"
+            " owner TEXT NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        self._evictions = 0
+        self._expirations = 0
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """
+        Execute one statement on the shared connection.
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+
+        Returns:
+            Cursor holding the results
+        """
+        with self._conn_lock:
+            return self._conn.execute(sql, params)
+
+    def _count_entries_sync(self) -> int:
+        """Blocking implementation of the entry count of stats."""
+        with self._conn_lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+    def _get_sync(self, key: str) -> CacheRecord | None:
+        """Blocking implementation of get."""
+        with self._conn_lock:
+            row = self._conn.execute(
+                "SELECT value, fresh_until, stale_until FROM cache_entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        value, fresh_until, stale_until = row
+        if time.time() >= stale_until:
+            self._execute(
+                "DELETE FROM cache_entries WHERE key = ? AND stale_until = ?",
+                (key, stale_until),
+            )
+            self._expirations += 1
+            return None
+
+        return CacheRecord(pickle.loads(value), fresh_until, stale_until)
+
+    def _set_sync(self, key: str, record: CacheRecord) -> None:
+        """Blocking implementation of set."""
+        value = pickle.dumps(record.value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._conn_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries"
+                " (key, value, fresh_until, stale_until, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, record.fresh_until, record.stale_until, time.time()),
+            )
+            if self._max_entries is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM cache_entries WHERE key IN ("
+                    " SELECT key FROM cache_entries ORDER BY stored_at DESC"
+                    " LIMIT -1 OFFSET ?)",
+                    (self._max_entries,),
+                )
+                self._evictions += max(cursor.rowcount, 0)
+
+    def _acquire_lease_sync(self, key: str, ttl_seconds: float) -> bool:
+        """Blocking implementation of acquire_lease."""
+        now = time.time()
+        cursor = self._execute(
+            "INSERT INTO cache_leases (key, owner, expires_at) VALUES (?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET owner = excluded.owner,"
+            " expires_at = excluded.expires_at"
+            " WHERE cache_leases.expires_at <= ? OR cache_leases.owner = excluded.owner",
+            (key, self._owner, now + ttl_seconds, now),
+        )
+        return cursor.rowcount == 1
+
+    async def get(self, key: str) -> CacheRecord | None:
+        """
+        Get a record that has not passed its hard TTL.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored record or None if not found or expired
+        """
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, key: str, record: CacheRecord) -> None:
+        """
+        Store a record, evicting the oldest entries if needed.
+
+        Args:
+            key: Cache key
+            record: Record to store
+        """
+        await asyncio.to_thread(self._set_sync, key, record)
+
+    async def clear(self) -> None:
+        """Remove every record."""
+        await asyncio.to_thread(self._execute, "DELETE FROM cache_entries")
+
+    async def purge_expired(self) -> int:
+        """
+        Remove records past their hard TTL.
+
+        Returns:
+            Number of records removed
+        """
+        cursor = await asyncio.to_thread(
+            self._execute, "DELETE FROM cache_entries WHERE stale_until <= ?", (time.time(),)
+        )
+        removed = max(cursor.rowcount, 0)
+        self._expirations += removed
+        return removed
+
+    async def acquire_lease(self, key: str, ttl_seconds: float) -> bool:
+        """
+        Try to become the only process computing a key.
+
+        The lease expires on its own after ttl_seconds, so a crashed holder
+        cannot block other processes forever.
+
+        Args:
+            key: Cache key
+            ttl_seconds: Lease duration
+
+        Returns:
+            True if this process now holds the lease
+        """
+        return await asyncio.to_thread(self._acquire_lease_sync, key, ttl_seconds)
+
+    async def release_lease(self, key: str) -> None:
+        """
+        Release a lease held by this process.
+
+        Args:
+            key: Cache key
+        """
+        await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM cache_leases WHERE key = ? AND owner = ?",
+            (key, self._owner),
+        )
+
+    async def close(self) -> None:
+        """Close the database connection, keeping the shared records."""
+        with self._conn_lock:
+            self._conn.close()
+
+    async def stats(self) -> dict[str, int]:
+        """
+        Get storage counters.
+
+        Returns:
+            Dictionary with entry count, evictions and expirations
+        """
+        entries = await asyncio.to_thread(self._count_entries_sync)
+        return {
+            "entries": entries,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
@@ -1,12 +1,27 @@
 """News filtering utility for data science, AI, Big Tech, and agentic content."""
 
-import re
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
+from itertools import repeat
+from typing import NamedTuple
+
+from src.utils.taxonomy import CompiledTaxonomy, get_taxonomy
+
+
+class NewsClassification(NamedTuple):
+    """Tags and relevance verdict of one news item."""
+
+    tags: list[str]
+    relevant: bool
 
 
 def is_relevant_news(title: str, url: str, tags: list[str]) -> bool:
     """
     Check if a news item is relevant to data science, AI, Big Tech, or agentic topics.
 
+    The item's tags and the taxonomy tags found in its title and URL are
+    scored together against the taxonomy's topic weights.
+
     Args:
         title: News item title
         url: News item URL
@@ -15,57 +30,96 @@ def is_relevant_news(title: str, url: str, tags: list[str]) -> bool:
     Returns:
         True if the news is relevant, False otherwise
     """
-    text = f"{title} {url}".lower()
-
-    # If tags exist and contain relevant keywords, it's likely relevant
-    relevant_tag_keywords = [
-        "ai", "machine learning", "ml", "deep learning", "neural network",
-        "llm", "large language model", "gpt", "chatgpt", "claude", "gemini",
-        "transformer", "reinforcement learning", "computer vision", "nlp",
-        "natural language processing", "generative ai", "genai", "agentic",
-        "agent", "agents", "autonomous agent", "ai agent", "multi-agent",
-        "langchain", "llama", "openai", "anthropic", "mistral",
-        "data science", "data scientist", "data analytics", "data analysis",
-        "data engineering", "data pipeline", "big data", "data warehouse",
-        "data lake", "etl", "feature engineering", "model training",
-        "model deployment", "mlops", "dataops", "pandas", "numpy",
-        "scikit-learn", "tensorflow", "pytorch", "keras", "jupyter",
-        "statistics", "data visualization", "data mining",
-        "google", "microsoft", "amazon", "meta", "facebook", "apple", "nvidia",
-        "tesla", "openai", "anthropic", "alphabet", "azure", "aws", "gcp",
-        "google cloud", "amazon web services", "gpu", "cuda", "tpu",
-        "quantum computing", "edge computing", "cloud computing",
-        "distributed systems", "vector database", "embeddings", "rag",
-        "retrieval augmented generation", "fine-tuning", "prompt engineering",
-        "few-shot learning", "transfer learning"
-    ]
+    taxonomy = get_taxonomy()
+    if tags and taxonomy.is_relevant(tags):
+        return True
+    found = taxonomy.find_tags(f"{title} {url}".lower())
+    return taxonomy.is_relevant({*(tags or ()), *found})
 
-    # Check if any relevant tag is present
-    if tags:
-        for tag in tags:
-            if any(keyword in tag.lower() for keyword in relevant_tag_keywords):
-                return True
-
-    # Check title and URL for relevant keywords
-    relevant_patterns = [
-        r"\b(ai|artificial intelligence|machine learning|ml|deep learning)\b",
-        r"\b(llm|large language model|gpt|chatgpt|claude|gemini)\b",
-        r"\b(transformer|neural network|reinforcement learning)\b",
-        r"\b(computer vision|nlp|natural language processing)\b",
-        r"\b(generative ai|genai|agentic|agent|agents|autonomous agent)\b",
-        r"\b(langchain|llama|openai|anthropic|mistral)\b",
-        r"\b(data science|data scientist|data analytics|data engineering)\b",
-        r"\b(big data|data warehouse|data lake|etl|mlops|dataops)\b",
-        r"\b(tensorflow|pytorch|keras|scikit-learn|pandas|numpy)\b",
-        r"\b(google|microsoft|amazon|meta|facebook|apple|nvidia|tesla)\b",
-        r"\b(openai|anthropic|alphabet|azure|aws|gcp)\b",
-        r"\b(gpu|cuda|tpu|quantum computing|edge computing)\b",
-        r"\b(vector database|embeddings|rag|retrieval augmented generation)\b",
-        r"\b(fine-tuning|prompt engineering|few-shot learning|transfer learning)\b",
-    ]
 
-    for pattern in relevant_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
+def _classify(taxonomy: CompiledTaxonomy, title: str, url: str) -> NewsClassification:
+    """
+    Classify one news item against a compiled taxonomy.
+
+    Args:
+        taxonomy: Compiled taxonomy to use
+        title: News item title
+        url: News item URL
+
+    Returns:
+        Tags and relevance of the item
+    """
+    tags = taxonomy.find_tags(f"{title} {url}".lower())
+    return NewsClassification(tags, taxonomy.is_relevant(tags))
+
+
+def classify_news(title: str, url: str) -> NewsClassification:
+    """
+    Extract tags and decide relevance in a single scan of the text.
+
+    Equivalent to calling extract_tags and then is_relevant_news with its
+    tags, but the relevance verdict is derived from the matched tags instead
+    of scanning the text again.
+
+    Args:
+        title: News item title
+        url: News item URL
 
-    return False
+    Returns:
+        Tags and relevance of the item
+    """
+    return _classify(get_taxonomy(), title, url)
+
+
+def _classify_chunk(
+    items: Sequence[tuple[str, str]], taxonomy: CompiledTaxonomy
+) -> list[NewsClassification]:
+    """
+    Classify a chunk of news items in the current process.
+
+    Module-level so it can be pickled and run by a process pool worker.
+
+    Args:
+        items: (title, url) pairs
+        taxonomy: Compiled taxonomy to use
+
+    Returns:
+        Classification of each item, in input order
+    """
+    return [_classify(taxonomy, title, url) for title, url in items]
+
+
+def classify_news_batch(
+    items: Iterable[tuple[str, str]],
+    executor: Executor | None = None,
+    chunk_size: int = 2000,
+) -> list[NewsClassification]:
+    """
+    Classify several news items.
+
+    Results are identical to calling classify_news on each item, and the
+    whole batch uses the taxonomy that was active when the call started.
+    With an executor (typically a ProcessPoolExecutor for backfills of tens
+    of thousands of items), inputs larger than one chunk are split into
+    chunks classified in parallel. The taxonomy is sent along with each
+    chunk, so workers use it even if it was reloaded after they started.
+
+    Args:
+        items: (title, url) pairs
+        executor: Optional executor to spread chunks over
+        chunk_size: Number of items sent to the executor per task
+
+    Returns:
+        Classification of each item, in input order
+    """
+    items = list(items)
+    taxonomy = get_taxonomy()
+    if executor is None or len(items) <= chunk_size:
+        return _classify_chunk(items, taxonomy)
+
+    chunks = [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+    return [
+        classification
+        for chunk_result in executor.map(_classify_chunk, chunks, repeat(taxonomy))
+        for classification in chunk_result
+    ]
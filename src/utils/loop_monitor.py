@@ -0,0 +1,94 @@
+"""Event loop lag monitoring."""
+
+import asyncio
+from collections import deque
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop runs a periodic timer.
+
+    A task sleeps for a fixed interval and records how much later than
+    scheduled it wakes up. Any synchronous work on the loop (CPU-bound
+    parsing, blocking I/O) shows up as lag, and every request handled
+    during that time is delayed by at least as much.
+    """
+
+    def __init__(self, interval_seconds: float = 0.5, window: int = 120) -> None:
+        """
+        Initialize the monitor.
+
+        Args:
+            interval_seconds: Delay between two measurements
+            window: Number of recent samples kept for the recent maximum
+        """
+        self._interval_seconds = interval_seconds
+        self._recent: deque[float] = deque(maxlen=window)
+        self._samples = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the measuring task is currently running."""
+        return self._task is not None and not self._task.done()
+
+    def record(self, lag_seconds: float) -> None:
+        """
+        Record one lag measurement.
+
+        Args:
+            lag_seconds: How late the timer fired
+        """
+        self._recent.append(lag_seconds)
+        self._samples += 1
+        self._total += lag_seconds
+        self._max = max(self._max, lag_seconds)
+
+    def stats(self) -> dict[str, float | int]:
+        """
+        Get lag statistics in milliseconds.
+
+        Returns:
+            Dictionary with sample count and last, mean, recent max and max lag
+        """
+        return {
+            "samples": self._samples,
+            "last_ms": round(self._recent[-1] * 1000, 3) if self._recent else 0.0,
+            "mean_ms": round(self._total / self._samples * 1000, 3) if self._samples else 0.0,
+            "recent_max_ms": round(max(self._recent, default=0.0) * 1000, 3),
+            "max_ms": round(self._max * 1000, 3),
+        }
+
+    def start(self) -> None:
+        """Start measuring (no-op if already running)."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name="loop-lag-monitor")
+
+    async def stop(self) -> None:
+        """Stop measuring and wait for the task to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Measure lag forever."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval_seconds
+            await asyncio.sleep(self._interval_seconds)
+            lag = max(0.0, loop.time() - expected)
+            self.record(lag)
+            if lag > max(0.1, self._interval_seconds):
+                logger.warning(f"Event loop blocked for {lag * 1000:.0f} ms")
@@ -2,129 +2,42 @@
 
 import re
 
+from src.utils.taxonomy import get_taxonomy
+
+# Runs of letters and digits in any script (underscores split tokens)
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
 
 def extract_tags(title: str, url: str) -> list[str]:
     """
     Extract tags from news item title and URL.
 
-    Tags are extracted based on common tech keywords found in the title
-    or URL. This is a simple keyword-based approach.
+    Tags are extracted based on the tags and synonyms of the active topic
+    taxonomy found in the title or URL, matched on word boundaries. All
+    phrases are matched in a single pass with a regex compiled once per
+    taxonomy load.
 
     Args:
         title: News item title
         url: News item URL
 
     Returns:
-        List of extracted tags (lowercase, unique)
+        List of extracted tags (lowercase, unique, in taxonomy order)
+    """
+    return get_taxonomy().find_tags(f"{title} {url}".lower())
+
+
+def tokenize(text: str) -> list[str]:
     """
-    text = f"{title} {url}".lower()
+    Split text into lowercase word tokens.
 
-    # Data Science, AI, Big Tech, and Agentic keywords
-    keywords = [
-        # AI & Machine Learning
-        "ai",
-        "artificial intelligence",
-        "machine learning",
-        "ml",
-        "deep learning",
-        "neural network",
-        "neural networks",
-        "llm",
-        "large language model",
-        "gpt",
-        "chatgpt",
-        "claude",
-        "gemini",
-        "transformer",
-        "transformer model",
-        "reinforcement learning",
-        "rl",
-        "computer vision",
-        "nlp",
-        "natural language processing",
-        "generative ai",
-        "genai",
-        "agentic",
-        "agent",
-        "agents",
-        "autonomous agent",
-        "ai agent",
-        "multi-agent",
-        "langchain",
-        "llama",
-        "openai",
-        "anthropic",
-        "mistral",
-        # Data Science
-        "data science",
-        "data scientist",
-        "data analytics",
-        "data analysis",
-        "data engineering",
-        "data pipeline",
-        "big data",
-        "data warehouse",
-        "data lake",
-        "etl",
-        "feature engineering",
-        "model training",
-        "model deployment",
-        "mlops",
-        "dataops",
-        "pandas",
-        "numpy",
-        "scikit-learn",
-        "tensorflow",
-        "pytorch",
-        "keras",
-        "jupyter",
-        "notebook",
-        "python",
-        "r language",
-        "statistics",
-        "data visualization",
-        "data mining",
-        # Big Tech Companies
-        "google",
-        "microsoft",
-        "amazon",
-        "meta",
-        "facebook",
-        "apple",
-        "nvidia",
-        "tesla",
-        "openai",
-        "anthropic",
-        "alphabet",
-        "azure",
-        "aws",
-        "gcp",
-        "google cloud",
-        "amazon web services",
-        # Related Technologies
-        "gpu",
-        "cuda",
-        "tpu",
-        "quantum computing",
-        "edge computing",
-        "cloud computing",
-        "distributed systems",
-        "vector database",
-        "embeddings",
-        "rag",
-        "retrieval augmented generation",
-        "fine-tuning",
-        "prompt engineering",
-        "few-shot learning",
-        "transfer learning",
-    ]
+    Shared by every text index so that queries and indexed items are
+    tokenized the same way.
 
-    found_tags: list[str] = []
-    for keyword in keywords:
-        # Use word boundaries to avoid partial matches
-        pattern = r"\b" + re.escape(keyword) + r"\b"
-        if re.search(pattern, text):
-            found_tags.append(keyword)
+    Args:
+        text: Text to split
 
-    # Remove duplicates while preserving order
-    return list(dict.fromkeys(found_tags))
+    Returns:
+        Lowercase runs of letters and digits, in order (with repeats)
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
@@ -0,0 +1,415 @@
+"""Topic taxonomy driving tag extraction and relevance filtering."""
+
+import asyncio
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Taxonomy shipped with the application
+DEFAULT_TAXONOMY_PATH = Path(__file__).with_name("taxonomy.json")
+
+
+@dataclass(frozen=True)
+class Topic:
+    """
+    Group of tags sharing a relevance weight.
+
+    Each tag is matched by its own text and by any of its synonyms, which
+    are reported as the tag itself.
+    """
+
+    name: str
+    weight: float
+    tags: tuple[str, ...]
+    synonyms: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class Taxonomy:
+    """
+    Topics used to tag news items and decide their relevance.
+
+    An item is relevant when the weights of the distinct topics its tags
+    belong to add up to at least ``relevance_threshold``.
+    """
+
+    topics: tuple[Topic, ...]
+    relevance_threshold: float = 1.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Taxonomy":
+        """
+        Build a taxonomy from its JSON representation.
+
+        Args:
+            data: Dictionary with "topics" and an optional "relevance_threshold"
+
+        Returns:
+            Validated taxonomy with lowercased tags and synonyms
+
+        Raises:
+            ValueError: If the structure is invalid
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("topics"), list):
+            raise ValueError("Taxonomy must be an object with a 'topics' list")
+
+        topics = []
+        for raw in data["topics"]:
+            if not isinstance(raw, dict) or not raw.get("name"):
+                raise ValueError("Every topic must be an object with a 'name'")
+            name = str(raw["name"])
+            tags = tuple(_normalize_phrase(tag, name) for tag in raw.get("tags", []))
+            synonyms = {}
+            for tag, phrases in raw.get("synonyms", {}).items():
+                canonical = _normalize_phrase(tag, name)
+                if canonical not in tags:
+                    raise ValueError(f"Topic {name}: synonyms given for unknown tag {tag!r}")
+                synonyms[canonical] = tuple(_normalize_phrase(phrase, name) for phrase in phrases)
+            topics.append(
+                Topic(
+                    name=name,
+                    weight=float(raw.get("weight", 1.0)),
+                    tags=tags,
+                    synonyms=synonyms,
+                    description=str(raw.get("description", "")),
+                )
+            )
+
+        return cls(
+            topics=tuple(topics),
+            relevance_threshold=float(data.get("relevance_threshold", 1.0)),
+        )
+
+
+def _normalize_phrase(phrase: object, topic: str) -> str:
+    """
+    Lowercase and validate a tag or synonym.
+
+    Args:
+        phrase: Raw phrase from the taxonomy file
+        topic: Name of the topic it belongs to (for error messages)
+
+    Returns:
+        Lowercased, stripped phrase
+
+    Raises:
+        ValueError: If the phrase is not a non-empty string
+    """
+    if not isinstance(phrase, str) or not phrase.strip():
+        raise ValueError(f"Topic {topic}: tags and synonyms must be non-empty strings")
+    return phrase.strip().lower()
+
+
+def load_taxonomy(path: str | os.PathLike) -> Taxonomy:
+    """
+    Load a taxonomy from a JSON file.
+
+    Args:
+        path: Path of the taxonomy file
+
+    Returns:
+        Validated taxonomy
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON or not a valid taxonomy
+    """
+    with open(path, encoding="utf-8") as f:
+        return Taxonomy.from_dict(json.load(f))
+
+
+def _build_trie_pattern(words: list[str]) -> str:
+    """
+    Build a regex alternation shaped as a trie.
+
+    Shared prefixes are factored out so the regex engine tests each
+    character once instead of trying every keyword in turn, and optional
+    suffixes are greedy so the longest keyword at a position is tried first.
+
+    Args:
+        words: Keywords to match
+
+    Returns:
+        Regex source matching any of the words
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        branches = [re.escape(char) + render(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+def _build_implied_prefixes(words: list[str]) -> dict[str, tuple[str, ...]]:
+    """
+    Map each keyword to the shorter keywords it implies at the same position.
+
+    When "ai agent" matches, "ai" matches at the same position too, because
+    the space after "ai" is a word boundary. The single-pass regex only
+    reports the longest keyword per position, so these are added back.
+
+    Args:
+        words: Keywords to match
+
+    Returns:
+        Mapping of keyword to the keywords matched whenever it matches
+    """
+    return {
+        word: tuple(
+            prefix
+            for prefix in words
+            if prefix != word
+            and word.startswith(prefix)
+            and re.match(re.escape(prefix) + r"\b", word)
+        )
+        for word in words
+    }
+
+
+class CompiledTaxonomy:
+    """
+    Taxonomy compiled into a single-pass keyword matcher.
+
+    Every tag and synonym is compiled into one trie-shaped regex wrapped in
+    a zero-width lookahead, so overlapping phrases ("ai agent", "agent") are
+    all found in one scan. Instances are never mutated: a reload compiles a
+    new instance and swaps it in, so callers holding the previous one keep a
+    consistent view.
+    """
+
+    def __init__(self, taxonomy: Taxonomy) -> None:
+        """
+        Compile a taxonomy.
+
+        Args:
+            taxonomy: Taxonomy to compile
+        """
+        self.taxonomy = taxonomy
+
+        # Phrase -> canonical tag; the first occurrence of a phrase wins
+        phrase_tags: dict[str, str] = {}
+        tag_topics: dict[str, set[int]] = {}
+        for topic_index, topic in enumerate(taxonomy.topics):
+            for tag in topic.tags:
+                phrase_tags.setdefault(tag, tag)
+                tag_topics.setdefault(tag, set()).add(topic_index)
+            for tag, synonyms in topic.synonyms.items():
+                for synonym in synonyms:
+                    phrase_tags.setdefault(synonym, tag)
+
+        #: Canonical tags in taxonomy order
+        self.tags: tuple[str, ...] = tuple(tag_topics)
+        #: Every matched phrase (tags and synonyms) mapped to its canonical tag
+        self.phrase_tags: dict[str, str] = phrase_tags
+
+        self._tag_order = {tag: index for index, tag in enumerate(self.tags)}
+        self._tag_topics = {tag: frozenset(topics) for tag, topics in tag_topics.items()}
+        self._topic_weights = [topic.weight for topic in taxonomy.topics]
+        # Tags whose topics alone reach the threshold, to skip summing in the common case
+        self._sufficient_tags = frozenset(
+            tag
+            for tag, topics in self._tag_topics.items()
+            if sum(self._topic_weights[i] for i in topics) >= taxonomy.relevance_threshold
+        )
+
+        phrases = list(phrase_tags)
+        implied = _build_implied_prefixes(phrases)
+        self._phrase_matches = {
+            phrase: frozenset(phrase_tags[p] for p in (phrase, *implied[phrase]))
+            for phrase in phrases
+        }
+        self._pattern = (
+            re.compile(r"\b(?=(" + _build_trie_pattern(phrases) + r")\b)") if phrases else None
+        )
+
+    def find_tags(self, text: str) -> list[str]:
+        """
+        Find the tags whose tag or synonym phrases occur in a text.
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            Unique canonical tags in taxonomy order
+        """
+        if self._pattern is None:
+            return []
+        found: set[str] = set()
+        for match in self._pattern.finditer(text):
+            found.update(self._phrase_matches[match.group(1)])
+        return sorted(found, key=self._tag_order.__getitem__)
+
+    def relevance_score(self, tags: list[str] | set[str]) -> float:
+        """
+        Sum the weights of the distinct topics the tags belong to.
+
+        Args:
+            tags: Canonical tags (unknown tags are ignored)
+
+        Returns:
+            Relevance score
+        """
+        topics: set[int] = set()
+        for tag in tags:
+            topics.update(self._tag_topics.get(tag, ()))
+        return sum(self._topic_weights[i] for i in topics)
+
+    def is_relevant(self, tags: list[str] | set[str]) -> bool:
+        """
+        Decide whether tags make an item relevant.
+
+        Args:
+            tags: Canonical tags (unknown tags are ignored)
+
+        Returns:
+            True if the relevance score reaches the threshold
+        """
+        if not self._sufficient_tags.isdisjoint(tags):
+            return True
+        return self.relevance_score(tags) >= self.taxonomy.relevance_threshold
+
+
+_active: CompiledTaxonomy | None = None
+
+
+def get_taxonomy() -> CompiledTaxonomy:
+    """
+    Get the active compiled taxonomy, loading the bundled one on first use.
+
+    Callers should fetch it once per operation so that a concurrent reload
+    cannot mix two taxonomies in one result.
+
+    Returns:
+        Active compiled taxonomy
+    """
+    global _active
+    if _active is None:
+        _active = CompiledTaxonomy(load_taxonomy(DEFAULT_TAXONOMY_PATH))
+    return _active
+
+
+def set_taxonomy(compiled: CompiledTaxonomy) -> None:
+    """
+    Make a compiled taxonomy the active one.
+
+    The swap is a single reference assignment, so it is atomic for readers.
+
+    Args:
+        compiled: Compiled taxonomy to activate
+    """
+    global _active
+    _active = compiled
+
+
+class TaxonomyReloader:
+    """
+    Loads a taxonomy file and keeps the active taxonomy in sync with it.
+
+    Loading and compiling run in a worker thread and the result is swapped
+    in atomically, so in-flight requests are never blocked and always see
+    either the old or the new taxonomy. An invalid file is logged and the
+    previous taxonomy stays active.
+    """
+
+    def __init__(self, path: str | os.PathLike = DEFAULT_TAXONOMY_PATH) -> None:
+        """
+        Initialize the reloader.
+
+        Args:
+            path: Path of the taxonomy file
+        """
+        self._path = Path(path)
+        self._mtime_ns: int | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def path(self) -> Path:
+        """Path of the taxonomy file."""
+        return self._path
+
+    def _load(self) -> CompiledTaxonomy:
+        """Blocking implementation of reload: stat, load and compile the file."""
+        mtime_ns = os.stat(self._path).st_mtime_ns
+        compiled = CompiledTaxonomy(load_taxonomy(self._path))
+        self._mtime_ns = mtime_ns
+        return compiled
+
+    async def reload(self) -> CompiledTaxonomy:
+        """
+        Load and compile the taxonomy file, then activate it.
+
+        Returns:
+            Newly active compiled taxonomy
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a valid taxonomy
+        """
+        compiled = await asyncio.to_thread(self._load)
+        set_taxonomy(compiled)
+        logger.info(
+            f"Loaded taxonomy from {self._path}: "
+            f"{len(compiled.taxonomy.topics)} topics, {len(compiled.tags)} tags"
+        )
+        return compiled
+
+    def start_watching(self, interval_seconds: float = 5.0) -> None:
+        """
+        Start polling the file and reload it whenever its mtime changes.
+
+        Args:
+            interval_seconds: Delay between two checks
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(
+            self._watch_forever(interval_seconds), name="taxonomy-watcher"
+        )
+
+    async def stop(self) -> None:
+        """Cancel the file watcher and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _watch_forever(self, interval_seconds: float) -> None:
+        """
+        Reload the taxonomy whenever the file changes.
+
+        Args:
+            interval_seconds: Delay between two checks
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                mtime_ns = os.stat(self._path).st_mtime_ns
+                if mtime_ns != self._mtime_ns:
+                    # Remember the change even if it fails to load, so a
+                    # broken file is reported once rather than on every poll
+                    self._mtime_ns = mtime_ns
+                    await self.reload()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to reload taxonomy from {self._path}: {e}")
@@ -0,0 +1,48 @@
+"""Shared builders of test data."""
+
+from datetime import datetime
+
+from src.modules.news.models import NewsItem
+
+# Default publication time of built items
+PUBLISHED_AT = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_item(
+    item_id: str = "hn_1",
+    *,
+    title: str | None = None,
+    url: str | None = None,
+    source: str | None = None,
+    published_at: datetime = PUBLISHED_AT,
+    tags: list[str] | None = None,
+    score: int | None = None,
+    comments_url: str | None = None,
+) -> NewsItem:
+    """
+    Build a news item.
+
+    Args:
+        item_id: Item ID
+        title: Title (defaults to "Story <item_id>")
+        url: URL (defaults to https://example.com/<item_id>)
+        source: Source (defaults to hackernews for IDs starting with hn_,
+            rss otherwise)
+        published_at: Publication time
+        tags: Tags
+        score: Hacker News score
+        comments_url: Hacker News discussion URL
+
+    Returns:
+        News item
+    """
+    return NewsItem(
+        id=item_id,
+        title=title if title is not None else f"Story {item_id}",
+        url=url if url is not None else f"https://example.com/{item_id}",
+        source=source or ("hackernews" if item_id.startswith("hn_") else "rss"),
+        published_at=published_at,
+        tags=tags or [],
+        score=score,
+        comments_url=comments_url,
+    )
@@ -102,3 +102,201 @@ async def test_cache_different_types():
     assert await cache.get("int") == 42
     assert await cache.get("list") == [1, 2, 3]
     assert await cache.get("dict") == {"key": "value"}
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_coalesces_concurrent_misses():
+    """Test that concurrent misses for one key share a single computation."""
+    cache = AsyncCache(ttl_seconds=60)
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "value"
+
+    results = await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(10)))
+
+    assert results == ["value"] * 10
+    assert calls == 1
+    assert await cache.get("key") == "value"
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_returns_cached_value():
+    """Test that a cached value is returned without computing."""
+    cache = AsyncCache(ttl_seconds=60)
+    await cache.set("key", "cached")
+
+    async def compute():
+        raise AssertionError("should not be called")
+
+    assert await cache.get_or_compute("key", compute) == "cached"
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_propagates_errors_and_retries():
+    """Test that failures reach every waiter and are not cached."""
+    cache = AsyncCache(ttl_seconds=60)
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        cache.get_or_compute("key", fail),
+        cache.get_or_compute("key", fail),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def succeed():
+        return "ok"
+
+    assert await cache.get_or_compute("key", succeed) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_serves_stale_and_revalidates_once():
+    """Test stale-while-revalidate between the soft and hard TTL."""
+    cache = AsyncCache(ttl_seconds=1, stale_ttl_seconds=60)
+    await cache.set("key", "old")
+    await asyncio.sleep(1.1)
+
+    # Plain get only returns fresh values
+    assert await cache.get("key") is None
+
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "new"
+
+    results = await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(5)))
+    assert results == ["old"] * 5
+
+    await asyncio.sleep(0.1)
+    assert calls == 1
+    assert await cache.get("key") == "new"
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_waits_after_hard_ttl():
+    """Test that entries past the hard TTL are recomputed synchronously."""
+    cache = AsyncCache(ttl_seconds=1, stale_ttl_seconds=0)
+    await cache.set("key", "old")
+    await asyncio.sleep(1.1)
+
+    async def compute():
+        return "new"
+
+    assert await cache.get_or_compute("key", compute) == "new"
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_entry():
+    """Test that max_entries evicts the least recently used key."""
+    cache = AsyncCache(ttl_seconds=60, max_entries=2)
+    await cache.set("key1", "value1")
+    await cache.set("key2", "value2")
+
+    # Touch key1 so key2 becomes the least recently used
+    assert await cache.get("key1") == "value1"
+    await cache.set("key3", "value3")
+
+    assert await cache.get("key2") is None
+    assert await cache.get("key1") == "value1"
+    assert await cache.get("key3") == "value3"
+    assert (await cache.stats())["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_respects_max_bytes():
+    """Test that max_bytes bounds the total estimated size."""
+    cache = AsyncCache(ttl_seconds=60, max_bytes=10)
+    await cache.set("key1", b"12345")
+    await cache.set("key2", b"12345")
+    await cache.set("key3", b"12345")
+
+    assert await cache.get("key1") is None
+    assert (await cache.stats())["bytes"] == 10
+
+    # A single value larger than the bound is not stored at all
+    await cache.set("big", b"x" * 11)
+    assert await cache.get("big") is None
+    assert await cache.get("key3") == b"12345"
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_counters():
+    """Test hit, miss and expiration counters."""
+    cache = AsyncCache(ttl_seconds=1)
+    await cache.set("key1", "value1")
+
+    await cache.get("key1")
+    await cache.get("missing")
+    await asyncio.sleep(1.1)
+    await cache.get("key1")
+
+    stats = await cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["expirations"] == 1
+    assert stats["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_sweeper_removes_unread_expired_entries():
+    """Test that the background sweeper removes keys that are never read again."""
+    cache = AsyncCache(ttl_seconds=1)
+    await cache.set("key1", "value1")
+
+    cache.start_sweeper(interval_seconds=0.2)
+    try:
+        await asyncio.sleep(1.5)
+    finally:
+        await cache.stop_sweeper()
+
+    stats = await cache.stats()
+    assert stats["entries"] == 0
+    assert stats["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_sweeper_survives_failed_sweeps():
+    """Test that a failing purge is logged and the sweeper keeps running."""
+    cache = AsyncCache(ttl_seconds=60)
+    purge = cache._backend.purge_expired
+    calls = 0
+
+    async def flaky_purge():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("database is locked")
+        return await purge()
+
+    cache._backend.purge_expired = flaky_purge
+    cache.start_sweeper(interval_seconds=0.05)
+    try:
+        await asyncio.sleep(0.3)
+        assert not cache._sweeper_task.done()
+    finally:
+        await cache.stop_sweeper()
+
+    assert calls > 1
+
+
+@pytest.mark.asyncio
+async def test_cache_reads_do_not_wait_for_lock():
+    """Test that reads are served while a mutation holds the lock."""
+    cache = AsyncCache(ttl_seconds=60)
+    await cache.set("key1", "value1")
+
+    async with cache._lock:
+        result = await asyncio.wait_for(cache.get("key1"), timeout=0.1)
+
+    assert result == "value1"
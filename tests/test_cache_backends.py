@@ -0,0 +1,116 @@
+"""Tests for cache storage backends."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.cache import AsyncCache
+from src.utils.cache_backends import CacheRecord, SQLiteCacheBackend
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of a temporary SQLite cache file."""
+    return str(tmp_path / "cache.sqlite3")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_round_trip(db_path):
+    """Test that values survive a round trip through SQLite."""
+    backend = SQLiteCacheBackend(db_path)
+    now = time.time()
+    await backend.set("key", CacheRecord({"items": [1, 2]}, now + 60, now + 60))
+
+    record = await backend.get("key")
+
+    assert record is not None
+    assert record.value == {"items": [1, 2]}
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_enforces_hard_ttl(db_path):
+    """Test that records past their hard TTL are removed."""
+    backend = SQLiteCacheBackend(db_path)
+    now = time.time()
+    await backend.set("key", CacheRecord("value", now - 2, now - 1))
+
+    assert await backend.get("key") is None
+    assert (await backend.stats())["expirations"] == 1
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_is_shared_between_instances(db_path):
+    """Test that two caches on the same file (two workers) see each other's values."""
+    worker_a = AsyncCache(ttl_seconds=60, backend=SQLiteCacheBackend(db_path))
+    worker_b = AsyncCache(ttl_seconds=60, backend=SQLiteCacheBackend(db_path))
+
+    await worker_a.set("key", "value")
+
+    assert await worker_b.get("key") == "value"
+    await worker_a.close()
+    await worker_b.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_lease_allows_one_holder(db_path):
+    """Test that only one backend holds a lease until it is released or expires."""
+    backend_a = SQLiteCacheBackend(db_path)
+    backend_b = SQLiteCacheBackend(db_path)
+
+    assert await backend_a.acquire_lease("key", ttl_seconds=60)
+    assert not await backend_b.acquire_lease("key", ttl_seconds=60)
+
+    await backend_a.release_lease("key")
+    assert await backend_b.acquire_lease("key", ttl_seconds=0.1)
+
+    # An expired lease (e.g. crashed holder) can be taken over
+    await asyncio.sleep(0.2)
+    assert await backend_a.acquire_lease("key", ttl_seconds=60)
+    await backend_a.close()
+    await backend_b.close()
+
+
+@pytest.mark.asyncio
+async def test_cross_process_single_flight(db_path):
+    """Test that concurrent misses in two workers trigger one computation."""
+    worker_a = AsyncCache(ttl_seconds=60, backend=SQLiteCacheBackend(db_path))
+    worker_b = AsyncCache(ttl_seconds=60, backend=SQLiteCacheBackend(db_path))
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.2)
+        return "value"
+
+    results = await asyncio.gather(
+        worker_a.get_or_compute("key", compute),
+        worker_b.get_or_compute("key", compute),
+    )
+
+    assert results == ["value", "value"]
+    assert calls == 1
+    await worker_a.close()
+    await worker_b.close()
+
+
+@pytest.mark.asyncio
+async def test_lease_loser_returns_fresh_value_without_waiting(db_path):
+    """Test that a worker losing the lease to a holder that already published does not wait."""
+    holder = SQLiteCacheBackend(db_path)
+    worker = AsyncCache(ttl_seconds=60, backend=SQLiteCacheBackend(db_path), lease_seconds=5)
+    # The holder published a fresh value but has not released its lease yet
+    assert await holder.acquire_lease("key", ttl_seconds=60)
+    now = time.time()
+    await holder.set("key", CacheRecord("published", now + 60, now + 60))
+
+    async def compute():
+        raise AssertionError("must not recompute")
+
+    start = time.monotonic()
+    assert await worker.refresh("key", compute) == "published"
+    assert time.monotonic() - start < 1
+    await worker.close()
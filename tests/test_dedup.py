@@ -0,0 +1,142 @@
+"""Tests for cross-source deduplication."""
+
+from datetime import datetime, timedelta
+
+from src.modules.news.dedup import Deduplicator, canonical_url
+from tests.factories import PUBLISHED_AT as NOW
+from tests.factories import make_item
+
+
+def _ago(hours: float) -> datetime:
+    """Publication time some hours before NOW."""
+    return NOW - timedelta(hours=hours)
+
+
+def test_canonical_url_drops_tracking_and_cosmetic_differences():
+    """Test that variants of a link share one canonical URL."""
+    expected = "https://example.com/post/1?id=3&page=2"
+
+    assert canonical_url("http://www.Example.com/post/1/?page=2&id=3") == expected
+    assert canonical_url("https://example.com:443/post/1?id=3&utm_source=rss&page=2") == expected
+    assert canonical_url("https://m.example.com/post/1?page=2&fbclid=x&id=3#comments") == expected
+    assert canonical_url("https://example.com/post/2") != canonical_url(
+        "https://example.com/post/1"
+    )
+    # A bare domain keeps its www
+    assert canonical_url("https://www.com/a") == "https://www.com/a"
+
+
+def test_same_url_merges_into_hackernews_copy():
+    """Test that copies of a link keep the HN score, comments URL and every tag."""
+    items = [
+        make_item(
+            "rss_1",
+            title="OpenAI ships a new model",
+            url="https://www.example.com/a?utm_medium=feed",
+            tags=["openai"],
+        ),
+        make_item(
+            "hn_1",
+            title="New OpenAI model",
+            url="https://example.com/a/",
+            score=120,
+            comments_url="https://news.ycombinator.com/item?id=hn_1",
+            tags=["ai"],
+        ),
+        make_item("rss_2", title="Unrelated database story", url="https://example.com/b"),
+    ]
+
+    result = Deduplicator().deduplicate(items)
+
+    assert [item.id for item in result.items] == ["hn_1", "rss_2"]
+    merged = result.items[0]
+    assert merged.score == 120
+    assert str(merged.comments_url) == "https://news.ycombinator.com/item?id=hn_1"
+    assert merged.tags == ["ai", "openai"]
+    assert result.merged == [merged]
+    assert result.dropped == ["rss_1"]
+
+
+def test_near_duplicate_titles_merge():
+    """Test that reworded copies at other URLs are merged with MinHash candidates."""
+    items = [
+        make_item(
+            "rss_1",
+            title="Postgres 17 released with faster vacuum",
+            url="https://blog.example.org/pg17",
+            published_at=_ago(2),
+        ),
+        make_item(
+            "rss_2",
+            title="PostgreSQL news: Postgres 17 released with faster vacuum",
+            url="https://news.example.net/pg",
+            published_at=_ago(1),
+        ),
+        make_item(
+            "rss_3", title="Postgres 17 released with faster vacuum!", url="https://other.example/x"
+        ),
+        make_item("rss_4", title="Postgres 16 released", url="https://blog.example.org/pg16"),
+    ]
+
+    result = Deduplicator(title_similarity=0.7).deduplicate(items)
+
+    # No Hacker News copy: the oldest one is kept
+    assert [item.id for item in result.items] == ["rss_1", "rss_4"]
+    assert result.merged == []
+    assert sorted(result.dropped) == ["rss_2", "rss_3"]
+
+
+def test_title_matching_respects_window_length_and_settings():
+    """Test that similar titles far apart, short titles or with titles off stay apart."""
+    recurring = [
+        make_item(
+            "rss_1", title="Weekly Rust compiler performance report", url="https://a.example/1"
+        ),
+        make_item(
+            "rss_2",
+            title="Weekly Rust compiler performance report",
+            url="https://a.example/2",
+            published_at=_ago(24 * 7),
+        ),
+    ]
+    short = [
+        make_item("rss_3", title="Show HN", url="https://b.example/1"),
+        make_item("rss_4", title="Show HN", url="https://b.example/2"),
+    ]
+    same = [
+        make_item("rss_5", title="Rust compiler gets faster builds", url="https://c.example/1"),
+        make_item("rss_6", title="Rust compiler gets faster builds", url="https://c.example/2"),
+    ]
+
+    deduplicator = Deduplicator()
+    assert len(deduplicator.deduplicate(recurring).items) == 2
+    assert len(deduplicator.deduplicate(short).items) == 2
+    result = deduplicator.deduplicate(same)
+    assert len(result.items) == 1
+    assert result.stats() == {"url_duplicates": 0, "title_duplicates": 1}
+    assert len(Deduplicator(title_similarity=None).deduplicate(same).items) == 2
+
+
+def test_highest_scored_hackernews_copy_is_kept_in_place():
+    """Test that the best HN submission is kept, at its own position in the order."""
+    items = [
+        make_item("rss_1", title="Story", url="https://example.com/s", published_at=_ago(1)),
+        make_item("hn_1", title="Other story", url="https://example.com/o", published_at=_ago(2)),
+        make_item(
+            "hn_2",
+            title="Story",
+            url="https://example.com/s?ref=hn",
+            published_at=_ago(3),
+            score=10,
+        ),
+        make_item(
+            "hn_3", title="Story", url="https://example.com/s", published_at=_ago(4), score=40
+        ),
+    ]
+
+    result = Deduplicator().deduplicate(items)
+
+    assert [item.id for item in result.items] == ["hn_1", "hn_3"]
+    assert result.items[1] is items[3]
+    assert result.merged == []
+    assert result.dropped == ["rss_1", "hn_2"]
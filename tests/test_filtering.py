@@ -0,0 +1,61 @@
+"""Tests for filtering utility."""
+
+from src.utils.filtering import classify_news, classify_news_batch, is_relevant_news
+from src.utils.tagging import extract_tags
+
+SAMPLES = [
+    ("OpenAI releases a new model", "https://example.com/openai"),
+    ("Writing Python notebooks", "https://example.com/python"),
+    ("Random Article About Nothing", "https://example.com/random"),
+    ("Artificial Intelligence in 2024", "https://example.com/post"),
+    ("Mail, trail and email", "https://example.com/gaia"),
+    ("Building multi-agent systems", "https://example.com/agents"),
+]
+
+
+def test_is_relevant_news_by_tag():
+    """Test that a relevant tag makes an item relevant."""
+    assert is_relevant_news("Nothing here", "https://example.com", ["nvidia"])
+
+
+def test_is_relevant_news_low_weight_tags():
+    """Test that tags of a low-weight topic do not make an item relevant on their own."""
+    assert not is_relevant_news("Nothing here", "https://example.com", ["python", "notebook"])
+
+
+def test_is_relevant_news_by_text():
+    """Test that relevant words in the title make an item relevant."""
+    assert is_relevant_news("Artificial Intelligence today", "https://example.com", [])
+
+
+def test_is_relevant_news_irrelevant():
+    """Test that unrelated items are not relevant."""
+    assert not is_relevant_news("Python tips", "https://example.com/python", ["python"])
+
+
+def test_classify_news_matches_separate_calls():
+    """Test that the fused classifier agrees with extract_tags + is_relevant_news."""
+    for title, url in SAMPLES:
+        tags = extract_tags(title, url)
+        classification = classify_news(title, url)
+        assert classification.tags == tags
+        assert classification.relevant == is_relevant_news(title, url, tags)
+
+
+def test_classify_news_batch_keeps_order():
+    """Test that batch classification returns one result per item in order."""
+    results = classify_news_batch(SAMPLES)
+
+    assert results == [classify_news(title, url) for title, url in SAMPLES]
+
+
+def test_classify_news_batch_with_process_pool():
+    """Test that chunked classification in worker processes matches the serial path."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    items = SAMPLES * 50
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = classify_news_batch(items, executor=executor, chunk_size=32)
+
+    assert results == classify_news_batch(items)
@@ -0,0 +1,120 @@
+"""Tests for the Hacker News integration."""
+
+import time
+
+import httpx
+import pytest
+
+from src.integrations.hackernews import HN_API_BASE, HackerNewsItemCache, fetch_hackernews_news
+
+
+def _make_client(stories: dict[int, dict], calls: list[str]) -> httpx.AsyncClient:
+    """Build a client backed by an in-memory Hacker News stand-in."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith("/topstories.json"):
+            return httpx.Response(200, json=list(stories))
+        story_id = int(request.url.path.rsplit("/", 1)[-1].removesuffix(".json"))
+        return httpx.Response(200, json=stories[story_id])
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=HN_API_BASE)
+
+
+@pytest.mark.asyncio
+async def test_fetch_hackernews_news_uses_given_client():
+    """Test that all requests go through the shared client."""
+    stories = {
+        1: {"id": 1, "type": "story", "title": "One", "url": "https://example.com/1"},
+        2: {"id": 2, "type": "job", "title": "Two", "url": "https://example.com/2"},
+        3: {"id": 3, "type": "story", "title": "Ask HN"},
+    }
+    calls: list[str] = []
+
+    async with _make_client(stories, calls) as client:
+        result = await fetch_hackernews_news(client, limit=3)
+
+    assert [story["id"] for story in result] == [1]
+    assert len(calls) == 4  # topstories + one request per story
+
+
+@pytest.mark.asyncio
+async def test_fetch_hackernews_news_handles_upstream_error():
+    """Test that a failing top stories request returns an empty list."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        result = await fetch_hackernews_news(client, limit=5)
+
+    assert result == []
+
+
+def _stories(*story_ids: int) -> dict[int, dict]:
+    """Build stories with URLs for the given IDs."""
+    return {
+        story_id: {"id": story_id, "type": "story", "title": f"S{story_id}", "url": "https://e.com"}
+        for story_id in story_ids
+    }
+
+
+@pytest.mark.asyncio
+async def test_item_cache_fetches_only_new_stories():
+    """Test that unchanged top stories are served from the item cache."""
+    stories = _stories(1, 2, 3)
+    calls: list[str] = []
+    cache = HackerNewsItemCache()
+
+    async with _make_client(stories, calls) as client:
+        await fetch_hackernews_news(client, limit=3, item_cache=cache)
+        assert len(calls) == 4
+
+        calls.clear()
+        await fetch_hackernews_news(client, limit=3, item_cache=cache)
+        assert calls == ["/v0/topstories.json"]
+
+        # Story 1 leaves the top list and story 4 enters it
+        del stories[1]
+        stories.update(_stories(4))
+        calls.clear()
+        result = await fetch_hackernews_news(client, limit=3, item_cache=cache)
+
+    assert calls == ["/v0/topstories.json", "/v0/item/4.json"]
+    assert [story["id"] for story in result] == [2, 3, 4]
+    assert cache.stats() == {"items": 3, "hits": 5, "fetches": 4, "refreshes": 0}
+
+
+@pytest.mark.asyncio
+async def test_item_cache_refreshes_oldest_scores_at_a_bounded_rate():
+    """Test that only max_refreshes of the oldest stories are refetched per call."""
+    stories = _stories(1, 2, 3)
+    calls: list[str] = []
+    cache = HackerNewsItemCache(ttl_seconds=900, refresh_after_seconds=60, max_refreshes=1)
+
+    async with _make_client(stories, calls) as client:
+        await fetch_hackernews_news(client, limit=3, item_cache=cache)
+        # Age the cached details past refresh_after_seconds, story 2 the most
+        for story_id, age in ((1, 100), (2, 200), (3, 100)):
+            details, fetched_at = cache._items[story_id]
+            cache._items[story_id] = (details, fetched_at - age)
+        stories[2]["score"] = 42
+
+        calls.clear()
+        result = await fetch_hackernews_news(client, limit=3, item_cache=cache)
+
+    assert calls == ["/v0/topstories.json", "/v0/item/2.json"]
+    assert result[1]["score"] == 42
+    assert cache.stats()["refreshes"] == 1
+
+
+def test_item_cache_refetches_expired_details():
+    """Test that details older than the TTL are planned for a full fetch."""
+    cache = HackerNewsItemCache(ttl_seconds=10, refresh_after_seconds=5)
+    cache.store(1, {"id": 1})
+    cache.store(2, {"id": 2})
+
+    missing, refreshable = cache.plan([1, 2, 3], now=time.time() + 11)
+
+    assert missing == [1, 2, 3]
+    assert refreshable == []
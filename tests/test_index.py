@@ -0,0 +1,50 @@
+"""Tests for the inverted index over snapshot items."""
+
+from datetime import datetime, timedelta
+
+from src.modules.news.index import NewsIndex
+from src.utils.tagging import tokenize
+from tests.factories import PUBLISHED_AT, make_item
+
+
+def _at(minutes_before: int) -> datetime:
+    """Publication time, newer for fewer minutes."""
+    return PUBLISHED_AT - timedelta(minutes=minutes_before)
+
+
+ITEMS = [
+    make_item(
+        "hn_0", title="OpenAI ships a new GPT model", tags=["ai", "openai"], published_at=_at(0)
+    ),
+    make_item("rss_1", title="Python 3.13 released", tags=["python"], published_at=_at(1)),
+    make_item(
+        "hn_2", title="Training a GPT model in Python", tags=["ai", "python"], published_at=_at(2)
+    ),
+    make_item("rss_3", title="Kubernetes tips", tags=["kubernetes"], published_at=_at(3)),
+]
+
+
+def test_tokenize_splits_on_non_alphanumerics():
+    """Test that tokens are lowercase runs of letters and digits."""
+    assert tokenize("GPT-5: the_new Café model!") == ["gpt", "5", "the", "new", "café", "model"]
+
+
+def test_match_intersects_tags_source_and_terms():
+    """Test that every filter must match and results stay in item order."""
+    index = NewsIndex.build(ITEMS)
+
+    assert index.match(tags=["ai"]) == [0, 2]
+    assert index.match(tags=["AI", "python"]) == [2]
+    assert index.match(source="rss") == [1, 3]
+    assert index.match(terms=["gpt", "model"]) == [0, 2]
+    assert index.match(tags=["python"], source="hackernews", terms=["training"]) == [2]
+    assert index.match(tags=["unknown"]) == []
+    assert index.match() == [0, 1, 2, 3]
+
+
+def test_add_assigns_increasing_positions():
+    """Test that items added one by one get consecutive positions."""
+    index = NewsIndex()
+
+    assert [index.add(item) for item in ITEMS] == [0, 1, 2, 3]
+    assert index.match(terms=["kubernetes"]) == [3]
@@ -0,0 +1,179 @@
+"""Tests for per-host latency tracking, adaptive timeouts and hedging."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.integrations.latency import (
+    HEDGE_EXTENSION,
+    AdaptiveTimeoutTransport,
+    HostLatencyTracker,
+    LatencyHistogram,
+)
+from src.integrations.scheduler import FetchScheduler
+
+
+def _warm(tracker: HostLatencyTracker, host: str, seconds: float, count: int = 50) -> None:
+    """Record identical latency samples for a host."""
+    for _ in range(count):
+        tracker.record(host, seconds)
+
+
+def test_histogram_quantiles_have_bounded_relative_error():
+    """Test that quantiles land within one bucket of the true value."""
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+
+    assert 0.050 <= histogram.quantile(0.5) <= 0.050 * 1.2
+    assert 0.099 <= histogram.quantile(0.99) <= 0.099 * 1.2
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+def test_histogram_forgets_old_samples():
+    """Test that a latency shift moves the quantiles once counts are halved."""
+    histogram = LatencyHistogram(max_samples=100)
+    for _ in range(100):
+        histogram.record(0.010)
+    for _ in range(300):
+        histogram.record(1.0)
+
+    assert histogram.count <= 100
+    assert histogram.quantile(0.5) >= 1.0
+
+
+def test_timeout_adapts_within_bounds():
+    """Test that the timeout follows p99 and stays between its bounds."""
+    tracker = HostLatencyTracker(timeout_factor=3, min_timeout=0.5, max_timeout=10, min_samples=20)
+
+    assert tracker.timeout_for("new.com") == 10
+    _warm(tracker, "fast.com", 0.01)
+    _warm(tracker, "medium.com", 1.0)
+    _warm(tracker, "slow.com", 8.0)
+
+    assert tracker.timeout_for("fast.com") == 0.5
+    assert 3.0 <= tracker.timeout_for("medium.com") <= 3.6
+    assert tracker.timeout_for("slow.com") == 10
+
+
+def test_hedge_budget_caps_hedged_share():
+    """Test that at most max_hedge_ratio of a host's requests are hedged."""
+    tracker = HostLatencyTracker(min_samples=20, max_hedge_ratio=0.1)
+    assert tracker.hedge_delay("a.com") is None
+
+    _warm(tracker, "a.com", 0.1, count=30)
+    granted = sum(tracker.try_hedge("a.com") for _ in range(10))
+
+    assert tracker.hedge_delay("a.com") is not None
+    assert granted == 3
+    assert HostLatencyTracker(max_hedge_ratio=0).hedge_delay("a.com") is None
+
+
+@pytest.mark.asyncio
+async def test_transport_applies_adaptive_timeout():
+    """Test that the request timeout is lowered to the host's timeout."""
+    seen = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.update(request.extensions["timeout"])
+        return httpx.Response(200)
+
+    tracker = HostLatencyTracker(min_timeout=0.5, min_samples=1)
+    _warm(tracker, "example.com", 0.01)
+    transport = AdaptiveTimeoutTransport(httpx.MockTransport(handler), tracker)
+
+    async with httpx.AsyncClient(transport=transport, timeout=10) as client:
+        await client.get("https://example.com/")
+
+    assert seen["connect"] == seen["read"] == 0.5
+    assert seen["write"] == 10
+    assert tracker.stats()["example.com"]["requests"] == 51
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged():
+    """Test that a second request answers when the first one stalls."""
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={"attempt": calls})
+
+    tracker = HostLatencyTracker(min_samples=20, max_hedge_ratio=0.5)
+    _warm(tracker, "example.com", 0.01)
+    transport = AdaptiveTimeoutTransport(httpx.MockTransport(handler), tracker)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await asyncio.wait_for(
+            client.get("https://example.com/item", extensions={HEDGE_EXTENSION: True}), 1
+        )
+
+    assert response.json() == {"attempt": 2}
+    stats = tracker.stats()["example.com"]
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_without_hedge_extension_are_not_hedged():
+    """Test that only requests marked idempotent are hedged."""
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200)
+
+    tracker = HostLatencyTracker(min_samples=20, max_hedge_ratio=0.5)
+    _warm(tracker, "example.com", 0.001)
+    transport = AdaptiveTimeoutTransport(httpx.MockTransport(handler), tracker)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.post("https://example.com/submit")
+
+    assert calls == 1
+    assert tracker.stats()["example.com"]["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedged_requests_wait_for_their_own_scheduler_slot():
+    """Test that a hedge counts against the per-host cap instead of sharing a slot."""
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        if attempt == 1:
+            await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"attempt": attempt})
+
+    tracker = HostLatencyTracker(min_samples=20, max_hedge_ratio=0.5)
+    _warm(tracker, "example.com", 0.01)
+    scheduler = FetchScheduler(per_host_concurrency=1)
+    transport = AdaptiveTimeoutTransport(httpx.MockTransport(handler), tracker, scheduler)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("https://example.com/item", extensions={HEDGE_EXTENSION: True})
+
+    # The hedge was queued behind the original request and cancelled with it
+    assert response.json() == {"attempt": 1}
+    assert calls == 1
+    assert tracker.stats()["example.com"]["hedged"] == 1
+    assert scheduler.stats()["active"] == 0
+    assert scheduler.stats()["granted"] == 1
+
+    scheduler = FetchScheduler(per_host_concurrency=2)
+    transport = AdaptiveTimeoutTransport(httpx.MockTransport(handler), tracker, scheduler)
+    calls = 0
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("https://example.com/item", extensions={HEDGE_EXTENSION: True})
+
+    assert response.json() == {"attempt": 2}
+    assert scheduler.stats()["granted"] == 2
+    assert scheduler.stats()["active"] == 0
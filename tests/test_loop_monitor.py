@@ -0,0 +1,36 @@
+"""Tests for the event loop lag monitor."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.loop_monitor import LoopLagMonitor
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_shows_up_as_lag():
+    """Test that blocking the loop is measured as lag."""
+    monitor = LoopLagMonitor(interval_seconds=0.01)
+    monitor.start()
+    await asyncio.sleep(0.05)
+
+    time.sleep(0.2)  # Block the event loop
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    stats = monitor.stats()
+    assert stats["samples"] > 1
+    assert stats["max_ms"] >= 150
+    assert not monitor.running
+
+
+def test_stats_are_empty_before_start():
+    """Test that a monitor without samples reports zeros."""
+    assert LoopLagMonitor().stats() == {
+        "samples": 0,
+        "last_ms": 0.0,
+        "mean_ms": 0.0,
+        "recent_max_ms": 0.0,
+        "max_ms": 0.0,
+    }
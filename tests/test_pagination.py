@@ -0,0 +1,117 @@
+"""Tests for keyset pagination over news snapshots."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.modules.news.models import NewsItem
+from src.modules.news.pagination import (
+    ItemKey,
+    PageQuery,
+    decode_cursor,
+    encode_cursor,
+    item_key,
+)
+from src.modules.news.snapshot import NewsSnapshot
+
+
+def _snapshot(count: int, seed: int = 0) -> NewsSnapshot:
+    """Build a snapshot whose items share publication times in small groups."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    items = [
+        NewsItem(
+            id=f"hn_{i}",
+            title=f"Story {i}",
+            url=f"https://example.com/{i}",
+            source=rng.choice(["hackernews", "rss"]),
+            published_at=start + timedelta(minutes=rng.randrange(count // 2 + 1)),
+            tags=rng.sample(["ai", "python", "cloud"], rng.randrange(3)),
+        )
+        for i in range(count)
+    ]
+    items.sort(key=item_key, reverse=True)
+    return NewsSnapshot(items=items)
+
+
+def _expected(snapshot: NewsSnapshot, query: PageQuery) -> list[str]:
+    """Compute a page by filtering every item."""
+    matching = [
+        item.id
+        for item in snapshot.items
+        if (query.after is None or item_key(item) < query.after)
+        and (query.since is None or item_key(item).published_at > query.since)
+        and (query.until is None or item_key(item).published_at <= query.until)
+        and all(tag in item.tags for tag in query.tags)
+        and (query.source is None or item.source == query.source)
+    ]
+    return matching[: query.limit]
+
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes to the key it was built from."""
+    key = ItemKey(1704110400.5, "rss_1_42")
+
+    assert decode_cursor(encode_cursor(key)) == key
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "WzEsMl0"])
+def test_invalid_cursor_is_rejected(cursor):
+    """Test that malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_page_bounds_match_filtering():
+    """Test that binary-searched pages equal filtered slices for random bounds."""
+    snapshot = _snapshot(200)
+    keys = [item_key(item) for item in snapshot.items]
+    rng = random.Random(1)
+
+    for _ in range(500):
+        query = PageQuery(
+            limit=rng.randrange(1, 30),
+            after=rng.choice([None, *keys]),
+            since=rng.choice([None, rng.choice(keys).published_at]),
+            until=rng.choice([None, rng.choice(keys).published_at]),
+        )
+        start, stop, _ = snapshot.page_bounds(query)
+
+        assert [item.id for item in snapshot.items[start:stop]] == _expected(snapshot, query)
+
+
+def test_cursor_walk_visits_every_item_once():
+    """Test that following cursors returns each item exactly once, in order."""
+    snapshot = _snapshot(103)
+    seen = []
+    query = PageQuery(limit=10)
+
+    while True:
+        start, stop, _ = snapshot.page_bounds(query)
+        if start == stop:
+            break
+        seen.extend(snapshot.items[start:stop])
+        query = query._replace(after=item_key(snapshot.items[stop - 1]))
+
+    assert seen == snapshot.items
+
+
+def test_filtered_pages_match_filtering():
+    """Test that index-backed filtered pages equal filtered slices."""
+    snapshot = _snapshot(300, seed=2)
+    keys = [item_key(item) for item in snapshot.items]
+    rng = random.Random(3)
+
+    for _ in range(500):
+        query = PageQuery(
+            limit=rng.randrange(1, 30),
+            after=rng.choice([None, *keys]),
+            since=rng.choice([None, rng.choice(keys).published_at]),
+            until=rng.choice([None, rng.choice(keys).published_at]),
+            tags=tuple(rng.sample(["ai", "python", "cloud"], rng.randrange(3))),
+            source=rng.choice([None, "hackernews", "rss"]),
+        )
+        positions, _ = snapshot.page_positions(query)
+
+        assert [snapshot.items[p].id for p in positions] == _expected(snapshot, query)
@@ -0,0 +1,81 @@
+"""Tests for the background news snapshot refresher."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.modules.news.refresher import NewsRefresher
+from src.modules.news.service import NewsService
+from src.utils.cache import AsyncCache
+from tests.factories import make_item
+
+
+@pytest.fixture
+def service():
+    """Create a NewsService instance for testing."""
+    return NewsService(cache=AsyncCache(ttl_seconds=60), rss_feed_urls=["https://example.com/feed"])
+
+
+@pytest.mark.asyncio
+async def test_refresh_builds_sorted_snapshot(service):
+    """Test that refresh stores a snapshot sorted newest first."""
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    items = [
+        make_item("hn_1", published_at=now - timedelta(hours=2)),
+        make_item("hn_2", published_at=now),
+        make_item("hn_3", published_at=now - timedelta(hours=1)),
+    ]
+    service._fetch_all_sources = AsyncMock(return_value=(items, {"failed_sources": ["rss_0"]}))
+
+    snapshot = await service.refresh()
+
+    assert snapshot is service.snapshot
+    assert [item.id for item in snapshot.items] == ["hn_2", "hn_3", "hn_1"]
+
+
+@pytest.mark.asyncio
+async def test_get_latest_news_reads_snapshot_without_fetching(service):
+    """Test that requests are served from the snapshot once it exists."""
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    items = [make_item(f"hn_{i}", published_at=now - timedelta(minutes=i)) for i in range(5)]
+    service._fetch_all_sources = AsyncMock(return_value=(items, {"failed_sources": ["rss_0"]}))
+    await service.refresh()
+
+    result = await service.get_latest_news(limit=2)
+
+    assert service._fetch_all_sources.await_count == 1
+    assert [item.id for item in result.items] == ["hn_0", "hn_1"]
+    assert result.meta["failed_sources"] == ["rss_0"]
+    assert result.meta["snapshot_age_seconds"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_items(service):
+    """Test that a failed refresh keeps serving the last good items."""
+    items = [make_item("hn_1", published_at=datetime(2024, 1, 1))]
+    service._fetch_all_sources = AsyncMock(return_value=(items, {"failed_sources": []}))
+    await service.refresh()
+
+    service._fetch_all_sources = AsyncMock(side_effect=Exception("upstream down"))
+    await service.refresh()
+    result = await service.get_latest_news(limit=10)
+
+    assert [item.id for item in result.items] == ["hn_1"]
+    assert result.meta["failed_sources"] == ["all"]
+    assert result.meta["error"] == "upstream down"
+
+
+@pytest.mark.asyncio
+async def test_refresher_runs_periodically(service):
+    """Test that the refresher calls refresh repeatedly until stopped."""
+    service.refresh = AsyncMock(return_value=None)
+    refresher = NewsRefresher(service, interval_seconds=0.01)
+
+    refresher.start()
+    await asyncio.sleep(0.05)
+    await refresher.stop()
+
+    assert service.refresh.await_count >= 2
+    assert not refresher.running
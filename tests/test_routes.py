@@ -21,6 +21,7 @@ async def test_get_news_handles_service_error():
     # Use FastAPI's dependency override
     mock_service = MagicMock()
     mock_service.get_latest_news = AsyncMock(side_effect=Exception("Service error"))
+    mock_service.get_latest_news_json = AsyncMock(side_effect=Exception("Service error"))
     
     app.dependency_overrides[get_news_service] = lambda: mock_service
     
@@ -42,6 +43,9 @@ async def test_get_news_handles_runtime_error():
     mock_service.get_latest_news = AsyncMock(
         side_effect=RuntimeError("Service not initialized")
     )
+    mock_service.get_latest_news_json = AsyncMock(
+        side_effect=RuntimeError("Service not initialized")
+    )
     
     app.dependency_overrides[get_news_service] = lambda: mock_service
     
@@ -60,9 +64,13 @@ def test_get_news_validates_limit_range():
     # Provide a mock service to avoid dependency initialization errors
     from unittest.mock import MagicMock, AsyncMock
     from src.modules.news.models import NewsResponse
+    from src.modules.news.snapshot import EncodedNews
     
     mock_service = MagicMock()
     mock_service.get_latest_news = AsyncMock(return_value=NewsResponse(items=[], meta={}))
+    mock_service.get_latest_news_json = AsyncMock(
+        return_value=EncodedNews(body=b'{"items":[],"meta":{}}')
+    )
     app.dependency_overrides[get_news_service] = lambda: mock_service
     
     try:
@@ -100,3 +108,265 @@ def test_home_route():
     response = client.get("/")
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
+
+
+def test_stats_returns_cache_counters():
+    """Test that the stats endpoint exposes cache counters."""
+    from src.integrations.scheduler import FetchScheduler
+    from src.modules.news.service import NewsService
+    from src.server.dependencies import get_cache, get_fetch_scheduler, get_loop_monitor
+    from src.utils.cache import AsyncCache
+    from src.utils.loop_monitor import LoopLagMonitor
+
+    app.dependency_overrides[get_cache] = lambda: AsyncCache(ttl_seconds=60)
+    app.dependency_overrides[get_loop_monitor] = lambda: LoopLagMonitor()
+    app.dependency_overrides[get_fetch_scheduler] = lambda: FetchScheduler()
+    app.dependency_overrides[get_news_service] = lambda: NewsService(
+        cache=AsyncCache(ttl_seconds=60), rss_feed_urls=[]
+    )
+
+    try:
+        client = TestClient(app)
+        response = client.get("/stats")
+
+        assert response.status_code == 200
+        assert response.json()["cache"]["hits"] == 0
+        assert response.json()["event_loop"]["samples"] == 0
+        assert response.json()["feeds"]["not_modified"] == 0
+        assert response.json()["hackernews"]["hits"] == 0
+        assert response.json()["dedup"]["url_duplicates"] == 0
+        assert response.json()["scheduler"]["granted"] == 0
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_upstream_stats_returns_per_host_latency():
+    """Test that the upstream stats endpoint exposes per-host latency."""
+    from src.integrations.latency import HostLatencyTracker
+    from src.server.dependencies import get_latency_tracker
+
+    tracker = HostLatencyTracker()
+    tracker.record("hacker-news.firebaseio.com", 0.05)
+    app.dependency_overrides[get_latency_tracker] = lambda: tracker
+
+    try:
+        client = TestClient(app)
+        response = client.get("/stats/upstreams")
+
+        assert response.status_code == 200
+        stats = response.json()["hacker-news.firebaseio.com"]
+        assert stats["requests"] == 1
+        assert stats["p50_ms"] >= 50
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_get_news_rejects_invalid_cursor():
+    """Test that a malformed cursor is a client error."""
+    from src.modules.news.service import NewsService
+    from src.utils.cache import AsyncCache
+
+    service = NewsService(cache=AsyncCache(ttl_seconds=60), rss_feed_urls=[])
+    app.dependency_overrides[get_news_service] = lambda: service
+
+    try:
+        client = TestClient(app)
+        response = client.get("/news?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_get_news_rejects_unknown_source():
+    """Test that the source filter only accepts known sources."""
+    from src.modules.news.service import NewsService
+    from src.utils.cache import AsyncCache
+
+    service = NewsService(cache=AsyncCache(ttl_seconds=60), rss_feed_urls=[])
+    app.dependency_overrides[get_news_service] = lambda: service
+
+    try:
+        client = TestClient(app)
+        response = client.get("/news?source=twitter")
+
+        assert response.status_code == 422
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_get_news_returns_pre_serialized_body():
+    """Test that /news returns the service's encoded body and ETag as-is."""
+    from datetime import datetime
+
+    from src.modules.news.models import NewsItem, NewsResponse
+    from src.modules.news.service import NewsService
+    from src.modules.news.snapshot import NewsSnapshot
+    from src.utils.cache import AsyncCache
+
+    service = NewsService(cache=AsyncCache(ttl_seconds=60), rss_feed_urls=[])
+    items = [
+        NewsItem(
+            id="hn_1",
+            title="AI story",
+            url="https://example.com/story",
+            source="hackernews",
+            published_at=datetime(2024, 1, 1, 12, 0, 0),
+            score=10,
+            comments_url="https://news.ycombinator.com/item?id=1",
+            tags=["ai"],
+        )
+    ]
+    service._snapshot = NewsSnapshot(items=items, meta={"failed_sources": []})
+    app.dependency_overrides[get_news_service] = lambda: service
+
+    try:
+        client = TestClient(app)
+        response = client.get("/news?limit=5")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["etag"]
+        body = NewsResponse.model_validate_json(response.content)
+        assert body.items == items
+        assert body.meta["failed_sources"] == []
+        assert "snapshot_age_seconds" in body.meta
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_get_news_conditional_request_returns_304():
+    """Test ETag / If-None-Match handling and Cache-Control on /news."""
+    from src.modules.news.snapshot import EncodedNews
+
+    mock_service = MagicMock()
+    mock_service.get_latest_news_json = AsyncMock(
+        return_value=EncodedNews(
+            body=b'{"items":[],"meta":{}}',
+            etag='"abc"',
+            max_age=42,
+            stale_while_revalidate=30,
+        )
+    )
+    app.dependency_overrides[get_news_service] = lambda: mock_service
+
+    try:
+        client = TestClient(app)
+
+        response = client.get("/news")
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"abc"'
+        assert response.headers["cache-control"] == (
+            "public, max-age=42, stale-while-revalidate=30"
+        )
+
+        response = client.get("/news", headers={"If-None-Match": '"abc"'})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == '"abc"'
+
+        response = client.get("/news", headers={"If-None-Match": 'W/"old", W/"abc"'})
+        assert response.status_code == 304
+
+        response = client.get("/news", headers={"If-None-Match": '"old"'})
+        assert response.status_code == 200
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_get_news_error_payload_is_not_cacheable():
+    """Test that degraded responses without an ETag are marked no-store."""
+    from src.modules.news.snapshot import EncodedNews
+
+    mock_service = MagicMock()
+    mock_service.get_latest_news_json = AsyncMock(
+        return_value=EncodedNews(body=b'{"items":[],"meta":{"failed_sources":["all"]}}')
+    )
+    app.dependency_overrides[get_news_service] = lambda: mock_service
+
+    try:
+        client = TestClient(app)
+        response = client.get("/news", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-store"
+        assert "etag" not in response.headers
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_search_returns_ranked_items():
+    """Test that /search passes the query to the service and validates it."""
+    from src.modules.news.models import NewsResponse
+
+    mock_service = MagicMock()
+    mock_service.search = AsyncMock(return_value=NewsResponse(items=[], meta={"query": "rust"}))
+    app.dependency_overrides[get_news_service] = lambda: mock_service
+
+    try:
+        client = TestClient(app)
+        response = client.get("/search?q=rust&limit=5")
+
+        assert response.status_code == 200
+        assert response.json()["meta"]["query"] == "rust"
+        mock_service.search.assert_awaited_once_with("rust", 5)
+        assert client.get("/search").status_code == 422
+        assert client.get("/search?q=rust&limit=100").status_code == 422
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_admin_taxonomy_reload(tmp_path):
+    """Test that the admin endpoint reloads the taxonomy file."""
+    import json
+
+    from src.server.dependencies import get_admin_token, get_taxonomy_reloader
+    from src.utils.taxonomy import TaxonomyReloader, get_taxonomy, set_taxonomy
+
+    path = tmp_path / "taxonomy.json"
+    path.write_text(json.dumps({"topics": [{"name": "db", "tags": ["postgres", "sqlite"]}]}))
+    app.dependency_overrides[get_taxonomy_reloader] = lambda: TaxonomyReloader(path)
+    app.dependency_overrides[get_admin_token] = lambda: "secret"
+    headers = {"Authorization": "Bearer secret"}
+    active = get_taxonomy()
+
+    try:
+        client = TestClient(app)
+        response = client.post("/admin/taxonomy/reload", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["tags"] == 2
+        assert get_taxonomy().tags == ("postgres", "sqlite")
+
+        path.write_text("{broken")
+        response = client.post("/admin/taxonomy/reload", headers=headers)
+
+        assert response.status_code == 500
+        assert str(path) not in response.text
+        assert get_taxonomy().tags == ("postgres", "sqlite")
+    finally:
+        set_taxonomy(active)
+        app.dependency_overrides.clear()
+
+
+def test_admin_taxonomy_reload_requires_token(tmp_path):
+    """Test that the admin endpoint is disabled without a token and rejects wrong ones."""
+    from src.server.dependencies import get_admin_token, get_taxonomy_reloader
+    from src.utils.taxonomy import TaxonomyReloader
+
+    reloader = TaxonomyReloader(tmp_path / "missing.json")
+    reloader.reload = AsyncMock()
+    app.dependency_overrides[get_taxonomy_reloader] = lambda: reloader
+
+    try:
+        client = TestClient(app)
+        app.dependency_overrides[get_admin_token] = lambda: None
+        assert client.post("/admin/taxonomy/reload").status_code == 404
+
+        app.dependency_overrides[get_admin_token] = lambda: "secret"
+        assert client.post("/admin/taxonomy/reload").status_code == 401
+        response = client.post("/admin/taxonomy/reload", headers={"Authorization": "Bearer wrong"})
+        assert response.status_code == 401
+        reloader.reload.assert_not_awaited()
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,124 @@
+"""Tests for the RSS integration."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import httpx
+import pytest
+
+from src.integrations.rss import _parse_feed, create_feed_parser_pool, fetch_rss_news
+
+FEED = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>Caf\xe9 AI news</title><link>https://example.com/1</link>
+<pubDate>Mon, 01 Jan 2024 12:00:00 GMT</pubDate></item>
+<item><title>Second</title><link>https://example.com/2</link></item>
+</channel></rss>""".encode("iso-8859-1")
+
+
+def test_parse_feed_decodes_raw_bytes():
+    """Test that parsing raw bytes honours the declared encoding."""
+    entries = _parse_feed(FEED, limit=10)
+
+    assert entries[0]["title"] == "Caf\xe9 AI news"
+    assert entries[0]["url"] == "https://example.com/1"
+    assert entries[0]["published_at"] == datetime(2024, 1, 1, 12, 0, 0)
+    assert isinstance(entries[1]["published_at"], datetime)
+
+
+def test_parse_feed_respects_limit():
+    """Test that at most limit entries are returned."""
+    assert len(_parse_feed(FEED, limit=1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_rss_news_parses_in_executor():
+    """Test that the feed is parsed in the given pool."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=FEED))
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-parser") as executor:
+        async with httpx.AsyncClient(transport=transport) as client:
+            entries = await fetch_rss_news(
+                client, "https://example.com/feed", parser_executor=executor
+            )
+
+    assert [entry["url"] for entry in entries] == ["https://example.com/1", "https://example.com/2"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_rss_news_handles_upstream_error():
+    """Test that an HTTP error yields an empty list."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(503))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        assert await fetch_rss_news(client, "https://example.com/feed") == []
+
+
+def test_create_feed_parser_pool_rejects_unknown_kind():
+    """Test that an unknown pool kind is rejected."""
+    with pytest.raises(ValueError):
+        create_feed_parser_pool(kind="fiber")
+
+
+def _conditional_client(requests: list[httpx.Request], validator: str) -> httpx.AsyncClient:
+    """Build a client backed by a feed server that honours one validator header."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if validator == "etag":
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=FEED, headers={"ETag": '"v1"'})
+        last_modified = "Mon, 01 Jan 2024 12:00:00 GMT"
+        if request.headers.get("If-Modified-Since") == last_modified:
+            return httpx.Response(304)
+        return httpx.Response(200, content=FEED, headers={"Last-Modified": last_modified})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("validator", ["etag", "last_modified"])
+async def test_not_modified_feed_reuses_parsed_entries(validator, monkeypatch):
+    """Test that a 304 reuses the previous entries without parsing again."""
+    from src.integrations import rss
+    from src.integrations.rss import FeedValidatorStore
+
+    parses = []
+    original_parse = rss._parse_feed
+
+    def counting_parse(content: bytes, limit: int) -> list[dict]:
+        parses.append(content)
+        return original_parse(content, limit)
+
+    monkeypatch.setattr(rss, "_parse_feed", counting_parse)
+    requests: list[httpx.Request] = []
+    store = FeedValidatorStore()
+
+    async with _conditional_client(requests, validator) as client:
+        first = await fetch_rss_news(client, "https://example.com/feed", validators=store)
+        second = await fetch_rss_news(client, "https://example.com/feed", validators=store)
+
+    assert second == first
+    assert len(parses) == 1
+    assert "If-None-Match" not in requests[0].headers
+    assert "If-Modified-Since" not in requests[0].headers
+    assert store.stats() == {"feeds": 1, "downloads": 1, "not_modified": 1}
+
+
+@pytest.mark.asyncio
+async def test_larger_limit_skips_conditional_request():
+    """Test that stored entries are not reused for a request asking for more items."""
+    from src.integrations.rss import FeedValidatorStore
+
+    requests: list[httpx.Request] = []
+    store = FeedValidatorStore()
+
+    async with _conditional_client(requests, "etag") as client:
+        await fetch_rss_news(client, "https://example.com/feed", limit=1, validators=store)
+        entries = await fetch_rss_news(
+            client, "https://example.com/feed", limit=2, validators=store
+        )
+
+    assert len(entries) == 2
+    assert "If-None-Match" not in requests[1].headers
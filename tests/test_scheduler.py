@@ -0,0 +1,129 @@
+"""Tests for the fetch scheduler."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.integrations.scheduler import (
+    PRIORITY_EXTENSION,
+    FetchScheduler,
+    ScheduledTransport,
+    parse_rate_limits,
+)
+
+
+async def _run(scheduler: FetchScheduler, host: str, active: dict, peaks: dict) -> None:
+    """Hold a slot briefly while tracking concurrency per host and overall."""
+    async with scheduler.slot(host):
+        for key in (host, "all"):
+            active[key] = active.get(key, 0) + 1
+            peaks[key] = max(peaks.get(key, 0), active[key])
+        await asyncio.sleep(0.01)
+        for key in (host, "all"):
+            active[key] -= 1
+
+
+@pytest.mark.asyncio
+async def test_global_and_per_host_caps():
+    """Test that neither cap is ever exceeded."""
+    scheduler = FetchScheduler(max_concurrency=3, per_host_concurrency=2)
+    active: dict[str, int] = {}
+    peaks: dict[str, int] = {}
+
+    await asyncio.gather(
+        *(_run(scheduler, host, active, peaks) for host in ["a.com", "b.com"] * 10)
+    )
+
+    assert peaks == {"a.com": 2, "b.com": 2, "all": 3}
+    assert scheduler.stats()["active"] == 0
+    assert scheduler.stats()["granted"] == 20
+
+
+@pytest.mark.asyncio
+async def test_saturated_host_does_not_block_others():
+    """Test that a waiter for a free host skips ahead of a saturated host."""
+    scheduler = FetchScheduler(max_concurrency=5, per_host_concurrency=1)
+    await scheduler.acquire("slow.com")
+
+    blocked = asyncio.create_task(scheduler.acquire("slow.com", priority=0))
+    other = asyncio.create_task(scheduler.acquire("fast.com", priority=10))
+    await asyncio.sleep(0)
+
+    assert other.done()
+    assert not blocked.done()
+    scheduler.release("slow.com")
+    await blocked
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_by_priority():
+    """Test that lower priorities are granted first."""
+    scheduler = FetchScheduler(max_concurrency=1)
+    order: list[int] = []
+
+    async def request(priority: int) -> None:
+        async with scheduler.slot("a.com", priority):
+            order.append(priority)
+
+    async with scheduler.slot("a.com"):
+        tasks = [asyncio.create_task(request(priority)) for priority in (5, 1, 3)]
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+    assert order == [1, 3, 5]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_requests():
+    """Test that a token bucket holds a host to its request rate."""
+    scheduler = FetchScheduler(rate_limits={"a.com": (20.0, 1)})
+
+    start = time.monotonic()
+    for _ in range(5):
+        async with scheduler.slot("a.com"):
+            pass
+
+    # First token is available immediately, the other four 50 ms apart
+    assert time.monotonic() - start >= 0.18
+
+
+def test_parse_rate_limits():
+    """Test parsing of host=rate[:burst] lists."""
+    assert parse_rate_limits("A.com=20:40, b.com=0.5") == {"a.com": (20.0, 40), "b.com": (0.5, 1)}
+    with pytest.raises(ValueError):
+        parse_rate_limits("a.com")
+
+
+@pytest.mark.asyncio
+async def test_scheduled_transport_bounds_requests():
+    """Test that requests through the transport respect caps and priorities."""
+    scheduler = FetchScheduler(max_concurrency=2, per_host_concurrency=1)
+    in_flight = 0
+    peak = 0
+    seen: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        seen.append(request.url.path)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text="ok")
+
+    transport = ScheduledTransport(httpx.MockTransport(handler), scheduler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        responses = await asyncio.gather(
+            *(
+                client.get(f"https://a.com/{i}", extensions={PRIORITY_EXTENSION: -i})
+                for i in range(4)
+            )
+        )
+
+    assert all(response.text == "ok" for response in responses)
+    assert peak == 1
+    # The first request got the free slot, the rest ran highest priority first
+    assert seen == ["/0", "/3", "/2", "/1"]
+    assert scheduler.stats()["active"] == 0
@@ -0,0 +1,198 @@
+"""Tests for the full-text BM25 search index."""
+
+import math
+import random
+from datetime import datetime, timedelta
+
+from src.modules.news.search import SearchIndex, document_terms
+from src.utils.tagging import tokenize
+from tests.factories import PUBLISHED_AT as NOW
+from tests.factories import make_item
+
+
+def _ago(hours: float) -> datetime:
+    """Publication time some hours before NOW."""
+    return NOW - timedelta(hours=hours)
+
+
+def _ids(index: SearchIndex, query: str, limit: int = 20) -> list[str]:
+    """Search at NOW and return the IDs of the hits."""
+    return [hit.item.id for hit in index.search(query, limit, now=NOW.timestamp()).hits]
+
+
+def _exhaustive_scores(index: SearchIndex, query: str, now: float) -> list[float]:
+    """Score every indexed item with the textbook BM25 formula and recency weight."""
+    documents = list(index._documents.values())
+    terms = set(tokenize(query))
+    average_length = sum(document.length for document in documents) / len(documents)
+    scores = []
+    for document in documents:
+        score = 0.0
+        for term in terms & document.terms.keys():
+            df = sum(term in other.terms for other in documents)
+            idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+            frequency = document.terms[term]
+            norm = 1.2 * (1 - 0.75 + 0.75 * document.length / average_length)
+            score += idf * frequency * 2.2 / (frequency + norm)
+        if score:
+            age = max(0.0, now - document.published_at)
+            scores.append(score * (1 + math.exp(-math.log(2) * age / 86400)))
+    return sorted(scores, reverse=True)
+
+
+def test_document_terms_cover_title_url_and_tags():
+    """Test that titles, URL host and path, and tags are all indexed."""
+    item = make_item(
+        "rss_1",
+        title="Serving LLMs",
+        url="https://blog.example.org/posts/gpu-inference",
+        tags=["machine learning"],
+    )
+
+    assert set(document_terms(item)) == set(
+        "serving llms blog example org posts gpu inference machine learning".split()
+    )
+
+
+def test_items_matching_more_and_rarer_terms_rank_higher():
+    """Test BM25 ordering: more query terms, and rarer ones, score higher."""
+    index = SearchIndex()
+    index.add(
+        [
+            make_item("hn_0", title="Rust compiler internals"),
+            make_item("hn_1", title="Rust web framework"),
+            make_item("hn_2", title="Python web framework"),
+            make_item("hn_3", title="Go web framework"),
+        ]
+    )
+
+    assert _ids(index, "rust framework")[:2] == ["hn_1", "hn_0"]
+    assert _ids(index, "compiler") == ["hn_0"]
+    assert _ids(index, "unknown words") == []
+
+
+def test_recency_breaks_ties():
+    """Test that among equally relevant items the newest ranks first."""
+    index = SearchIndex(recency_half_life_seconds=3600)
+    index.add(
+        [
+            make_item("hn_0", title="GPU prices", published_at=_ago(48)),
+            make_item("hn_1", title="GPU prices", published_at=_ago(1)),
+        ]
+    )
+
+    hits = index.search("gpu", now=NOW.timestamp()).hits
+
+    assert [hit.item.id for hit in hits] == ["hn_1", "hn_0"]
+    assert hits[0].score > hits[1].score
+
+
+def test_readding_items_updates_the_index():
+    """Test that changed items are re-indexed and unchanged ones only updated."""
+    index = SearchIndex()
+    index.add([make_item("hn_0", title="Old headline"), make_item("hn_1", title="Other story")])
+    index.add(
+        [
+            make_item("hn_0", title="New headline"),
+            make_item("hn_1", title="Other story").model_copy(update={"score": 7}),
+        ]
+    )
+
+    assert _ids(index, "old") == []
+    assert _ids(index, "new") == ["hn_0"]
+    assert index.search("other", now=NOW.timestamp()).hits[0].item.score == 7
+    assert index.stats()["documents"] == 2
+
+
+def test_discarded_items_are_no_longer_found():
+    """Test that discarded items leave the index and unknown IDs are ignored."""
+    index = SearchIndex()
+    index.add([make_item("hn_0", title="Kafka streams"), make_item("hn_1", title="Kafka connect")])
+
+    index.discard(["hn_0", "hn_9"])
+
+    assert _ids(index, "kafka streams") == ["hn_1"]
+    assert "streams" not in index._postings
+    assert len(index) == 1
+
+
+def test_oldest_items_are_evicted():
+    """Test that the index keeps the max_documents newest items."""
+    index = SearchIndex(max_documents=2)
+    index.add(
+        [make_item(f"hn_{i}", title=f"Database news {i}", published_at=_ago(i)) for i in range(4)]
+    )
+
+    assert len(index) == 2
+    assert _ids(index, "database") == ["hn_0", "hn_1"]
+    assert "3" not in index._postings
+
+
+def test_rolling_eviction_keeps_postings_consistent():
+    """Test that batches added newest first and evicted oldest first keep exact rankings."""
+    rng = random.Random(11)
+    words = [f"w{i}" for i in range(20)]
+    index = SearchIndex(max_documents=150, max_candidates=None)
+    for batch in range(10):
+        # Each batch is newer than the previous one, and listed newest first
+        index.add(
+            make_item(
+                f"hn_{i}", title=" ".join(rng.choices(words, k=4)), published_at=_ago(1000 - i)
+            )
+            for i in range(batch * 50 + 49, batch * 50 - 1, -1)
+        )
+
+    assert sorted(index._doc_ids) == [f"hn_{i}" for i in range(350, 500)]
+    for term, postings in index._postings.items():
+        live = list(zip(postings.times, postings.docs, strict=True))[postings.start :]
+        assert live == sorted(live)
+        assert len(postings) == sum(
+            term in document.terms for document in index._documents.values()
+        )
+    now = NOW.timestamp()
+    for query in ["w0", "w1 w2 w3"]:
+        expected = _exhaustive_scores(index, query, now)[:10]
+        scores = [hit.score for hit in index.search(query, 10, now=now).hits]
+        assert len(scores) == len(expected)
+        assert all(map(math.isclose, scores, expected))
+
+
+def test_search_matches_exhaustive_scoring():
+    """Test that pruning returns exactly the best exhaustive scores."""
+    rng = random.Random(7)
+    words = [f"w{i}" for i in range(60)]
+    index = SearchIndex(max_candidates=None)
+    for round_ in range(3):
+        # Later rounds replace some items, exercising removal
+        index.add(
+            make_item(
+                f"hn_{i}",
+                title=" ".join(rng.choices(words, weights=range(60, 0, -1), k=rng.randint(2, 9))),
+                published_at=_ago(rng.uniform(0, 200)),
+            )
+            for i in range(round_ * 100, 600)
+        )
+
+    now = NOW.timestamp()
+    for query in ["w0", "w1 w2", "w3 w40 w59", "w0 w1 w2 w3 w4 w5", "w59 w59"]:
+        results = index.search(query, 10, now=now)
+        expected = _exhaustive_scores(index, query, now)[:10]
+        assert results.exhaustive
+        assert len(results.hits) == len(expected)
+        for hit, score in zip(results.hits, expected, strict=True):
+            assert math.isclose(hit.score, score)
+
+
+def test_candidate_budget_keeps_selective_matches():
+    """Test that a broad query out of budget still finds old items with its rare terms."""
+    index = SearchIndex(max_candidates=5)
+    index.add(
+        make_item(f"hn_{i}", title=f"weekly news roundup {i}", published_at=_ago(i))
+        for i in range(50)
+    )
+    index.add([make_item("hn_99", title="weekly quasar news", published_at=_ago(500))])
+
+    results = index.search("weekly quasar news", 3, now=NOW.timestamp())
+
+    assert not results.exhaustive
+    assert results.hits[0].item.id == "hn_99"
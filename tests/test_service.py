@@ -0,0 +1,510 @@
+"""Tests for NewsService pool caching behavior."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.modules.news.models import NewsItem, NewsResponse
+from src.modules.news.service import NEWS_POOL_CACHE_KEY, NewsService
+from src.utils.cache import AsyncCache
+from tests.factories import PUBLISHED_AT, make_item
+
+
+def _items(count: int) -> list[NewsItem]:
+    """Build news items published one minute apart, oldest first."""
+    return [
+        make_item(
+            f"hn_{i}",
+            title=f"AI story {i}",
+            published_at=PUBLISHED_AT + timedelta(minutes=i),
+            tags=["ai"],
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def service():
+    """Create a NewsService instance for testing."""
+    return NewsService(cache=AsyncCache(ttl_seconds=60), rss_feed_urls=["https://example.com/feed"])
+
+
+@pytest.mark.asyncio
+async def test_all_limits_share_one_fetch(service):
+    """Test that different limits are served from a single cached pool."""
+    service._fetch_all_sources = AsyncMock(return_value=(_items(60), {"failed_sources": []}))
+
+    small = await service.get_latest_news(limit=10)
+    medium = await service.get_latest_news(limit=20)
+    large = await service.get_latest_news(limit=50)
+
+    assert service._fetch_all_sources.await_count == 1
+    assert len(small.items) == 10
+    assert len(medium.items) == 20
+    assert len(large.items) == 50
+    assert medium.items[:10] == small.items
+    assert await service._cache.get(NEWS_POOL_CACHE_KEY) is not None
+
+
+@pytest.mark.asyncio
+async def test_pool_is_sliced_newest_first(service):
+    """Test that slicing the pool returns the newest items."""
+    service._fetch_all_sources = AsyncMock(return_value=(_items(5), {"failed_sources": []}))
+
+    result = await service.get_latest_news(limit=2)
+
+    assert [item.id for item in result.items] == ["hn_4", "hn_3"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_trigger_one_fetch(service):
+    """Test that concurrent requests on a cold cache share one upstream fetch."""
+
+    async def slow_fetch():
+        await asyncio.sleep(0.05)
+        return _items(10), {"failed_sources": []}
+
+    service._fetch_all_sources = AsyncMock(side_effect=slow_fetch)
+
+    results = await asyncio.gather(*(service.get_latest_news(limit=5) for _ in range(20)))
+
+    assert service._fetch_all_sources.await_count == 1
+    assert all(len(result.items) == 5 for result in results)
+
+
+@pytest.mark.asyncio
+async def test_stale_pool_is_flagged_in_meta():
+    """Test that a pool served past its TTL is reported as stale."""
+    service = NewsService(
+        cache=AsyncCache(ttl_seconds=1, stale_ttl_seconds=60),
+        rss_feed_urls=["https://example.com/feed"],
+    )
+    service._fetch_all_sources = AsyncMock(return_value=(_items(3), {"failed_sources": []}))
+
+    fresh = await service.get_latest_news(limit=3)
+    assert fresh.meta["served_stale"] is False
+
+    await asyncio.sleep(1.1)
+    stale = await service.get_latest_news(limit=3)
+    assert stale.meta["served_stale"] is True
+
+
+@pytest.mark.asyncio
+async def test_workers_sharing_cache_refresh_once(tmp_path):
+    """Test that a worker adopts the pool another worker already refreshed."""
+    from src.utils.cache_backends import SQLiteCacheBackend
+
+    path = str(tmp_path / "cache.sqlite3")
+    workers = [
+        NewsService(
+            cache=AsyncCache(ttl_seconds=60, backend=SQLiteCacheBackend(path)),
+            rss_feed_urls=["https://example.com/feed"],
+        )
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker._fetch_all_sources = AsyncMock(return_value=(_items(3), {"failed_sources": []}))
+
+    await workers[0].refresh()
+    await workers[1].refresh()
+
+    assert workers[0]._fetch_all_sources.await_count == 1
+    assert workers[1]._fetch_all_sources.await_count == 0
+    assert workers[1].snapshot.items == workers[0].snapshot.items
+
+
+@pytest.mark.asyncio
+async def test_encoded_news_matches_model_and_is_memoized(service):
+    """Test that the pre-serialized body matches the model and is reused."""
+    from src.modules.news.models import NewsResponse
+
+    service._fetch_all_sources = AsyncMock(return_value=(_items(5), {"failed_sources": []}))
+    await service.refresh()
+
+    first = await service.get_latest_news_json(limit=3)
+    second = await service.get_latest_news_json(limit=3)
+    expected = await service.get_latest_news(limit=3)
+
+    decoded = NewsResponse.model_validate_json(first.body)
+    assert decoded.items == expected.items
+    assert decoded.meta["failed_sources"] == []
+    assert first.etag == second.etag
+    # Weak: the body also carries the per-request snapshot age
+    assert first.etag.startswith('W/"')
+    assert service.snapshot.encoded_items(3)[0] is service.snapshot.encoded_items(3)[0]
+    assert service.snapshot.encoded_items(4)[1] != first.etag
+
+
+def _budget_service(budget_seconds: float) -> NewsService:
+    """Create a NewsService with a shared client and a fetch budget."""
+    return NewsService(
+        cache=AsyncCache(ttl_seconds=60),
+        rss_feed_urls=["https://example.com/fast", "https://example.com/slow"],
+        http_client=AsyncMock(),
+        fetch_budget_seconds=budget_seconds,
+    )
+
+
+def _rss_entry(slug: str) -> dict:
+    """Build a raw RSS entry about AI."""
+    return {
+        "title": f"AI story {slug}",
+        "url": f"https://example.com/{slug}",
+        "published_at": datetime(2024, 1, 1, 12, 0, 0),
+    }
+
+
+@pytest.mark.asyncio
+async def test_late_sources_do_not_delay_the_pool(monkeypatch):
+    """Test that sources slower than the budget are reported and finish in the background."""
+    release_slow = asyncio.Event()
+    slow_calls = 0
+
+    async def fake_rss(client, url, limit, **kwargs):
+        nonlocal slow_calls
+        if url.endswith("slow"):
+            slow_calls += 1
+            await release_slow.wait()
+            return [_rss_entry("slow")]
+        return [_rss_entry("fast")]
+
+    monkeypatch.setattr("src.modules.news.service.fetch_rss_news", fake_rss)
+    monkeypatch.setattr(
+        "src.modules.news.service.fetch_hackernews_news", AsyncMock(return_value=[])
+    )
+    service = _budget_service(0.05)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    items, meta = await service._fetch_all_sources()
+
+    assert loop.time() - started < 1
+    assert [str(item.url) for item in items] == ["https://example.com/fast"]
+    assert meta == {"failed_sources": [], "late_sources": ["rss_1"]}
+
+    # A refresh while the slow feed is still running joins its fetch
+    items, meta = await service._fetch_all_sources()
+    assert meta["late_sources"] == ["rss_1"]
+    assert slow_calls == 1
+
+    # Once it finished in the background, its items stand in while it is late again
+    slow_task = service._source_tasks["rss_1"]
+    release_slow.set()
+    await slow_task
+    await asyncio.sleep(0)
+    assert service._source_tasks == {}
+    release_slow.clear()
+    items, meta = await service._fetch_all_sources()
+    assert meta["late_sources"] == ["rss_1"]
+    assert sorted(str(item.url) for item in items) == [
+        "https://example.com/fast",
+        "https://example.com/slow",
+    ]
+
+    await service.close()
+    assert service._source_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_no_budget_waits_for_every_source(monkeypatch):
+    """Test that a zero budget waits for slow sources."""
+
+    async def fake_rss(client, url, limit, **kwargs):
+        if url.endswith("slow"):
+            await asyncio.sleep(0.05)
+        return [_rss_entry(url.rsplit("/", 1)[-1])]
+
+    monkeypatch.setattr("src.modules.news.service.fetch_rss_news", fake_rss)
+    monkeypatch.setattr(
+        "src.modules.news.service.fetch_hackernews_news", AsyncMock(side_effect=RuntimeError)
+    )
+    service = _budget_service(0)
+
+    items, meta = await service._fetch_all_sources()
+
+    assert len(items) == 2
+    assert meta == {"failed_sources": ["hackernews"], "late_sources": []}
+
+
+@pytest.mark.asyncio
+async def test_restart_serves_stored_items_until_refreshed(tmp_path):
+    """Test that a new service restores the pool from the store, then refreshes it."""
+    from src.modules.news.store import NewsStore
+
+    path = str(tmp_path / "store.sqlite3")
+    first = NewsService(cache=AsyncCache(ttl_seconds=60), rss_feed_urls=[], store=NewsStore(path))
+    first._fetch_all_sources = AsyncMock(return_value=(_items(3), {"failed_sources": []}))
+    await first.refresh()
+
+    restarted = NewsService(
+        cache=AsyncCache(ttl_seconds=60), rss_feed_urls=[], store=NewsStore(path)
+    )
+    restarted._fetch_all_sources = AsyncMock(return_value=(_items(5), {"failed_sources": []}))
+
+    assert await restarted.restore() is not None
+    assert restarted.search_stats()["documents"] == 3
+    restored = await restarted.get_latest_news(limit=10)
+    assert [item.id for item in restored.items] == ["hn_2", "hn_1", "hn_0"]
+    assert restored.meta["restored_from_store"] is True
+    assert restarted._fetch_all_sources.await_count == 0
+
+    await restarted.refresh()
+    refreshed = await restarted.get_latest_news(limit=10)
+    assert len(refreshed.items) == 5
+    assert "restored_from_store" not in refreshed.meta
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_continue_into_the_store(tmp_path, monkeypatch):
+    """Test that pages past the snapshot are read from the store without repeats."""
+    from src.modules.news import service as service_module
+    from src.modules.news.store import NewsStore
+
+    monkeypatch.setattr(service_module, "STORED_POOL_SIZE", 8)
+    service = NewsService(
+        cache=AsyncCache(ttl_seconds=60),
+        rss_feed_urls=[],
+        store=NewsStore(str(tmp_path / "store.sqlite3")),
+    )
+    service._fetch_all_sources = AsyncMock(return_value=(_items(20), {"failed_sources": []}))
+    await service.refresh()
+    assert len(service.snapshot.items) == 8
+
+    ids = []
+    cursor = None
+    while True:
+        page = await service.get_latest_news(limit=3, cursor=cursor)
+        ids.extend(item.id for item in page.items)
+        cursor = page.meta["next_cursor"]
+        if cursor is None:
+            break
+
+    assert ids == [f"hn_{i}" for i in range(19, -1, -1)]
+
+    # The pre-serialized body pages the same way
+    first = NewsResponse.model_validate_json((await service.get_latest_news_json(limit=6)).body)
+    second = NewsResponse.model_validate_json(
+        (await service.get_latest_news_json(limit=6, cursor=first.meta["next_cursor"])).body
+    )
+    assert [item.id for item in first.items + second.items] == ids[:12]
+
+
+@pytest.mark.asyncio
+async def test_filtered_pages_continue_into_the_store(tmp_path, monkeypatch):
+    """Test that filtered cursors page past the snapshot through the store."""
+    from src.modules.news import service as service_module
+    from src.modules.news.store import NewsStore
+
+    monkeypatch.setattr(service_module, "STORED_POOL_SIZE", 8)
+    store = NewsStore(str(tmp_path / "store.sqlite3"))
+    service = NewsService(cache=AsyncCache(ttl_seconds=60), rss_feed_urls=[], store=store)
+    items = _items(20)
+    for item in items[::2]:
+        item.tags.append("python")
+    service._fetch_all_sources = AsyncMock(return_value=(items, {"failed_sources": []}))
+    await service.refresh()
+    assert len(service.snapshot.items) == 8
+
+    ids = []
+    cursor = None
+    while True:
+        page = await service.get_latest_news(
+            limit=3, cursor=cursor, tags=["python,ai"], source="hackernews"
+        )
+        ids.extend(item.id for item in page.items)
+        cursor = page.meta["next_cursor"]
+        if cursor is None:
+            break
+
+    assert ids == [f"hn_{i}" for i in range(18, -1, -2)]
+    text = NewsResponse.model_validate_json(
+        (await service.get_latest_news_json(limit=5, q="story 3")).body
+    )
+    assert [item.id for item in text.items] == ["hn_3"]
+    assert (await service.get_latest_news(limit=5, source="rss")).items == []
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_since_returns_only_newer_items(service):
+    """Test that since keeps items published strictly after the given time."""
+    since = _items(10)[6].published_at
+    service._fetch_all_sources = AsyncMock(return_value=(_items(10), {"failed_sources": []}))
+    await service.refresh()
+
+    page = await service.get_latest_news(limit=50, since=since)
+    encoded = await service.get_latest_news_json(limit=50, since=since)
+
+    assert [item.id for item in page.items] == ["hn_9", "hn_8", "hn_7"]
+    assert page.meta["next_cursor"] is None
+    assert [str(item.url) for item in page.items] == [
+        str(item.url) for item in NewsResponse.model_validate_json(encoded.body).items
+    ]
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_raises(service):
+    """Test that a malformed cursor is reported to the caller."""
+    service._fetch_all_sources = AsyncMock(return_value=(_items(3), {"failed_sources": []}))
+
+    with pytest.raises(ValueError):
+        await service.get_latest_news_json(limit=5, cursor="garbage")
+
+
+@pytest.mark.asyncio
+async def test_filters_page_through_matching_items(service):
+    """Test that tag, source and text filters combine with cursors."""
+    items = _items(10)
+    for item in items[::2]:
+        item.tags.append("python")
+    service._fetch_all_sources = AsyncMock(return_value=(items, {"failed_sources": []}))
+    await service.refresh()
+
+    first = await service.get_latest_news(limit=2, tags=["Python,ai"], source="hackernews")
+    second = await service.get_latest_news(
+        limit=2, tags=["python"], cursor=first.meta["next_cursor"]
+    )
+    text = NewsResponse.model_validate_json(
+        (await service.get_latest_news_json(limit=5, q="story 7")).body
+    )
+
+    assert [item.id for item in first.items] == ["hn_8", "hn_6"]
+    assert [item.id for item in second.items] == ["hn_4", "hn_2"]
+    assert [item.id for item in text.items] == ["hn_7"]
+    assert (await service.get_latest_news(limit=5, source="rss")).items == []
+
+
+@pytest.mark.asyncio
+async def test_search_covers_items_that_left_the_pool():
+    """Test that every fetched item stays searchable, ranked by relevance."""
+    service = NewsService(
+        cache=AsyncCache(ttl_seconds=60), rss_feed_urls=[], http_client=AsyncMock()
+    )
+    first, second = _items(3), _items(6)[3:]
+    first[0].title = "Rust compiler rewrite"
+    second[0].title = "Rust web framework"
+    service._fetch_with_client = AsyncMock(
+        side_effect=[(first, {"failed_sources": []}), (second, {"failed_sources": []})]
+    )
+    await service.refresh()
+    await service.refresh()
+
+    results = await service.search("rust compiler", limit=5)
+
+    assert [item.id for item in service.snapshot.items] == ["hn_5", "hn_4", "hn_3"]
+    assert [item.id for item in results.items] == ["hn_0", "hn_3"]
+    assert results.meta["query"] == "rust compiler"
+    assert results.meta["exhaustive"] is True
+    assert results.meta["scores"][0] > results.meta["scores"][1]
+    assert service.search_stats()["documents"] == 6
+
+
+@pytest.mark.asyncio
+async def test_copies_from_several_sources_are_merged(tmp_path):
+    """Test that a story is served once, as its HN copy, even across refreshes."""
+    from src.modules.news.store import NewsStore
+
+    store = NewsStore(str(tmp_path / "store.sqlite3"))
+    service = NewsService(
+        cache=AsyncCache(ttl_seconds=60),
+        rss_feed_urls=[],
+        http_client=AsyncMock(),
+        store=store,
+    )
+    feed_copy = make_item(
+        "rss_0_1",
+        title="Rust 2.0 is officially announced",
+        url="https://www.blog.example.com/rust-2?utm_source=feed",
+        tags=["rust"],
+    )
+    other_feed_copy = feed_copy.model_copy(
+        update={"id": "rss_1_1", "url": "https://news.example.net/rust-2-officially-announced"}
+    )
+    hn_copy = make_item(
+        "hn_9",
+        title="Rust 2.0 is officially announced",
+        url="https://blog.example.com/rust-2/",
+        published_at=PUBLISHED_AT + timedelta(minutes=30),
+        score=300,
+        comments_url="https://news.ycombinator.com/item?id=9",
+        tags=["programming"],
+    )
+    service._fetch_with_client = AsyncMock(
+        side_effect=[
+            ([feed_copy, other_feed_copy], {"failed_sources": []}),
+            ([hn_copy], {"failed_sources": []}),
+        ]
+    )
+
+    await service.refresh()
+    assert [item.id for item in service.snapshot.items] == ["rss_0_1"]
+    assert service.dedup_stats() == {"url_duplicates": 0, "title_duplicates": 1}
+
+    # The HN copy arrives once the feed copy is already stored
+    await service.refresh()
+
+    assert [item.id for item in service.snapshot.items] == ["hn_9"]
+    merged = service.snapshot.items[0]
+    assert merged.score == 300
+    assert merged.tags == ["programming", "rust"]
+    assert [item.id for item in await store.latest(10)] == ["hn_9"]
+    assert [item.id for item in (await service.search("rust announced")).items] == ["hn_9"]
+    assert service.dedup_stats() == {"url_duplicates": 1, "title_duplicates": 0}
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_dedup_stats_count_the_last_refresh_only(tmp_path):
+    """Test that copies fetched again by every refresh are not counted again."""
+    from src.modules.news.store import NewsStore
+
+    store = NewsStore(str(tmp_path / "store.sqlite3"))
+    service = NewsService(
+        cache=AsyncCache(ttl_seconds=60), rss_feed_urls=[], http_client=AsyncMock(), store=store
+    )
+    hn_copy = _items(1)[0]
+    feed_copy = hn_copy.model_copy(update={"id": "rss_1", "source": "rss"})
+    reworded = hn_copy.model_copy(
+        update={"id": "rss_2", "source": "rss", "url": "https://other.example/ai"}
+    )
+    service._fetch_with_client = AsyncMock(
+        return_value=([hn_copy, feed_copy, reworded], {"failed_sources": []})
+    )
+
+    await service.refresh()
+    first = service.dedup_stats()
+    await service.refresh()
+
+    assert first == {"url_duplicates": 1, "title_duplicates": 1}
+    assert service.dedup_stats() == first
+    assert [item.id for item in service.snapshot.items] == ["hn_0"]
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_rss_items_keep_their_id_when_the_feed_shifts():
+    """Test that an RSS entry is indexed once even after new entries push it down."""
+    service = NewsService(
+        cache=AsyncCache(ttl_seconds=60), rss_feed_urls=[], http_client=AsyncMock()
+    )
+    entry = {
+        "title": "Kafka streams deep dive",
+        "url": "https://example.com/a",
+        "published_at": datetime(2024, 1, 1, 12, 0, 0),
+    }
+    newer = {**entry, "title": "Other story", "url": "https://example.com/b"}
+    first = [service._normalize_rss_item(entry, 0)]
+    second = [service._normalize_rss_item(item, i) for i, item in enumerate([newer, entry])]
+    service._fetch_with_client = AsyncMock(
+        side_effect=[(first, {"failed_sources": []}), (second, {"failed_sources": []})]
+    )
+
+    await service.refresh()
+    await service.refresh()
+
+    results = await service.search("kafka streams")
+    assert first[0].id == second[1].id
+    assert [str(item.url) for item in results.items] == ["https://example.com/a"]
+    assert service.search_stats()["documents"] == 2
@@ -0,0 +1,154 @@
+"""Tests for the durable news item store."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.modules.news.models import NewsItem
+from src.modules.news.pagination import PageQuery, item_key
+from src.modules.news.store import NewsStore
+from tests.factories import PUBLISHED_AT, make_item
+
+
+def _at(minutes: int) -> datetime:
+    """Publication time some minutes after the default one."""
+    return PUBLISHED_AT + timedelta(minutes=minutes)
+
+
+def _tagged_ids(store: NewsStore) -> list[str]:
+    """Get the IDs of the items having rows in the tag table."""
+    rows = store._conn.execute("SELECT DISTINCT item_id FROM news_item_tags ORDER BY item_id")
+    return [item_id for (item_id,) in rows]
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store in a temporary file."""
+    store = NewsStore(str(tmp_path / "store.sqlite3"), max_items=None)
+    yield store
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_latest_returns_newest_first(store):
+    """Test that items are read back newest first and round-trip unchanged."""
+    items = [make_item(f"rss_{i}", published_at=_at(i), tags=["ai"]) for i in range(5)]
+    await store.upsert(items)
+
+    latest = await store.latest(3)
+
+    assert latest == items[::-1][:3]
+
+
+@pytest.mark.asyncio
+async def test_upsert_updates_items_and_tags(store):
+    """Test that storing an ID again replaces its row and its tags."""
+    await store.upsert([make_item("hn_1", tags=["ai"])])
+    await store.upsert([make_item("hn_1", tags=["python"])])
+
+    assert await store.page(PageQuery(limit=10, tags=("ai",))) == []
+    assert [item.tags for item in await store.page(PageQuery(limit=10, tags=("python",)))] == [
+        ["python"]
+    ]
+    assert (await store.stats())["items"] == 1
+
+
+@pytest.mark.asyncio
+async def test_same_url_under_new_id_replaces_previous_row(store):
+    """Test that an RSS item re-keyed after a restart is not stored twice."""
+    await store.upsert([make_item("rss_0_111_a", url="https://example.com/a", tags=["ai"])])
+    await store.upsert([make_item("rss_0_222_a", url="https://example.com/a", tags=["ai"])])
+
+    assert [item.id for item in await store.latest(10)] == ["rss_0_222_a"]
+    assert _tagged_ids(store) == ["rss_0_222_a"]
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_items_and_tags(store):
+    """Test that deleted items are gone from every query."""
+    await store.upsert(
+        [make_item("rss_1", tags=["ai"]), make_item("hn_2", published_at=_at(1), tags=["ai"])]
+    )
+
+    await store.delete(["rss_1", "unknown"])
+
+    assert [item.id for item in await store.latest(10)] == ["hn_2"]
+    assert [item.id for item in await store.page(PageQuery(limit=10, tags=("ai",)))] == ["hn_2"]
+
+
+@pytest.mark.asyncio
+async def test_filters_by_source_and_tag(store):
+    """Test source and tag queries, alone and combined."""
+    await store.upsert(
+        [
+            make_item("hn_1", published_at=_at(1), tags=["ai", "python"]),
+            make_item("hn_2", published_at=_at(2), tags=["python"]),
+            make_item("rss_3", published_at=_at(3), tags=["ai"]),
+        ]
+    )
+
+    assert [item.id for item in await store.page(PageQuery(limit=10, source="hackernews"))] == [
+        "hn_2",
+        "hn_1",
+    ]
+    assert [item.id for item in await store.page(PageQuery(limit=10, tags=("ai",)))] == [
+        "rss_3",
+        "hn_1",
+    ]
+    assert [
+        item.id for item in await store.page(PageQuery(limit=10, tags=("python",), source="rss"))
+    ] == []
+
+
+@pytest.mark.asyncio
+async def test_filtered_pages_use_keyset_bounds(store):
+    """Test that tag, source and title word filters page with cursors."""
+    await store.upsert(
+        [
+            make_item(
+                f"hn_{i}",
+                published_at=_at(i),
+                source="hackernews" if i % 2 else "rss",
+                tags=["ai", "python"][: i % 3],
+            )
+            for i in range(12)
+        ]
+    )
+
+    def ids(items: list[NewsItem]) -> list[str]:
+        return [item.id for item in items]
+
+    first = await store.page(PageQuery(limit=2, tags=("ai",), source="hackernews"))
+    assert ids(first) == ["hn_11", "hn_7"]
+    rest = await store.page(
+        PageQuery(limit=5, after=item_key(first[-1]), tags=("ai",), source="hackernews")
+    )
+    assert ids(rest) == ["hn_5", "hn_1"]
+    assert ids(await store.page(PageQuery(limit=5, source="rss", tags=("python", "ai")))) == [
+        "hn_8",
+        "hn_2",
+    ]
+    assert ids(await store.page(PageQuery(limit=5, terms=("story", "hn", "4")))) == ["hn_4"]
+    assert ids(
+        await store.page(PageQuery(limit=5, source="rss", until=first[-1].published_at.timestamp()))
+    ) == [
+        "hn_6",
+        "hn_4",
+        "hn_2",
+        "hn_0",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_oldest_items_are_pruned(tmp_path):
+    """Test that only the newest max_items items are kept."""
+    store = NewsStore(str(tmp_path / "store.sqlite3"), max_items=2)
+    await store.upsert([make_item(f"rss_{i}", published_at=_at(i), tags=["ai"]) for i in range(4)])
+
+    assert [item.id for item in await store.latest(10)] == ["rss_3", "rss_2"]
+    assert [item.id for item in await store.page(PageQuery(limit=10, tags=("ai",)))] == [
+        "rss_3",
+        "rss_2",
+    ]
+    assert _tagged_ids(store) == ["rss_2", "rss_3"]
+    store.close()
@@ -69,3 +69,34 @@ def test_extract_tags_no_duplicates():
     url = "https://example.com/python"
     tags = extract_tags(title, url)
     assert tags.count("python") == 1
+
+
+def test_extract_tags_matches_per_keyword_search():
+    """Test that the single-pass matcher agrees with one search per phrase."""
+    import re
+
+    from src.utils.taxonomy import get_taxonomy
+
+    taxonomy = get_taxonomy()
+
+    def reference(title: str, url: str) -> list[str]:
+        text = f"{title} {url}".lower()
+        found = {
+            tag
+            for phrase, tag in taxonomy.phrase_tags.items()
+            if re.search(r"\b" + re.escape(phrase) + r"\b", text)
+        }
+        return [tag for tag in taxonomy.tags if tag in found]
+
+    samples = [
+        ("Building an AI agent with LangChain", "https://example.com/ai-agent"),
+        ("Multi-agent systems and autonomous agents", "https://example.com/agents"),
+        ("Scikit-learn vs PyTorch for fine-tuning", "https://example.com/ml"),
+        ("Neural networks explained", "https://example.com/neural-network"),
+        ("Google Cloud and Amazon Web Services pricing", "https://example.com/cloud"),
+        ("Generative AI in a Jupyter notebook", "https://example.com/index.html"),
+        ("Transformer models and RAG", "https://example.com/transformer-model"),
+        ("Mail, trail and email", "https://example.com/gaia"),
+    ]
+    for title, url in samples:
+        assert extract_tags(title, url) == reference(title, url)
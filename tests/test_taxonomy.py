@@ -0,0 +1,110 @@
+"""Tests for the topic taxonomy."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from src.utils.filtering import classify_news
+from src.utils.tagging import extract_tags
+from src.utils.taxonomy import (
+    CompiledTaxonomy,
+    Taxonomy,
+    TaxonomyReloader,
+    get_taxonomy,
+    set_taxonomy,
+)
+
+TAXONOMY = {
+    "relevance_threshold": 1.0,
+    "topics": [
+        {
+            "name": "infra",
+            "weight": 1.0,
+            "tags": ["kubernetes", "docker"],
+            "synonyms": {"kubernetes": ["k8s"]},
+        },
+        {"name": "languages", "weight": 0.5, "tags": ["rust"]},
+        {"name": "tooling", "weight": 0.5, "tags": ["cargo"]},
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def restore_taxonomy():
+    """Restore the active taxonomy after each test."""
+    active = get_taxonomy()
+    yield
+    set_taxonomy(active)
+
+
+def _write(path, data) -> None:
+    """Write a taxonomy file and bump its mtime."""
+    path.write_text(json.dumps(data))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_synonyms_map_to_canonical_tag():
+    """Test that a synonym is reported as its canonical tag."""
+    compiled = CompiledTaxonomy(Taxonomy.from_dict(TAXONOMY))
+
+    assert compiled.find_tags("running k8s and docker") == ["kubernetes", "docker"]
+
+
+def test_topic_weights_add_up_to_threshold():
+    """Test that relevance sums the weights of distinct topics."""
+    compiled = CompiledTaxonomy(Taxonomy.from_dict(TAXONOMY))
+
+    assert compiled.is_relevant(["docker"])
+    assert not compiled.is_relevant(["rust"])
+    assert compiled.is_relevant(["rust", "cargo"])
+
+
+def test_invalid_taxonomy_is_rejected():
+    """Test that synonyms of unknown tags are rejected."""
+    with pytest.raises(ValueError):
+        Taxonomy.from_dict({"topics": [{"name": "x", "tags": ["a"], "synonyms": {"b": ["c"]}}]})
+
+
+@pytest.mark.asyncio
+async def test_reload_swaps_active_taxonomy(tmp_path):
+    """Test that a reload changes what extract_tags and classify_news see."""
+    path = tmp_path / "taxonomy.json"
+    _write(path, TAXONOMY)
+
+    await TaxonomyReloader(path).reload()
+
+    assert extract_tags("Scaling k8s", "https://example.com") == ["kubernetes"]
+    assert classify_news("Rust and Cargo", "https://example.com").relevant
+
+
+@pytest.mark.asyncio
+async def test_invalid_file_keeps_previous_taxonomy(tmp_path):
+    """Test that a broken file does not replace the active taxonomy."""
+    path = tmp_path / "taxonomy.json"
+    path.write_text("{not json")
+    active = get_taxonomy()
+
+    with pytest.raises(ValueError):
+        await TaxonomyReloader(path).reload()
+
+    assert get_taxonomy() is active
+
+
+@pytest.mark.asyncio
+async def test_watcher_reloads_changed_file(tmp_path):
+    """Test that the watcher picks up changes to the file."""
+    path = tmp_path / "taxonomy.json"
+    _write(path, TAXONOMY)
+    reloader = TaxonomyReloader(path)
+    await reloader.reload()
+    reloader.start_watching(interval_seconds=0.05)
+
+    updated = {**TAXONOMY, "topics": [{"name": "db", "tags": ["postgres"]}]}
+    _write(path, updated)
+    await asyncio.sleep(0.3)
+    await reloader.stop()
+
+    assert get_taxonomy().tags == ("postgres",)